@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Baccarat P/B Pattern Analiz Uygulaması - Toplu analiz
+Shoe dosyalarını, dizinleri ya da derlem dosyalarını (.pbc) backtest eder ve
+model başına isabet özetini CSV ya da JSON olarak yazar
+
+Arayüzü (PyQt) içe aktarmaz; yalnızca analiz motoru yüklenir.
+
+Örnekler:
+    python -m batch shoes/ --jobs 8
+    python -m batch shoes.pbc --models "Karma Analiz" "Hibrit Analiz" --format csv
+    python -m batch a.txt b.txt --format json -o summary.json
+"""
+
+import os
+import sys
+import csv
+import json
+import time
+import argparse
+from core.engine import LEAF_MODEL_NAMES, COMBINED_MODEL, HYBRID_MODEL
+from core.corpus import is_corpus_file
+from core.runner import BacktestRunner, empty_counters, merge_counters, find_shoe_files
+
+# Seçilebilir modeller (WLPatternAnalyzer.analysis_models anahtarları)
+MODEL_NAMES = LEAF_MODEL_NAMES + [COMBINED_MODEL, HYBRID_MODEL]
+
+
+def resolve_models(names):
+    """
+    Model adlarını analysis_models anahtarlarına çevirir (büyük/küçük harf fark etmez)
+
+    Args:
+        names (list): İstenen model adları; boşsa tüm modeller
+
+    Returns:
+        list: Model anahtarları
+
+    Raises:
+        ValueError: Bilinmeyen bir model adı varsa
+    """
+    if not names:
+        return list(MODEL_NAMES)
+
+    keys = {name.casefold(): name for name in MODEL_NAMES}
+    models = []
+    for name in names:
+        key = keys.get(name.casefold())
+        if key is None:
+            raise ValueError(f"Bilinmeyen model: {name} (geçerli adlar: {', '.join(MODEL_NAMES)})")
+        models.append(key)
+    return models
+
+
+def run_inputs(inputs, jobs=None, shard_size=32, pattern="*.txt"):
+    """
+    Girdileri backtest eder
+
+    Dizinlerdeki shoe dosyaları ve tek tek verilen shoe dosyaları birlikte
+    dağıtılır; derlem dosyaları ayrı ayrı çalıştırılır.
+
+    Args:
+        inputs (list): Shoe dosyaları, dizinler ya da derlem dosyaları
+        jobs (int, optional): İşçi süreç sayısı (varsayılan: CPU sayısı)
+        shard_size (int): İşçiye bir seferde verilen shoe sayısı
+        pattern (str): Dizinlerdeki shoe dosyası deseni
+
+    Returns:
+        dict: Toplam sonuç sayaçları (bkz. core.runner.empty_counters)
+
+    Raises:
+        ValueError: Girdilerin hiçbirinde el bulunamadıysa
+    """
+    runner = BacktestRunner(jobs, shard_size)
+    total = empty_counters()
+
+    paths = []
+    for path in inputs:
+        if os.path.isdir(path):
+            paths.extend(find_shoe_files(path, pattern))
+        elif is_corpus_file(path):
+            total = merge_counters(total, runner.run_corpus(path))
+        else:
+            paths.append(path)
+
+    if paths:
+        total = merge_counters(total, runner.run(paths))
+
+    for path in total["empty"]:
+        print(f"Uyarı: {path} dosyasında P/B ya da W/L sonucu bulunamadı", file=sys.stderr)
+    if total["hands"] == 0:
+        raise ValueError("girdilerde hiç el bulunamadı")
+    return total
+
+
+def summary_rows(counters, models):
+    """
+    Model başına isabet satırları
+
+    Returns:
+        list: {"model", "correct", "total", "accuracy"} sözlükleri (models sırasıyla)
+    """
+    rows = []
+    for name in models:
+        counter = counters["models"].get(name, {"correct": 0, "total": 0})
+        accuracy = counter["correct"] / counter["total"] if counter["total"] > 0 else 0.0
+        rows.append({"model": name, "correct": counter["correct"], "total": counter["total"],
+                     "accuracy": round(accuracy, 6)})
+    return rows
+
+
+def write_summary(output, counters, models, output_format, seconds):
+    """Özeti CSV ya da JSON olarak yazar"""
+    rows = summary_rows(counters, models)
+    if output_format == "csv":
+        writer = csv.DictWriter(output, fieldnames=["model", "correct", "total", "accuracy"],
+                                lineterminator="\n")
+        writer.writeheader()
+        writer.writerows(rows)
+        return
+
+    json.dump({"shoes": counters["shoes"], "hands": counters["hands"], "seconds": round(seconds, 3),
+               "models": rows}, output, ensure_ascii=False, indent=2)
+    output.write("\n")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Shoe dosyalarını ya da derlemleri backtest eder")
+    parser.add_argument("inputs", nargs="*", help="Shoe dosyaları, dizinler ya da derlem dosyaları (.pbc)")
+    parser.add_argument("-m", "--models", nargs="+", default=None,
+                        help="Raporlanacak modeller (arayüzdeki adlarla; varsayılan: tümü)")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="İşçi süreç sayısı (varsayılan: CPU sayısı)")
+    parser.add_argument("--shard-size", type=int, default=32,
+                        help="İşçiye bir seferde verilen shoe sayısı")
+    parser.add_argument("--pattern", default="*.txt", help="Dizinlerdeki shoe dosyası deseni")
+    parser.add_argument("-f", "--format", choices=["json", "csv"], default="json", help="Çıktı biçimi")
+    parser.add_argument("-o", "--output", default="-", help="Çıktı dosyası (varsayılan: stdout)")
+    parser.add_argument("--list-models", action="store_true", help="Model adlarını listele ve çık")
+    args = parser.parse_args(argv)
+
+    if args.list_models:
+        print("\n".join(MODEL_NAMES))
+        return 0
+    if not args.inputs:
+        parser.error("en az bir girdi gerekli")
+
+    try:
+        models = resolve_models(args.models)
+    except ValueError as error:
+        parser.error(str(error))
+
+    started = time.perf_counter()
+    try:
+        counters = run_inputs(args.inputs, args.jobs, args.shard_size, args.pattern)
+    except ValueError as error:
+        print(f"Hata: {error}", file=sys.stderr)
+        return 1
+    seconds = time.perf_counter() - started
+
+    if args.output == "-":
+        write_summary(sys.stdout, counters, models, args.format, seconds)
+    else:
+        with open(args.output, "w", encoding="utf-8", newline="") as output:
+            write_summary(output, counters, models, args.format, seconds)
+
+    print(f"{counters['shoes']} shoe, {counters['hands']} el, {seconds:.2f} sn", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,393 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+P ve B Pattern Analiz Uygulaması
+Arayüzsüz geriye dönük test (backtest) motoru
+"""
+
+import copy
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from core.engine import (AnalysisEngine, COMBINED_MODEL, HYBRID_MODEL,
+                         LEAF_MODEL_NAMES, record_prediction)
+from core.features import BatchFeatures
+
+BOARD_CELLS = 25
+ROW_LENGTH = 5
+
+# Analizin başlaması için gereken minimum girdi (WLPatternAnalyzer._perform_analysis)
+MIN_HISTORY = 5
+
+# Çok ölçekli modun varsayılan tahta boyutları: arayüzdeki 5x5, 6x6 ve 6 satırlık
+# Big Road boyutu
+BIG_ROAD_SHAPE = (6, 50)
+DEFAULT_SCALES = ((5, 5), (6, 6), BIG_ROAD_SHAPE)
+
+
+def window_cell_counts(hand_count, shape=(5, 5)):
+    """
+    Her eldan sonra matristeki dolu hücre sayısını döndürür
+
+    WLPatternAnalyzer._add_selection hücreleri satır satır doldurur; matris doluysa
+    önce _shift_matrix_up ile ilk satır silinir (5x5'te 25 -> 20 hücre).
+
+    Args:
+        hand_count (int): El sayısı
+        shape (tuple): Tahta boyutu (satır, sütun)
+
+    Returns:
+        numpy.ndarray: (N,) dolu hücre sayıları
+    """
+    board_cells = shape[0] * shape[1]
+    row_length = shape[1]
+    hands = np.arange(1, hand_count + 1)
+    shifted = board_cells - row_length + 1 + (hands - board_cells - 1) % row_length
+    return np.where(hands <= board_cells, hands, shifted)
+
+
+def window_boards(outcomes, start=0, stop=None, shape=(5, 5)):
+    """
+    Sonuç dizisindeki her eldan sonraki matrisleri ve son hamleleri üretir
+
+    Matris her zaman son k sonucu satır satır sıralı olarak içerir; bu nedenle
+    tahtalar kaydırmalı pencere görünümünden tek seferde çıkarılabilir.
+
+    Args:
+        outcomes (numpy.ndarray): (N,) sonuçlar, 1=P, 2=B
+        start (int): İlk el indeksi (0 tabanlı)
+        stop (int, optional): Son el indeksi (hariç)
+        shape (tuple): Tahta boyutu (satır, sütun)
+
+    Returns:
+        tuple: (tahtalar (M, R, C) int8, son hamleler (M, 2), dolu hücre sayıları (M,))
+    """
+    outcomes = np.asarray(outcomes, dtype=np.int8)
+    if stop is None:
+        stop = len(outcomes)
+    board_cells = shape[0] * shape[1]
+
+    counts = window_cell_counts(stop, shape)[start:stop]
+
+    # Her elin son R*C sonucu (başta eksik olanlar 0 ile doldurulur)
+    padded = np.concatenate([np.zeros(board_cells - 1, dtype=np.int8), outcomes[:stop]])
+    windows = sliding_window_view(padded, board_cells)[start:stop]
+
+    # Son k sonucu matrisin başına hizala, kalan hücreleri boşalt
+    cells = np.arange(board_cells)
+    index = np.minimum((board_cells - counts)[:, None] + cells, board_cells - 1)
+    flat = np.take_along_axis(windows, index, axis=1)
+    flat = np.where(cells < counts[:, None], flat, 0).astype(np.int8)
+
+    last_moves = np.stack(np.divmod(counts - 1, shape[1]), axis=1)
+    return flat.reshape((-1,) + tuple(shape)), last_moves, counts
+
+
+def recorded_hands(hand_count, shape=(5, 5)):
+    """
+    WLPatternAnalyzer'ın model_stats'ı güncellediği elleri işaretler
+
+    İstatistikler yalnızca önceki tahmin için bir gerçek sonuç bulunan ellerde
+    güncellenir (_perform_analysis). İlk kaydırmadan sonra actual_results artık
+    büyümediğinden bu yalnızca tahtanın dolu olduğu ellerde olur.
+
+    Args:
+        hand_count (int): El sayısı
+        shape (tuple): Tahta boyutu (satır, sütun)
+
+    Returns:
+        numpy.ndarray: (N,) bool
+    """
+    board_cells = shape[0] * shape[1]
+    row_length = shape[1]
+    recorded = np.zeros(hand_count, dtype=bool)
+
+    history_length = 0
+    actual_count = 0
+    for i, count in enumerate(window_cell_counts(hand_count, shape).tolist()):
+        if history_length == board_cells:
+            history_length -= row_length
+        if history_length and history_length > actual_count:
+            actual_count += 1
+        history_length = count
+        recorded[i] = history_length >= MIN_HISTORY and 0 < actual_count < history_length
+    return recorded
+
+
+class Backtester:
+    """
+    Uzun P/B dizilerini arayüz olmadan yeniden oynatan test motoru
+
+    Matrisin doldurulması/kaydırılması ve model_stats güncellemeleri
+    WLPatternAnalyzer ile birebir aynıdır. Yaprak modeller yığın halinde
+    (analyze_batch) çalıştırılır; yalnızca istatistiklere bağlı Hibrit tahmini
+    el el hesaplanır.
+
+    Tahta boyutu motordan (AnalysisEngine.shape) alınır. chunk_size 5x5 tahtalar
+    için bir yığındaki el sayısıdır; büyük tahtalarda bellek kullanımı aynı
+    kalsın diye hücre sayısıyla orantılı olarak küçültülür.
+    """
+
+    def __init__(self, engine=None, chunk_size=65536, shape=None):
+        if engine is None:
+            engine = AnalysisEngine(shape) if shape is not None else AnalysisEngine()
+        self.engine = engine
+        self.shape = tuple(engine.shape)
+        self.board_cells = self.shape[0] * self.shape[1]
+        self.chunk_size = max(1, chunk_size * BOARD_CELLS // self.board_cells)
+        self.model_names = LEAF_MODEL_NAMES + [COMBINED_MODEL, HYBRID_MODEL]
+
+    def run(self, outcomes):
+        """
+        Sonuç dizisini baştan sona oynatır
+
+        Args:
+            outcomes (sequence): Sonuçlar, 1=P, 2=B
+
+        Returns:
+            dict: 'hands', 'predictions' (model adı -> (N,) int8, her eldan sonra
+                  yapılan tahmin), 'summary' (model adı -> correct, total, accuracy,
+                  coverage) ve 'model_stats' (arayüzdeki istatistiklerin son hali)
+        """
+        outcomes = np.asarray(outcomes, dtype=np.int8)
+        session = self._start(len(outcomes))
+        self._advance(session, outcomes, 0, len(outcomes))
+        return self._finish(session, outcomes)
+
+    def replay_stats(self, outcomes):
+        """
+        Sonuç dizisini oynatıp yalnızca son model istatistiklerini üretir
+
+        run ile aynı model_stats'ı verir; modeller yalnızca istatistikleri
+        güncelleyen ellerde (recorded_hands) çalıştırılır. Uzun oturumlarda bu,
+        ellerin yaklaşık beşte biridir.
+
+        Args:
+            outcomes (sequence): Sonuçlar, 1=P, 2=B
+
+        Returns:
+            dict: model_stats (arayüzdeki istatistiklerin son hali)
+        """
+        outcomes = np.asarray(outcomes, dtype=np.int8)
+        session = self._start(len(outcomes))
+        recorded = recorded_hands(len(outcomes), self.shape)
+
+        for start in range(0, len(outcomes), self.chunk_size):
+            stop = min(start + self.chunk_size, len(outcomes))
+            chunk = self._predict_chunk(outcomes, start, stop, recorded[start:stop])
+            session['replay'].run(outcomes, start, chunk, session['predictions'], stats_only=True)
+
+        return copy.deepcopy(self.engine.model_stats)
+
+    def _start(self, hand_count):
+        """İstatistikleri sıfırlar ve boş tahmin dizileriyle bir oynatma oturumu açar"""
+        self.engine.reset_stats()
+        return {
+            'predictions': {name: np.zeros(hand_count, dtype=np.int8) for name in self.model_names},
+            'replay': _WindowReplay(self.engine, self.board_cells, self.shape[1])
+        }
+
+    def _advance(self, session, outcomes, start, stop):
+        """[start, stop) aralığındaki elleri chunk_size'lık yığınlar halinde oynatır"""
+        for chunk_start in range(start, stop, self.chunk_size):
+            chunk_stop = min(chunk_start + self.chunk_size, stop)
+            chunk = self._predict_chunk(outcomes, chunk_start, chunk_stop)
+            session['replay'].run(outcomes, chunk_start, chunk, session['predictions'])
+
+    def _finish(self, session, outcomes):
+        """Oturumun sonuç sözlüğünü oluşturur (bkz. run)"""
+        predictions = session['predictions']
+        return {
+            'hands': len(outcomes),
+            'predictions': predictions,
+            'summary': self.summarize(outcomes, predictions),
+            'model_stats': copy.deepcopy(self.engine.model_stats)
+        }
+
+    def _predict_chunk(self, outcomes, start, stop, selected=None):
+        """
+        Bir el aralığı için tahtaları üretir ve yaprak/Karma tahminlerini yığın halinde hesaplar
+
+        selected verilirse modeller yalnızca işaretli ellerde çalışır; diğer
+        ellerin tahminleri 0 (belirsiz) kalır.
+        """
+        boards, last_moves, counts = window_boards(outcomes, start, stop, self.shape)
+        models = self.engine.models
+
+        leaf_predictions = np.zeros((len(counts), len(LEAF_MODEL_NAMES)), dtype=np.int8)
+        combined = np.zeros(len(counts), dtype=np.int8)
+        basic = np.zeros(len(counts), dtype=np.int8)
+
+        rows = np.arange(len(counts)) if selected is None else np.flatnonzero(selected)
+        if len(rows):
+            boards, last_moves = boards[rows], last_moves[rows]
+            features = BatchFeatures(boards, last_moves)
+            leaf_predictions[rows] = np.stack(
+                [models[name].analyze_batch(boards, last_moves, features) for name in LEAF_MODEL_NAMES],
+                axis=1)
+            combined[rows] = models[COMBINED_MODEL].analyze_batch(
+                boards, last_moves, features, predictions=leaf_predictions[rows])
+            basic[rows] = features.basic_prediction()[0]
+
+        return {
+            'counts': counts,
+            'leaf': leaf_predictions,
+            'combined': combined,
+            'basic': basic
+        }
+
+    def summarize(self, outcomes, predictions):
+        """
+        Her eldan sonraki tahmini bir sonraki elin sonucuyla karşılaştırır
+
+        Returns:
+            dict: Model adı -> {"correct", "total", "accuracy", "coverage"}
+        """
+        outcomes = np.asarray(outcomes, dtype=np.int8)
+        following = outcomes[1:]
+        scored = len(following)
+
+        summary = {}
+        for name, model_predictions in predictions.items():
+            made = model_predictions[:-1] != 0
+            total = int(np.count_nonzero(made))
+            correct = int(np.count_nonzero(made & (model_predictions[:-1] == following)))
+            summary[name] = {
+                "correct": correct,
+                "total": total,
+                "accuracy": correct / total if total > 0 else 0.0,
+                "coverage": total / scored if scored > 0 else 0.0
+            }
+        return summary
+
+
+class _WindowReplay:
+    """
+    WLPatternAnalyzer'daki history/actual_results sayaçlarını ve model_stats
+    güncellemelerini el el yürütür (tahtaların kendisine ihtiyaç duymaz)
+    """
+
+    def __init__(self, engine, board_cells=BOARD_CELLS, row_length=ROW_LENGTH):
+        self.engine = engine
+        self.board_cells = board_cells
+        self.row_length = row_length
+        self.hybrid = engine.models[HYBRID_MODEL]
+        self.history_length = 0
+        self.actual_count = 0
+        self.last_actual = 0
+        self.top_models = None
+
+    def run(self, outcomes, start, chunk, predictions, stats_only=False):
+        """
+        Bir el aralığındaki istatistik güncellemelerini ve Hibrit tahminlerini işler
+
+        stats_only ise Hibrit tahmini yalnızca istatistiklerin güncellendiği
+        ellerde hesaplanır (diğer ellerin tahminleri 0 kalır).
+        """
+        model_stats = self.engine.model_stats
+        leaf_stats = [model_stats[name] for name in LEAF_MODEL_NAMES]
+        combined_stats = model_stats[COMBINED_MODEL]
+        hybrid_stats = model_stats[HYBRID_MODEL]
+        name_index = {name: i for i, name in enumerate(LEAF_MODEL_NAMES)}
+
+        counts = chunk['counts'].tolist()
+        leaf_rows = chunk['leaf'].tolist()
+        combined = chunk['combined'].tolist()
+        basic = chunk['basic'].tolist()
+        values = outcomes[start:start + len(counts)].tolist()
+        hybrid_predictions = predictions[HYBRID_MODEL]
+
+        for i, value in enumerate(values):
+            # _add_selection: matris doluysa ilk satır silinir
+            if self.history_length == self.board_cells:
+                self.history_length -= self.row_length
+
+            # _add_at_position: önceki tahmin için gerçek sonucu kaydet
+            if self.history_length and self.history_length > self.actual_count:
+                self.actual_count += 1
+                self.last_actual = value
+            self.history_length = counts[i]
+
+            # _perform_analysis
+            if self.history_length < MIN_HISTORY:
+                continue
+
+            actual = None
+            if self.actual_count > 0 and self.history_length > self.actual_count:
+                actual = self.last_actual
+            elif stats_only:
+                continue
+
+            leaf_row = leaf_rows[i]
+            if actual is not None:
+                for model_stat, prediction in zip(leaf_stats, leaf_row):
+                    record_prediction(model_stat, prediction, actual)
+                record_prediction(combined_stats, combined[i], actual)
+                self.top_models = None  # İstatistikler değişti, en iyi 3 model yeniden seçilir
+
+            if self.top_models is None:
+                self.top_models = [(name_index[model["name"]], model)
+                                   for model in self.hybrid.select_top_models(model_stats)]
+
+            prediction = self._hybrid_prediction(leaf_row, basic[i])
+            hybrid_predictions[start + i] = prediction
+
+            if actual is not None:
+                record_prediction(hybrid_stats, prediction, actual)
+
+        for name, column in zip(LEAF_MODEL_NAMES, chunk['leaf'].T):
+            predictions[name][start:start + len(values)] = column
+        predictions[COMBINED_MODEL][start:start + len(values)] = chunk['combined']
+
+    def _hybrid_prediction(self, leaf_row, default_prediction):
+        """HibritAnalysis.analyze ile aynı kararı hazır yaprak tahminlerinden üretir"""
+        if not self.top_models:
+            return default_prediction
+
+        model_predictions = [
+            {"name": model["name"], "prediction": leaf_row[index],
+             "success_rate": model["success_rate"]}
+            for index, model in self.top_models if leaf_row[index] != 0
+        ]
+        if not model_predictions:
+            return default_prediction
+
+        return self.hybrid.weighted_vote(model_predictions, default_prediction)['prediction']
+
+
+class MultiScaleBacktester:
+    """
+    Aynı sonuç dizisini birden çok tahta boyutunda tek geçişte oynatan test motoru
+
+    Sonuç dizisi bir kez yürünür; her el aralığı sırayla her boyutun Backtester'ına
+    verilir. Her boyut kendi motoru ve istatistikleriyle çalışır; yaprak modeller
+    yığın halinde çalıştığından el el yürüyen kısım tahta boyutundan bağımsızdır.
+    """
+
+    def __init__(self, scales=DEFAULT_SCALES, chunk_size=65536):
+        self.backtesters = {tuple(shape): Backtester(chunk_size=chunk_size, shape=shape)
+                            for shape in scales}
+        self.chunk_size = chunk_size
+
+    def run(self, outcomes):
+        """
+        Sonuç dizisini tüm boyutlarda baştan sona oynatır
+
+        Args:
+            outcomes (sequence): Sonuçlar, 1=P, 2=B
+
+        Returns:
+            dict: (satır, sütun) -> Backtester.run sonucu
+        """
+        outcomes = np.asarray(outcomes, dtype=np.int8)
+        hand_count = len(outcomes)
+        sessions = {shape: backtester._start(hand_count)
+                    for shape, backtester in self.backtesters.items()}
+
+        for start in range(0, hand_count, self.chunk_size):
+            stop = min(start + self.chunk_size, hand_count)
+            for shape, backtester in self.backtesters.items():
+                backtester._advance(sessions[shape], outcomes, start, stop)
+
+        return {shape: backtester._finish(sessions[shape], outcomes)
+                for shape, backtester in self.backtesters.items()}
\ No newline at end of file
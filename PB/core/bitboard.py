@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+P ve B Pattern Analiz Uygulaması
+Bitboard tahta gösterimi (P ve B için iki adet 25 bitlik tamsayı)
+"""
+
+import functools
+import numpy as np
+from core.traversal import build_diagonal_lines
+
+BOARD_SIZE = 5
+BOARD_CELLS = BOARD_SIZE * BOARD_SIZE
+
+# Bit i, düzleştirilmiş i. hücreye (satır * sütun sayısı + sütun) karşılık gelir.
+# Her boyuttaki tahtanın tüm hücrelerini kapsayan maske (x & -1 == x)
+ALL_BITS = -1
+
+
+if hasattr(int, "bit_count"):
+    def popcount(bits):
+        """Tamsayıdaki 1 bitlerinin sayısı"""
+        return bits.bit_count()
+else:  # Python < 3.10
+    def popcount(bits):
+        """Tamsayıdaki 1 bitlerinin sayısı"""
+        return bin(bits).count("1")
+
+
+def cell_bit(row, col, cols=BOARD_SIZE):
+    """Tek bir hücrenin biti"""
+    return 1 << (row * cols + col)
+
+
+def cells_mask(cells, cols=BOARD_SIZE):
+    """(satır, sütun) listesindeki hücrelerin maskesi"""
+    bits = 0
+    for row, col in cells:
+        bits |= cell_bit(row, col, cols)
+    return bits
+
+
+def region_mask(top, left, bottom, right, cols=BOARD_SIZE):
+    """[top:bottom, left:right] dikdörtgen bölgesinin maskesi"""
+    return cells_mask(((row, col) for row in range(top, bottom) for col in range(left, right)), cols)
+
+
+def index_mask(cells):
+    """Düzleştirilmiş hücre indekslerinin maskesi"""
+    bits = 0
+    for cell in cells:
+        bits |= 1 << int(cell)
+    return bits
+
+
+def quadrant_splits(rows, cols):
+    """
+    Üst/sol yarıların bitişi ve alt/sağ yarıların başlangıcı
+
+    Tek boyutlarda orta satır/sütun iki yarıya da dahildir (5x5'te 0-3 ve 2-5).
+
+    Returns:
+        tuple: (top_end, bottom_start, left_end, right_start)
+    """
+    return (rows + 1) // 2, rows // 2, (cols + 1) // 2, cols // 2
+
+
+def quadrant_regions(rows=BOARD_SIZE, cols=BOARD_SIZE):
+    """Q1: Sol üst, Q2: Sağ üst, Q3: Sol alt, Q4: Sağ alt; her biri (top, left, bottom, right)"""
+    top_end, bottom_start, left_end, right_start = quadrant_splits(rows, cols)
+    return [
+        (0, 0, top_end, left_end),
+        (0, right_start, top_end, cols),
+        (bottom_start, 0, rows, left_end),
+        (bottom_start, right_start, rows, cols),
+    ]
+
+
+def _neighbor_masks(rows, cols, include_center=False):
+    """Her hücrenin 8 komşuluğunun (isteğe bağlı olarak kendisiyle) maskeleri, satır satır"""
+    masks = []
+    for row in range(rows):
+        for col in range(cols):
+            bits = region_mask(max(0, row - 1), max(0, col - 1),
+                               min(rows, row + 2), min(cols, col + 2), cols)
+            if not include_center:
+                bits &= ~cell_bit(row, col, cols)
+            masks.append(bits)
+    return masks
+
+
+@functools.lru_cache(maxsize=None)
+def shape_masks(rows=BOARD_SIZE, cols=BOARD_SIZE):
+    """
+    Tahta boyutuna özgü bölge maskeleri (her boyut için bir kez oluşturulur)
+
+    Bölge sayımları Bitboard.count(maske) ile popcount(tahta & maske) olarak yapılır.
+
+    Returns:
+        dict: 'rows' ve 'cols' (satır/sütun başına), 'main_diagonal' ve 'anti_diagonal',
+              'diagonals' (>= 3 hücreli tüm köşegenler, build_diagonal_lines sırasıyla),
+              'quadrants' (Q1-Q4, bkz. quadrant_regions), 'border', 'inner', 'corner',
+              'edge' (köşe dışı kenarlar), 'neighbors' (hücre başına 8 komşuluk) ve
+              'windows' (hücreyi de içeren kırpılmış 3x3 pencere)
+    """
+    full = (1 << (rows * cols)) - 1
+    inner = region_mask(1, 1, rows - 1, cols - 1, cols)
+    border = full & ~inner
+    corner = cells_mask({(0, 0), (0, cols - 1), (rows - 1, 0), (rows - 1, cols - 1)}, cols)
+    return {
+        'rows': [region_mask(row, 0, row + 1, cols, cols) for row in range(rows)],
+        'cols': [region_mask(0, col, rows, col + 1, cols) for col in range(cols)],
+        'main_diagonal': cells_mask(((i, i) for i in range(min(rows, cols))), cols),
+        'anti_diagonal': cells_mask(((i, cols - 1 - i) for i in range(min(rows, cols))), cols),
+        'diagonals': [index_mask(line) for line in build_diagonal_lines(rows, cols)],
+        'quadrants': [region_mask(*quadrant, cols=cols) for quadrant in quadrant_regions(rows, cols)],
+        'border': border,
+        'inner': inner,
+        'corner': corner,
+        'edge': border & ~corner,
+        'neighbors': _neighbor_masks(rows, cols),
+        'windows': _neighbor_masks(rows, cols, include_center=True)
+    }
+
+
+def mask_bits(mask):
+    """
+    Boolean maskeyi (her boyutta) bit maskesine çevirir
+    
+    Hücreler küçük uçlu (little-endian) bit sırasıyla paketlenir; böylece
+    düzleştirilmiş i. hücre i. bit olur.
+    """
+    packed = np.packbits(mask.ravel(), bitorder="little")
+    return int.from_bytes(packed.tobytes(), "little")
+
+
+class Bitboard:
+    """
+    P ve B hücrelerini iki tamsayının bitlerinde tutan tahta
+
+    Bölge sayımları popcount(tahta & maske) ile yapılır; tek tahta üzerindeki
+    küçük sayımlarda NumPy çağrı maliyetinden çok daha hızlıdır.
+    """
+
+    __slots__ = ("p", "b")
+
+    def __init__(self, p=0, b=0):
+        self.p = p
+        self.b = b
+
+    @classmethod
+    def from_masks(cls, p_mask, b_mask):
+        """P ve B boolean maskelerinden (her boyutta) bitboard oluşturur"""
+        return cls(mask_bits(p_mask), mask_bits(b_mask))
+
+    @classmethod
+    def from_matrix(cls, matrix):
+        """Matristen (0=boş, 1=P, 2=B) bitboard oluşturur"""
+        return cls.from_masks(matrix == 1, matrix == 2)
+
+    def to_matrix(self, shape=(BOARD_SIZE, BOARD_SIZE)):
+        """Bitboard'u verilen boyutta int matrise çevirir"""
+        cells = shape[0] * shape[1]
+        size = (cells + 7) // 8
+        p_cells = np.unpackbits(np.frombuffer(self.p.to_bytes(size, "little"), dtype=np.uint8),
+                                count=cells, bitorder="little")
+        b_cells = np.unpackbits(np.frombuffer(self.b.to_bytes(size, "little"), dtype=np.uint8),
+                                count=cells, bitorder="little")
+        return (p_cells * 1 + b_cells * 2).astype(int).reshape(shape)
+
+    @property
+    def filled(self):
+        """Dolu hücrelerin maskesi"""
+        return self.p | self.b
+
+    def empty(self, cells=BOARD_CELLS):
+        """Boş hücrelerin maskesi (tahtadaki hücre sayısına göre)"""
+        return ((1 << cells) - 1) & ~(self.p | self.b)
+
+    def get(self, row, col, cols=BOARD_SIZE):
+        """Hücre değeri (0=boş, 1=P, 2=B)"""
+        bit = cell_bit(row, col, cols)
+        if self.p & bit:
+            return 1
+        if self.b & bit:
+            return 2
+        return 0
+
+    def set(self, row, col, value, cols=BOARD_SIZE):
+        """Hücreye değer yazar (0 hücreyi boşaltır)"""
+        bit = cell_bit(row, col, cols)
+        self.p &= ~bit
+        self.b &= ~bit
+        if value == 1:
+            self.p |= bit
+        elif value == 2:
+            self.b |= bit
+
+    def clear(self, row, col, cols=BOARD_SIZE):
+        """Hücreyi boşaltır"""
+        self.set(row, col, 0, cols)
+
+    def count(self, mask=ALL_BITS):
+        """
+        Maske içindeki P ve B sayıları
+
+        Args:
+            mask (int): Bölge maskesi (varsayılan tüm tahta)
+
+        Returns:
+            tuple: (P sayısı, B sayısı)
+        """
+        return popcount(self.p & mask), popcount(self.b & mask)
+
+    def p_count(self, mask=ALL_BITS):
+        """Maske içindeki P sayısı"""
+        return popcount(self.p & mask)
+
+    def b_count(self, mask=ALL_BITS):
+        """Maske içindeki B sayısı"""
+        return popcount(self.b & mask)
+
+    def filled_count(self, mask=ALL_BITS):
+        """Maske içindeki dolu hücre sayısı"""
+        return popcount((self.p | self.b) & mask)
+
+    def copy(self):
+        """Bağımsız bir kopya döndürür"""
+        return Bitboard(self.p, self.b)
+
+    def __eq__(self, other):
+        return isinstance(other, Bitboard) and self.p == other.p and self.b == other.b
+
+    def __hash__(self):
+        return hash((self.p, self.b))
+
+    def __repr__(self):
+        return f"Bitboard(p={self.p:#x}, b={self.b:#x})"
\ No newline at end of file
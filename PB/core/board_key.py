@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+P ve B Pattern Analiz Uygulaması
+Tahta durumunu tek bir tamsayıya paketleyen base-3 kodlayıcı
+"""
+
+import numpy as np
+
+BOARD_CELLS = 25
+
+# Her hücre bir base-3 basamağıdır (0=boş, 1=P, 2=B); 3^25 < 2^40 olduğundan
+# 5x5 tahta tek bir 64-bit tamsayıya sığar
+POWERS_OF_3 = 3 ** np.arange(BOARD_CELLS, dtype=np.int64)
+
+
+def encode_board(matrix):
+    """
+    Tahtayı base-3 paketlenmiş tamsayı anahtara dönüştürür
+    
+    Args:
+        matrix (numpy.ndarray): 5x5 matris, 0=boş, 1=P, 2=B
+        
+    Returns:
+        int: Paketlenmiş durum anahtarı
+    """
+    return int(np.dot(matrix.ravel().astype(np.int64), POWERS_OF_3))
+
+
+def encode_boards(boards):
+    """
+    Birden çok tahtayı tek seferde paketler
+    
+    Args:
+        boards (numpy.ndarray): (N, 5, 5) tahtalar
+        
+    Returns:
+        numpy.ndarray: (N,) int64 durum anahtarları
+    """
+    flat = boards.reshape(len(boards), BOARD_CELLS).astype(np.int64)
+    return flat @ POWERS_OF_3
+
+
+def decode_board(key, shape=(5, 5)):
+    """
+    Paketlenmiş anahtardan tahtayı geri oluşturur
+    
+    Args:
+        key (int): encode_board ile üretilmiş anahtar
+        shape (tuple, optional): Tahta boyutu
+        
+    Returns:
+        numpy.ndarray: int matris, 0=boş, 1=P, 2=B
+    """
+    digits = (np.int64(key) // POWERS_OF_3) % 3
+    return digits.astype(int).reshape(shape)
+
+def board_state_key(matrix):
+    """
+    Önbellek anahtarı olarak kullanılacak tahta durum anahtarı
+    
+    5x5 tahtalarda encode_board ile paketlenmiş tamsayı; diğer boyutlarda farklı
+    boyuttaki tahtalar çakışmasın diye (boyut, hücre baytları) çifti döndürülür.
+    
+    Args:
+        matrix (numpy.ndarray): Tahta, 0=boş, 1=P, 2=B
+        
+    Returns:
+        int veya tuple: Hashlenebilir durum anahtarı
+    """
+    if matrix.shape == (5, 5):
+        return encode_board(matrix)
+    return (matrix.shape, matrix.astype(np.int8).tobytes())
\ No newline at end of file
@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+P ve B Pattern Analiz Uygulaması
+Çok sayıda shoe için bit paketli, bellek eşlemeli (np.memmap) derlem biçimi
+
+Biçim (küçük uçlu, .pbc):
+    başlık      CORPUS_HEADER: sihirli sayı, sürüm, ayrılmış, shoe sayısı,
+                toplam el sayısı, indeks konumu, üst veri konumu
+    veri        El başına 1 bit (0=P/W, 1=B/L, ilk el en düşük bitte); her shoe
+                bir bayt sınırından başlar
+    indeks      Shoe başına INDEX_DTYPE kaydı: veri bölümündeki bayt konumu,
+                el sayısı, beraberlik sayısı ve kaynak numarası
+    üst veri    UTF-8 JSON: 'sources' (kaynak adları) ve serbest alanlar
+
+Dosya açılırken yalnızca başlık ve üst veri okunur; indeks ve veri bellek
+eşlemesinin görünümleridir. Bir shoe istendiğinde yalnızca onun ceil(N / 8)
+baytı diskten okunur ve açılır.
+"""
+
+import json
+import os
+import struct
+import numpy as np
+
+CORPUS_MAGIC = b"PBCO"
+CORPUS_VERSION = 1
+
+CORPUS_HEADER = struct.Struct("<4sHHQQQQ")
+INDEX_DTYPE = np.dtype([("offset", "<u8"), ("hands", "<u4"), ("ties", "<u4"), ("source", "<u4")])
+
+# Bitin anlamı: sonuç kodu = bit + 1 (1=P/W, 2=B/L)
+BANKER = 2
+
+
+def pack_shoes(outcomes, lengths):
+    """
+    Art arda eklenmiş shoe'ları el başına 1 bit olarak paketler
+
+    Args:
+        outcomes (sequence): Tüm shoe'ların sonuçları art arda, 1=P/W, 2=B/L
+        lengths (sequence): Shoe başına el sayısı
+
+    Returns:
+        tuple: (paketlenmiş veri (uint8), shoe başına bayt konumu (int64))
+    """
+    outcomes = np.asarray(outcomes, dtype=np.int8)
+    lengths = np.asarray(lengths, dtype=np.int64)
+
+    # Her shoe bayt sınırından başlar
+    sizes = (lengths + 7) // 8
+    offsets = np.zeros(len(lengths), dtype=np.int64)
+    np.cumsum(sizes[:-1], out=offsets[1:])
+    starts = np.cumsum(lengths) - lengths
+
+    bits = np.zeros(int(sizes.sum()) * 8, dtype=np.uint8)
+    positions = np.arange(len(outcomes)) + np.repeat(offsets * 8 - starts, lengths)
+    bits[positions] = outcomes == BANKER
+    return np.packbits(bits, bitorder="little"), offsets
+
+
+class CorpusWriter:
+    """
+    Derlem dosyasını akış halinde yazan yazıcı
+
+    Shoe'lar geldikçe veri bölümüne eklenir; indeks ve üst veri close'da
+    yazılır. Başlık en son yazıldığından yarım kalmış bir dosya derlem olarak
+    açılmaz; with bloğu hatayla biterse dosya silinir.
+    """
+
+    def __init__(self, path, metadata=None):
+        self.path = path
+        self.metadata = dict(metadata or {})
+        self.sources = []
+        self.source_ids = {}
+        self.index = []
+        self.data_size = 0
+        self.hand_count = 0
+        self.file = open(path, "wb")
+        self.file.write(bytes(CORPUS_HEADER.size))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def source_id(self, source):
+        """Kaynak adının numarası (ilk kullanımda eklenir)"""
+        if source not in self.source_ids:
+            self.source_ids[source] = len(self.sources)
+            self.sources.append(source)
+        return self.source_ids[source]
+
+    def add_shoe(self, outcomes, ties=0, source=""):
+        """
+        Tek bir shoe ekler
+
+        Args:
+            outcomes (sequence): Sonuçlar, 1=P/W, 2=B/L
+            ties (int): Shoe'daki beraberlik sayısı (sonuçlarda yer almaz)
+            source (str): Kaynak adı (ör. içe aktarılan dosya)
+        """
+        self.add_shoes(outcomes, [len(outcomes)], [ties], source)
+
+    def add_shoes(self, outcomes, lengths, ties=None, source=""):
+        """
+        Aynı kaynaktan birden çok shoe'yu tek seferde ekler
+
+        Args:
+            outcomes (sequence): Shoe'ların sonuçları art arda
+            lengths (sequence): Shoe başına el sayısı
+            ties (sequence, optional): Shoe başına beraberlik sayısı
+            source (str): Kaynak adı
+        """
+        packed, offsets = pack_shoes(outcomes, lengths)
+
+        records = np.zeros(len(offsets), dtype=INDEX_DTYPE)
+        records["offset"] = offsets + self.data_size
+        records["hands"] = lengths
+        records["ties"] = 0 if ties is None else ties
+        records["source"] = self.source_id(source)
+
+        self.file.write(packed.tobytes())
+        self.index.append(records)
+        self.data_size += len(packed)
+        self.hand_count += int(records["hands"].sum())
+
+    def close(self):
+        """İndeksi, üst veriyi ve başlığı yazar"""
+        if self.file.closed:
+            return
+
+        index = np.concatenate(self.index) if self.index else np.zeros(0, dtype=INDEX_DTYPE)
+
+        # İndeks 8 baytlık sınırdan başlar
+        index_offset = CORPUS_HEADER.size + self.data_size
+        padding = -index_offset % 8
+        index_offset += padding
+        self.file.write(bytes(padding))
+        self.file.write(index.tobytes())
+
+        metadata = dict(self.metadata, sources=self.sources)
+        self.file.write(json.dumps(metadata, ensure_ascii=False).encode("utf-8"))
+
+        self.file.seek(0)
+        self.file.write(CORPUS_HEADER.pack(CORPUS_MAGIC, CORPUS_VERSION, 0, len(index), self.hand_count,
+                                           index_offset, index_offset + index.nbytes))
+        self.file.close()
+
+    def abort(self):
+        """Başlığı yazmadan dosyayı kapatır ve siler"""
+        if self.file.closed:
+            return
+
+        self.file.close()
+        os.remove(self.path)
+
+
+def write_corpus(path, shoes, metadata=None, source=""):
+    """
+    Shoe listesini derlem dosyasına yazar
+
+    Args:
+        path (str): Dosya yolu
+        shoes (list): Shoe başına sonuç dizileri
+        metadata (dict, optional): Derlem üst verisi
+        source (str): Kaynak adı
+    """
+    with CorpusWriter(path, metadata) as writer:
+        if shoes:
+            writer.add_shoes(np.concatenate([np.asarray(shoe, dtype=np.int8) for shoe in shoes]),
+                             [len(shoe) for shoe in shoes], source=source)
+
+
+def is_corpus_file(path):
+    """Dosyanın derlem dosyası olup olmadığı (sihirli sayıya göre)"""
+    with open(path, "rb") as corpus_file:
+        return corpus_file.read(len(CORPUS_MAGIC)) == CORPUS_MAGIC
+
+
+class Corpus:
+    """
+    Bellek eşlemeli derlem okuyucu
+
+    index ve packed görünümleri dosyanın kopyası değil, doğrudan eşlemesidir;
+    shoe ve shoes yalnızca istenen shoe'ların baytlarını açar.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.buffer = np.memmap(path, dtype=np.uint8, mode="r")
+        if len(self.buffer) < CORPUS_HEADER.size:
+            raise ValueError("Derlem dosyası değil")
+
+        (magic, version, _, shoe_count, hand_count,
+         index_offset, metadata_offset) = CORPUS_HEADER.unpack(self.buffer[:CORPUS_HEADER.size].tobytes())
+        if magic != CORPUS_MAGIC:
+            raise ValueError("Derlem dosyası değil")
+        if version != CORPUS_VERSION:
+            raise ValueError(f"Desteklenmeyen derlem sürümü: {version}")
+
+        self.hand_count = hand_count
+        self.data = self.buffer[CORPUS_HEADER.size:index_offset]
+        self.index = self.buffer[index_offset:metadata_offset].view(INDEX_DTYPE)
+        if len(self.index) != shoe_count:
+            raise ValueError("Derlem dosyası bozuk (indeks boyutu uyuşmuyor)")
+        self.metadata = json.loads(self.buffer[metadata_offset:].tobytes().decode("utf-8"))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self):
+        return len(self.index)
+
+    def __iter__(self):
+        for shoe_id in range(len(self)):
+            yield self.shoe(shoe_id)
+
+    def close(self):
+        """Eşlemeyi bırakır (görünümler tutulmuyorsa dosya kapanır)"""
+        self.buffer = self.data = self.index = None
+
+    def packed(self, shoe_id):
+        """Shoe'nun paketlenmiş baytları (eşlemenin görünümü, kopyalanmaz)"""
+        offset, hands = int(self.index["offset"][shoe_id]), int(self.index["hands"][shoe_id])
+        return self.data[offset:offset + (hands + 7) // 8]
+
+    def shoe(self, shoe_id):
+        """
+        Bir shoe'nun sonuçları
+
+        Returns:
+            numpy.ndarray: (N,) int8 sonuçlar, 1=P/W, 2=B/L
+        """
+        hands = int(self.index["hands"][shoe_id])
+        bits = np.unpackbits(self.packed(shoe_id), count=hands, bitorder="little")
+        return bits.view(np.int8) + 1
+
+    def shoes(self, start=0, stop=None):
+        """
+        Art arda shoe'ları tek okumayla açar
+
+        Args:
+            start (int): İlk shoe
+            stop (int, optional): Son shoe (hariç)
+
+        Returns:
+            list: Shoe başına (N,) int8 sonuç dizileri
+        """
+        stop = len(self) if stop is None else min(stop, len(self))
+        if start >= stop:
+            return []
+
+        index = self.index[start:stop]
+        offsets = index["offset"].astype(np.int64)
+        hands = index["hands"].astype(np.int64)
+        base = offsets[0]
+        bits = np.unpackbits(self.data[base:offsets[-1] + (hands[-1] + 7) // 8], bitorder="little")
+
+        # Bayt sınırı dolgusu atlanır
+        bit_starts = (offsets - base) * 8
+        positions = np.arange(int(hands.sum())) + np.repeat(bit_starts - (np.cumsum(hands) - hands), hands)
+        outcomes = bits[positions].view(np.int8) + 1
+        return np.split(outcomes, np.cumsum(hands)[:-1])
+
+    def source(self, shoe_id):
+        """Shoe'nun kaynak adı"""
+        return self.metadata["sources"][int(self.index["source"][shoe_id])]
\ No newline at end of file
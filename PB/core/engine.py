@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+P ve B Pattern Analiz Uygulaması
+Arayüzden bağımsız analiz motoru
+"""
+
+import numpy as np
+from models.diagonal import DiagonalAnalysis
+from models.rectangle import RectangleAnalysis
+from models.lshape import LShapeAnalysis
+from models.tshape import TShapeAnalysis
+from models.spiral import SpiralAnalysis
+from models.neighborhood import NeighborhoodAnalysis
+from models.zigzag import ZigzagAnalysis
+from models.scatter import ScatterAnalysis
+from models.quadrant import QuadrantAnalysis
+from models.symmetry import SymmetryAnalysis
+from models.border import BorderAnalysis
+from models.heatmap import HeatmapAnalysis
+from models.combined import CombinedAnalysis
+from models.hibrit import HibritAnalysis
+from core.features import BoardFeatures
+
+COMBINED_MODEL = "Karma Analiz"
+HYBRID_MODEL = "Hibrit Analiz"
+
+# Artımlı durum (ScatterState) alabilen model
+SCATTER_MODEL = "Serpme"
+
+# Geometrik (yaprak) modeller - arayüzdeki sırayla
+LEAF_MODELS = [
+    ("Çapraz (Diagonal)", DiagonalAnalysis),
+    ("Dikdörtgen", RectangleAnalysis),
+    ("L-Şekli", LShapeAnalysis),
+    ("T-Şekli", TShapeAnalysis),
+    ("Spiral", SpiralAnalysis),
+    ("Komşuluk", NeighborhoodAnalysis),
+    ("Zig-Zag", ZigzagAnalysis),
+    (SCATTER_MODEL, ScatterAnalysis),
+    ("Kuadran", QuadrantAnalysis),
+    ("Simetri", SymmetryAnalysis),
+    ("Sınır", BorderAnalysis),
+    ("Isı Haritası", HeatmapAnalysis),
+]
+
+LEAF_MODEL_NAMES = [name for name, _ in LEAF_MODELS]
+
+# Başarı oranının hesaplanması için gereken minimum tahmin sayısı
+MIN_RATED_PREDICTIONS = 3
+
+# Varsayılan tahta boyutu (satır, sütun)
+BOARD_SHAPE = (5, 5)
+
+
+def create_models():
+    """Arayüzde kullanılan tüm modelleri (yaprak + Karma + Hibrit) oluşturur"""
+    models = {name: model_class() for name, model_class in LEAF_MODELS}
+    models[COMBINED_MODEL] = CombinedAnalysis()
+    models[HYBRID_MODEL] = HibritAnalysis()
+    return models
+
+
+def new_model_stats(model_names):
+    """Boş model istatistikleri sözlüğü oluşturur"""
+    return {model_name: {"success_rate": 50, "correct": 0, "total": 0}
+            for model_name in model_names}
+
+
+def record_prediction(model_stat, prediction, actual):
+    """
+    Tek bir modelin tahminini gerçek sonuçla karşılaştırıp istatistiğini günceller
+
+    Args:
+        model_stat (dict): {"success_rate", "correct", "total"} sözlüğü
+        prediction (int): Modelin tahmini (0=belirsiz, 1=P, 2=B)
+        actual (int): Gerçek sonuç (1=P, 2=B)
+    """
+    # Sadece sonuç varsa ve model tahmin yapabiliyorsa hesapla
+    if prediction == 0 or actual == 0:
+        return
+
+    model_stat["total"] += 1
+    if prediction == actual:
+        model_stat["correct"] += 1
+
+    # Başarı oranını hesapla - en az 3 tahmin yapılmışsa
+    correct = model_stat["correct"]
+    total = model_stat["total"]
+
+    if total >= MIN_RATED_PREDICTIONS:
+        model_stat["success_rate"] = int((correct / total) * 100)
+    else:
+        # Çok az veri varsa, henüz oran hesaplanmadı olarak işaretle
+        model_stat["success_rate"] = 50  # Varsayılan değer
+
+
+class AnalysisEngine:
+    """
+    PyQt'den bağımsız analiz motoru
+
+    Her tahta durumu için yaprak modelleri yalnızca bir kez çalıştırır; Karma ve
+    Hibrit modeller bu hazır tahminleri kullanır. Model istatistikleri de burada tutulur.
+
+    Modeller tahta boyutunu matristen okur; shape bu motorla kullanılacak
+    tahtaların boyutudur (boyuta özgü indeks tabloları ilk kullanımda hazırlanır).
+
+    Modellerin kendi durumu yalnızca tahta anahtarlı tahmin önbelleğidir; bu
+    nedenle birçok masanın motoru aynı models sözlüğünü paylaşabilir (her motorun
+    istatistikleri ayrıdır).
+    """
+
+    def __init__(self, shape=BOARD_SHAPE, models=None):
+        self.shape = tuple(shape)
+        self.models = models if models is not None else create_models()
+        self.model_stats = new_model_stats(self.models.keys())
+
+    def empty_board(self):
+        """Motorun boyutunda boş bir tahta"""
+        return np.zeros(self.shape, dtype=int)
+
+    def reset_stats(self):
+        """Model istatistiklerini sıfırlar"""
+        for model_name in self.model_stats:
+            self.model_stats[model_name] = {"success_rate": 50, "correct": 0, "total": 0}
+
+    def predict(self, matrix, history=None, features=None, scatter_state=None):
+        """
+        Yaprak modelleri birer kez çalıştırır, Karma tahmini bunlardan üretir
+
+        Args:
+            matrix (numpy.ndarray): Tahta matrisi (motorun boyutunda), 0=boş, 1=P, 2=B
+            history (list, optional): Geçmiş hamlelerin listesi (row, col, value)
+            features (BoardFeatures, optional): Önceden hesaplanmış tahta özellikleri
+            scatter_state (ScatterState, optional): Tahtayla güncel tutulan Serpme durumu
+
+        Returns:
+            dict: Model adı -> tahmin (Hibrit hariç)
+        """
+        if features is None:
+            features = BoardFeatures(matrix, history)
+
+        predictions = {}
+        for model_name in LEAF_MODEL_NAMES:
+            model = self.models[model_name]
+            if model_name == SCATTER_MODEL and scatter_state is not None:
+                predictions[model_name] = model.analyze(matrix, history, features, state=scatter_state)
+            else:
+                predictions[model_name] = model.analyze(matrix, history, features)
+
+        predictions[COMBINED_MODEL] = self.models[COMBINED_MODEL].analyze(
+            matrix, history, features, predictions=predictions)
+        return predictions
+
+    def analyze(self, matrix, history=None, actual=None, scatter_state=None):
+        """
+        Tüm modellerin tahminlerini üretir ve istatistikleri günceller
+
+        Args:
+            matrix (numpy.ndarray): Tahta matrisi (motorun boyutunda), 0=boş, 1=P, 2=B
+            history (list, optional): Geçmiş hamlelerin listesi (row, col, value)
+            actual (int, optional): Önceki tahminle karşılaştırılacak gerçek sonuç
+            scatter_state (ScatterState, optional): Tahtayla güncel tutulan Serpme durumu
+
+        Returns:
+            dict: 'predictions' (model adı -> tahmin) ve 'hibrit_confidence'
+        """
+        features = BoardFeatures(matrix, history)
+        model_predictions = self.predict(matrix, history, features, scatter_state)
+
+        # Önce diğer modellerin başarı oranını güncelle
+        if actual is not None:
+            for model_name, prediction in model_predictions.items():
+                record_prediction(self.model_stats[model_name], prediction, actual)
+
+        # Şimdi güncellenmiş istatistiklerle Hibrit model için tahmin yap
+        prediction, hibrit_confidence = self._analyze_hybrid(
+            matrix, history, model_predictions, features)
+        model_predictions[HYBRID_MODEL] = prediction
+
+        # Hibrit modelin başarısını güncelle
+        if actual is not None:
+            record_prediction(self.model_stats[HYBRID_MODEL], prediction, actual)
+
+        return {
+            'predictions': model_predictions,
+            'hibrit_confidence': hibrit_confidence
+        }
+
+    def _analyze_hybrid(self, matrix, history, model_predictions, features=None, model_stats=None):
+        """Hibrit tahmini ve güven seviyesini hesaplar (istatistikler verilmezse motorunkiler)"""
+        if model_stats is None:
+            model_stats = self.model_stats
+        hibrit_result = self.models[HYBRID_MODEL].analyze(
+            matrix, history, model_stats, predictions=model_predictions, features=features)
+
+        # Hibrit model tahminin yanında güven seviyesini de döndürebilir
+        if isinstance(hibrit_result, dict):
+            return hibrit_result.get('prediction', 0), hibrit_result.get('confidence', 0.6)
+
+        # Hibrit için güven seviyesini hesapla (en iyi 3 modelin ağırlıklı ortalaması)
+        top_models = []
+        for m_name, m_stat in model_stats.items():
+            if m_name != HYBRID_MODEL and m_name != COMBINED_MODEL and m_stat["total"] >= 3:
+                top_models.append({"name": m_name, "success_rate": m_stat["success_rate"]})
+
+        top_models = sorted(top_models, key=lambda x: x["success_rate"], reverse=True)[:3]
+
+        # En iyi 3 modelin ortalama başarı oranı
+        if top_models:
+            avg_success = sum(m["success_rate"] for m in top_models) / len(top_models)
+            return hibrit_result, avg_success / 100.0  # 0-1 arası değere dönüştür
+
+        return hibrit_result, 0.6  # Varsayılan güven
+
+    def confidence(self, model_name, prediction, hibrit_confidence):
+        """
+        Seçili modelin tahmini için gösterilecek güven seviyesini hesaplar
+
+        Returns:
+            float: 0-1 arası güven değeri
+        """
+        if prediction == 0:
+            return 0.5  # Belirsiz durumlarda orta değer
+
+        if model_name == HYBRID_MODEL:
+            # Hibrit için özel güven seviyesi hesaplaması
+            return hibrit_confidence
+
+        # Diğer modeller için standart hesaplama
+        total_predictions = self.model_stats[model_name]["total"]
+        success_rate = self.model_stats[model_name]["success_rate"]
+
+        # Yeterli veri yoksa dikkatli ol
+        if total_predictions < 5:
+            return 0.5  # Çok az veri varsa orta güven seviyesi
+        return success_rate / 100.0  # 0-1 arası değer
\ No newline at end of file
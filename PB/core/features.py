@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+P ve B Pattern Analiz Uygulaması
+Tahta başına ortak özellik önbelleği
+"""
+
+import numpy as np
+from core.board_key import board_state_key
+from core.bitboard import Bitboard
+
+
+# 8 komşuluk yönleri (analyze() metotlarındaki dr/dc sırası)
+NEIGHBOR_DIRECTIONS = [(dr, dc) for dr in (-1, 0, 1) for dc in (-1, 0, 1) if (dr, dc) != (0, 0)]
+
+
+def neighbor_counts(mask):
+    """
+    Her hücrenin 8 komşusu içindeki işaretli hücre sayısını döndürür
+    
+    Kenarları sıfırla doldurulmuş dizi kaydırılıp toplanarak tek geçişte hesaplanır.
+    
+    Args:
+        mask (numpy.ndarray): (..., R, C) boolean maske
+        
+    Returns:
+        numpy.ndarray: (..., R, C) komşu sayıları
+    """
+    rows, cols = mask.shape[-2:]
+    pad = [(0, 0)] * (mask.ndim - 2) + [(1, 1), (1, 1)]
+    padded = np.pad(mask.astype(np.int8), pad)
+    
+    counts = np.zeros(mask.shape, dtype=np.int8)
+    for dr, dc in NEIGHBOR_DIRECTIONS:
+        counts += padded[..., 1+dr:rows+1+dr, 1+dc:cols+1+dc]
+    return counts
+
+
+def summed_area_table(mask):
+    """
+    Maskenin integral görüntüsünü (summed-area table) döndürür
+    
+    Tabloya baştan bir sıfır satır ve sütun eklenir; böylece herhangi bir
+    dikdörtgen bölgedeki toplam region_sum ile dört okumada bulunur.
+    
+    Args:
+        mask (numpy.ndarray): (..., R, C) boolean maske
+        
+    Returns:
+        numpy.ndarray: (..., R+1, C+1) int32 kümülatif toplamlar
+    """
+    rows, cols = mask.shape[-2:]
+    table = np.zeros(mask.shape[:-2] + (rows + 1, cols + 1), dtype=np.int32)
+    table[..., 1:, 1:] = mask.cumsum(axis=-2, dtype=np.int32).cumsum(axis=-1)
+    return table
+
+
+def region_sum(table, bounds):
+    """
+    [top:bottom, left:right] bölgesindeki toplamı integral görüntüden okur
+    
+    Args:
+        table (numpy.ndarray): summed_area_table çıktısı (..., R+1, C+1)
+        bounds (tuple): (top, left, bottom, right); her biri sayı veya K uzunlukta dizi
+        
+    Returns:
+        numpy.ndarray: Bölge toplamları (..., K) veya (...)
+    """
+    top, left, bottom, right = bounds
+    
+    # Son iki ekseni düzleştirip np.take ile okumak iki eksenli indekslemeden hızlıdır
+    width = table.shape[-1]
+    flat = table.reshape(table.shape[:-2] + (-1,))
+    return (np.take(flat, bottom * width + right, axis=-1) - np.take(flat, top * width + right, axis=-1)
+            - np.take(flat, bottom * width + left, axis=-1) + np.take(flat, top * width + left, axis=-1))
+
+
+def region_bounds(regions):
+    """(top, left, bottom, right) bölge listesini region_sum için dört diziye çevirir"""
+    return tuple(np.array(column) for column in zip(*regions))
+
+
+class BoardFeatures:
+    """
+    Bir (matris, geçmiş) çifti için bir kez hesaplanan ortak özellikler
+
+    Tüm modeller aynı sayımları, maskeleri ve son hamleyi kullanır; bu sınıf
+    bunları tek seferde hesaplayıp her modelin analyze() metoduna aktarılır.
+    """
+
+    def __init__(self, matrix, history=None):
+        self.matrix = matrix
+        self.shape = matrix.shape
+
+        # P, B ve boş hücre maskeleri
+        self.p_mask = matrix == 1
+        self.b_mask = matrix == 2
+        self.empty_mask = matrix == 0
+        self.non_empty = ~self.empty_mask
+
+        # P ve B sayıları
+        self.p_count = np.sum(self.p_mask)
+        self.b_count = np.sum(self.b_mask)
+        self.total = self.p_count + self.b_count
+
+        # P, B ve dolu hücre integral görüntüleri (bölge sayımları için)
+        self.p_table = summed_area_table(self.p_mask)
+        self.b_table = summed_area_table(self.b_mask)
+        self.filled_table = summed_area_table(self.non_empty)
+
+        # Her hücrenin 8 komşusu içindeki P ve B sayıları
+        self.p_neighbors = neighbor_counts(self.p_mask)
+        self.b_neighbors = neighbor_counts(self.b_mask)
+
+        # Bitboard gösterimi (bölge sayımları popcount(tahta & maske) ile)
+        self.bitboard = Bitboard.from_masks(self.p_mask, self.b_mask)
+
+        # Geçmiş bilgileri
+        self.history_length = len(history) if history else 0
+        self.last_move = tuple(history[-1]) if history else None
+
+        # Tahtanın paketlenmiş durum anahtarı (5x5'te her hücre bir base-3 basamağı)
+        self.state_key = board_state_key(matrix)
+
+    @property
+    def last_value(self):
+        """Son hamlenin değeri (geçmiş yoksa 0)"""
+        return self.last_move[2] if self.last_move else 0
+
+class BatchFeatures:
+    """
+    N tahtalık bir yığın için BoardFeatures karşılığı
+
+    Geçmiş yerine her tahtanın son hamle koordinatları verilir; son hamlenin değeri
+    tahtadan okunur. Geçmişin tahtadaki dolu hücrelerle tutarlı olduğu varsayılır.
+    """
+
+    def __init__(self, boards, last_moves=None):
+        boards = np.asarray(boards, dtype=np.int8)
+        n = len(boards)
+        self.boards = boards
+        self.size = n
+        self.shape = boards.shape[1:]
+
+        # P, B ve boş hücre maskeleri (N, R, C)
+        self.p_mask = boards == 1
+        self.b_mask = boards == 2
+        self.empty_mask = boards == 0
+        self.non_empty = ~self.empty_mask
+
+        # Tahta başına P ve B sayıları (N,)
+        self.p_count = self.p_mask.sum(axis=(1, 2))
+        self.b_count = self.b_mask.sum(axis=(1, 2))
+        self.total = self.p_count + self.b_count
+
+        # P, B ve dolu hücre integral görüntüleri (N, R+1, C+1)
+        self.p_table = summed_area_table(self.p_mask)
+        self.b_table = summed_area_table(self.b_mask)
+        self.filled_table = summed_area_table(self.non_empty)
+
+        # Her hücrenin 8 komşusu içindeki P ve B sayıları (N, R, C)
+        self.p_neighbors = neighbor_counts(self.p_mask)
+        self.b_neighbors = neighbor_counts(self.b_mask)
+
+        # Son hamleler (satır < 0 ise geçmiş yok)
+        if last_moves is None:
+            last_moves = np.full((n, 2), -1, dtype=np.intp)
+        last_moves = np.asarray(last_moves, dtype=np.intp).reshape(n, 2)
+        self.has_last = last_moves[:, 0] >= 0
+        self.last_row = np.where(self.has_last, last_moves[:, 0], 0)
+        self.last_col = np.where(self.has_last, last_moves[:, 1], 0)
+        self.last_value = np.where(
+            self.has_last, boards[np.arange(n), self.last_row, self.last_col], 0)
+
+    def basic_prediction(self, min_data_points=5):
+        """
+        Genel P/B çoğunluğuna göre tahmin ve yeterli veri maskesi
+
+        Returns:
+            tuple: (tahminler (N,), yeterli veri maskesi (N,))
+        """
+        prediction = np.where(self.p_count > self.b_count, 1, 2).astype(np.int8)
+        return prediction, self.total >= min_data_points
\ No newline at end of file
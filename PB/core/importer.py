@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+P ve B Pattern Analiz Uygulaması
+Metin/CSV shoe geçmişleri için yüksek hızlı toplu içe aktarıcı
+
+Dosya bayt olarak okunur ve np.frombuffer ile bir arama tablosundan (LUT)
+geçirilir; semboller karakter karakter Python'da işlenmez.
+
+Kurallar:
+    - Sonuç sembolleri P/B ya da W/L (büyük/küçük harf fark etmez), T beraberliktir
+    - Harf ve rakamlardan oluşan her kelime ("PBBP", "W", "T") el el okunur;
+      içinde sonuç sembolü olmayan bir harf ya da rakam bulunan kelimeler
+      ("Player", "shoe", "2024-01-02", "masa7") tümüyle yok sayılır
+    - Boşluk, virgül, noktalı virgül, tırnak vb. ayırıcıdır
+    - Her satır bir shoe'dur (per_file ile her dosya bir shoe); eli olmayan
+      satırlar (CSV başlığı gibi) atlanır
+    - column verilirse yalnızca satırın o alanı (0'dan başlayarak, delimiter
+      ile ayrılmış) okunur; sonuç alanının içinde delimiter kullanılmamalıdır
+"""
+
+import os
+import time
+import numpy as np
+from core.corpus import CorpusWriter
+
+# Bayt sınıfları
+SEPARATOR = 0
+PLAYER = 1      # P/W, sonuç kodu 1
+BANKER = 2      # B/L, sonuç kodu 2
+TIE = 3
+OTHER = 4       # Kelimeyi geçersiz kılan harf/rakam
+NEWLINE = 5
+
+ALPHABETS = {"PB": ("P", "B"), "WL": ("W", "L")}
+
+# Boşluk baytları (parse_strict'te sembollerin dışında izin verilen tek ayırıcılar)
+WHITESPACE = np.zeros(256, dtype=bool)
+WHITESPACE[list(b" \t\r\n\v\f")] = True
+
+# Dosyalar bu boyutta satır sınırından bölünerek okunur (bayt)
+READ_BLOCK = 64 << 20
+
+
+def class_table(alphabet=None):
+    """
+    Bayt -> sınıf arama tablosu
+
+    Args:
+        alphabet (str, optional): "PB" ya da "WL"; verilmezse ikisi de kabul edilir
+
+    Returns:
+        numpy.ndarray: (256,) uint8
+    """
+    table = np.full(256, SEPARATOR, dtype=np.uint8)
+    for char in b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_":
+        table[char] = OTHER
+
+    alphabets = [ALPHABETS[alphabet]] if alphabet else list(ALPHABETS.values())
+    for player, banker in alphabets:
+        for char, code in ((player, PLAYER), (banker, BANKER), ("T", TIE)):
+            table[ord(char)] = code
+            table[ord(char.lower())] = code
+
+    table[ord("\n")] = NEWLINE
+    return table
+
+
+def parse_shoes(data, table, column=None, delimiter=","):
+    """
+    Bayt bloğundaki shoe'ları ayrıştırır (satır başına bir shoe)
+
+    Args:
+        data (bytes): Metin (tam satırlardan oluşmalı)
+        table (numpy.ndarray): class_table sonucu
+        column (int, optional): Yalnızca bu alanı oku (CSV sütunu)
+        delimiter (str): Alan ayırıcı (column ile)
+
+    Returns:
+        tuple: (sonuçlar (int8, art arda), satır başına el sayısı (int64),
+                satır başına beraberlik sayısı (int64)); eli olmayan satırlar dahil
+    """
+    codes = np.frombuffer(data, dtype=np.uint8)
+    classes = table[codes]
+    if len(classes) == 0:
+        return np.zeros(0, dtype=np.int8), np.zeros(1, dtype=np.int64), np.zeros(1, dtype=np.int64)
+
+    newline = classes == NEWLINE
+    line_id = np.cumsum(newline)
+    line_id -= newline  # Satır sonu kendi satırına aittir
+    line_count = int(line_id[-1]) + 1
+
+    # Kelimeler: ayırıcı ve satır sonu dışındaki baytların kesintisiz dizileri
+    in_word = (classes != SEPARATOR) & ~newline
+    if column is not None:
+        in_word &= field_ids(codes, line_id, line_count, delimiter) == column
+    starts = in_word.copy()
+    starts[1:] &= ~in_word[:-1]
+    word_id = np.cumsum(starts)  # İlk kelimeden önceki baytlar 0
+
+    # İçinde başka harf/rakam olan kelimeler tümüyle atlanır
+    invalid = np.zeros(int(word_id[-1]) + 1, dtype=bool)
+    invalid[word_id[in_word & (classes == OTHER)]] = True
+    valid = in_word & ~invalid[word_id]
+
+    hand_mask = valid & ((classes == PLAYER) | (classes == BANKER))
+    tie_mask = valid & (classes == TIE)
+
+    outcomes = classes[hand_mask].view(np.int8)
+    lengths = np.bincount(line_id[hand_mask], minlength=line_count)
+    ties = np.bincount(line_id[tie_mask], minlength=line_count)
+    return outcomes, lengths, ties
+
+
+def field_ids(codes, line_id, line_count, delimiter=","):
+    """
+    Her baytın satırındaki alan numarası (ayırıcıların kendisi -1)
+
+    Args:
+        codes (numpy.ndarray): Baytlar (uint8)
+        line_id (numpy.ndarray): Baytın satır numarası
+        line_count (int): Satır sayısı
+        delimiter (str): Alan ayırıcı
+
+    Returns:
+        numpy.ndarray: (N,) int64
+    """
+    is_delimiter = codes == ord(delimiter)
+    before = np.cumsum(is_delimiter) - is_delimiter
+
+    # Her satırın ilk baytından önceki ayırıcı sayısı
+    line_starts = np.zeros(line_count, dtype=np.int64)
+    line_starts[1:] = np.flatnonzero(codes == ord("\n"))[:line_count - 1] + 1
+    fields = before - before[line_starts][line_id]
+    fields[is_delimiter] = -1
+    return fields
+
+
+def parse_outcomes(data, table=None):
+    """
+    Metindeki tüm sonuçları tek bir dizi olarak ayrıştırır (parse_shoes kuralları, satırlar birleştirilir)
+
+    Args:
+        data (bytes): Metin
+        table (numpy.ndarray, optional): class_table sonucu (varsayılan: P/B ve W/L)
+
+    Returns:
+        tuple: (sonuçlar (int8), beraberlik sayısı)
+    """
+    outcomes, _, ties = parse_shoes(data, class_table() if table is None else table)
+    return outcomes, int(ties.sum())
+
+
+def parse_strict(data, table=None):
+    """
+    Yalnızca sonuç sembolleri ve boşluklardan oluşan metni ayrıştırır ("P B B" ya da "PBB")
+
+    Args:
+        data (bytes): Metin
+        table (numpy.ndarray, optional): class_table sonucu (varsayılan: P/B ve W/L)
+
+    Returns:
+        numpy.ndarray: (N,) int8 sonuçlar (beraberlikler atlanır)
+
+    Raises:
+        ValueError: Sembol ve boşluk dışında bir karakter varsa
+    """
+    codes = np.frombuffer(data, dtype=np.uint8)
+    classes = (class_table() if table is None else table)[codes]
+
+    allowed = (classes == PLAYER) | (classes == BANKER) | (classes == TIE) | WHITESPACE[codes]
+    if not allowed.all():
+        position = int(np.argmin(allowed))
+        raise ValueError(f"Geçersiz karakter: {data[position:position + 1].decode('latin-1')!r} "
+                         f"(konum {position})")
+    return classes[(classes == PLAYER) | (classes == BANKER)].view(np.int8)
+
+
+def read_outcomes(path, alphabet=None):
+    """
+    Bir shoe dosyasının tüm sonuçlarını okur (dosya tek shoe sayılır, bkz. parse_shoes)
+
+    Args:
+        path (str): Dosya yolu
+        alphabet (str, optional): "PB" ya da "WL"; verilmezse ikisi de kabul edilir
+
+    Returns:
+        numpy.ndarray: (N,) int8 sonuçlar, 1=P/W, 2=B/L
+    """
+    with open(path, "rb") as source:
+        return parse_outcomes(source.read(), class_table(alphabet))[0]
+
+
+def read_blocks(path, block_size=READ_BLOCK):
+    """
+    Dosyayı satır sınırında bölünmüş bloklar halinde okur
+
+    Yields:
+        bytes: Tam satırlardan oluşan blok (son blok satır sonuyla bitmeyebilir)
+    """
+    with open(path, "rb") as source:
+        rest = b""
+        while True:
+            block = source.read(block_size)
+            if not block:
+                break
+            block = rest + block
+            cut = block.rfind(b"\n") + 1
+            if cut == 0:
+                rest = block
+                continue
+            rest = block[cut:]
+            yield block[:cut]
+        if rest:
+            yield rest
+
+
+class ImportReport:
+    """İçe aktarma sayaçları ve hızı"""
+
+    def __init__(self):
+        self.files = 0
+        self.shoes = 0
+        self.hands = 0
+        self.ties = 0
+        self.bytes = 0
+        self.seconds = 0.0
+
+    def hands_per_second(self):
+        """Saniyede içe aktarılan el sayısı"""
+        return self.hands / self.seconds if self.seconds > 0 else 0.0
+
+    def to_dict(self):
+        """JSON'a uygun özet"""
+        return {
+            "files": self.files,
+            "shoes": self.shoes,
+            "hands": self.hands,
+            "ties": self.ties,
+            "bytes": self.bytes,
+            "seconds": round(self.seconds, 4),
+            "hands_per_second": round(self.hands_per_second())
+        }
+
+
+def import_files(paths, output, alphabet=None, per_file=False, column=None, delimiter=",",
+                 metadata=None, block_size=READ_BLOCK):
+    """
+    Metin/CSV dosyalarını ayrıştırıp derlem dosyasına yazar
+
+    Args:
+        paths (list): Girdi dosyaları
+        output (str): Yazılacak derlem dosyası (.pbc)
+        alphabet (str, optional): "PB" ya da "WL"; verilmezse ikisi de kabul edilir
+        per_file (bool): Her dosyayı tek shoe say (satırlar birleştirilir)
+        column (int, optional): Yalnızca satırların bu alanını oku (CSV sütunu)
+        delimiter (str): Alan ayırıcı (column ile)
+        metadata (dict, optional): Derlem üst verisi
+        block_size (int): Okuma bloğu boyutu (bayt)
+
+    Returns:
+        ImportReport: Dosya, shoe, el ve beraberlik sayıları ile süre
+    """
+    table = class_table(alphabet)
+    report = ImportReport()
+    started = time.perf_counter()
+
+    metadata = dict(metadata or {})
+    metadata.setdefault("alphabet", alphabet or "PB/WL")
+
+    with CorpusWriter(output, metadata) as writer:
+        for path in paths:
+            source = os.path.basename(path)
+            file_outcomes = []
+            file_ties = 0
+
+            for block in read_blocks(path, block_size):
+                report.bytes += len(block)
+                outcomes, lengths, ties = parse_shoes(block, table, column, delimiter)
+                report.hands += len(outcomes)
+
+                if per_file:
+                    file_outcomes.append(outcomes)
+                    file_ties += int(ties.sum())
+                    continue
+
+                shoes = lengths > 0
+                if shoes.any():
+                    writer.add_shoes(outcomes, lengths[shoes], ties[shoes], source)
+                    report.shoes += int(shoes.sum())
+                    report.ties += int(ties[shoes].sum())
+
+            if per_file and file_outcomes:
+                outcomes = np.concatenate(file_outcomes)
+                if len(outcomes):
+                    writer.add_shoe(outcomes, file_ties, source)
+                    report.shoes += 1
+                    report.ties += file_ties
+            report.files += 1
+
+    report.seconds = time.perf_counter() - started
+    return report
\ No newline at end of file
@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+P ve B Pattern Analiz Uygulaması
+Girdi günlüğü (write-ahead journal) ve çökme sonrası kurtarma
+
+Arayüzdeki her ekleme, geri alma, temizleme ve yeniden analiz günlüğe eklenir.
+Yazma ve fsync arka plandaki bir iş parçacığında toplu olarak yapılır; arayüz
+iş parçacığı yalnızca kaydı kuyruğa ekler ve diske hiç beklemez.
+
+Biçim (küçük uçlu):
+    başlık      JOURNAL_HEADER: sihirli sayı, sürüm, satır, sütun
+    kayıtlar    RECORD: işlem, değer, satır, sütun (4 bayt; satır/sütun yalnızca OP_PLACE'te)
+                OP_SNAPSHOT kaydının ardından uint32 uzunluk ve oturum verisi
+                (core.persistence.session_bytes) gelir
+
+Temizleme ve anlık görüntü kayıtları kendilerinden önceki her şeyi geçersiz
+kıldığından bu kayıtlarda dosya atomik olarak yeniden yazılır (sıkıştırma).
+Yalnızca boş tahtadan başlayan P/B eklemeleri yığın halinde oynatılabildiğinden
+diğer durumlarda her SNAPSHOT_INTERVAL kayıtta bir anlık görüntü yazılır
+(bkz. JournalWriter.snapshot_due); kurtarmada tek tek oynatılan kayıt sayısı
+bununla sınırlı kalır.
+Dosya sonundaki yarım kalmış kayıt (çökme anında yazılmakta olan) yok sayılır.
+"""
+
+import os
+import struct
+import threading
+from core.persistence import session_from_bytes, state_from_outcomes
+from core.engine import HYBRID_MODEL
+from core.session import AnalysisSession
+
+JOURNAL_MAGIC = b"PBJL"
+JOURNAL_VERSION = 1
+
+JOURNAL_HEADER = struct.Struct("<4sHBB")
+RECORD = struct.Struct("<BBBB")
+SNAPSHOT_LENGTH = struct.Struct("<I")
+
+# Kayıt işlemleri
+OP_ADD = 1        # P/B butonu: ilk boş hücreye ekleme (tahta doluysa kaydırarak)
+OP_PLACE = 2      # Hücreye tıklayarak verilen hücreye ekleme
+OP_UNDO = 3
+OP_CLEAR = 4
+OP_REANALYZE = 5  # Model seçimi değişti, analiz tekrarlandı
+OP_SNAPSHOT = 6
+
+# Toplu fsync: kuyruktaki kayıtlar en geç bu süre sonra ya da bu kadar kayıt
+# biriktiğinde diske yazılır
+FLUSH_INTERVAL = 0.05
+FLUSH_BATCH = 256
+
+# Yığın halinde oynatılamayan günlüklerde anlık görüntüler arası en fazla kayıt
+SNAPSHOT_INTERVAL = 256
+
+DEFAULT_JOURNAL_PATH = os.path.join(os.path.expanduser("~"), ".pb_pattern_analyzer", "session.pbj")
+
+
+def journal_header(shape):
+    """Verilen tahta boyutu için günlük başlığı"""
+    return JOURNAL_HEADER.pack(JOURNAL_MAGIC, JOURNAL_VERSION, shape[0], shape[1])
+
+
+def encode_record(op, value=0, row=0, col=0, snapshot=None):
+    """
+    Tek bir günlük kaydını baytlara çevirir
+
+    Args:
+        op (int): OP_* işlemi
+        value (int): Eklenen sonuç (OP_ADD, OP_PLACE)
+        row (int): Satır (OP_PLACE)
+        col (int): Sütun (OP_PLACE)
+        snapshot (bytes): Oturum verisi (OP_SNAPSHOT)
+
+    Returns:
+        bytes: Kayıt
+    """
+    record = RECORD.pack(op, value, row, col)
+    if op == OP_SNAPSHOT:
+        record += SNAPSHOT_LENGTH.pack(len(snapshot)) + snapshot
+    return record
+
+
+class JournalWriter:
+    """
+    Günlüğe arka planda toplu yazan yazıcı
+
+    append ve reset yalnızca kaydı kuyruğa ekler; yazma, flush ve fsync arka
+    plandaki iş parçacığında FLUSH_INTERVAL aralıklarla toplu yapılır.
+
+    Yazıcı son sıfırlamadan beri eklenen kayıtları sayar; günlük artık yığın
+    halinde oynatılamıyorsa (anlık görüntüyle başlıyorsa ya da araya ekleme
+    dışında bir işlem girdiyse) snapshot_due, çağıranın yeni bir anlık görüntü
+    yazması gerektiğini bildirir.
+    """
+
+    def __init__(self, path, shape):
+        self.path = path
+        self.header = journal_header(shape)
+        self.pending = []
+        self.pending_count = 0
+        self.rewrite = False
+        self.closing = False
+        self.condition = threading.Condition()
+
+        # Son sıfırlamadan beri eklenen kayıtlar ve günlüğün yığın halinde oynatılabilirliği
+        self.records_since_reset = 0
+        self.bulk_replayable = True
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # Boyutu farklı ya da bozuk başlıklı bir dosyanın üzerine yazılır
+        if not os.path.exists(path) or read_header(path) != tuple(shape):
+            self._replace(b"")
+        self.file = open(path, "ab")
+
+        self.thread = threading.Thread(target=self._run, name="journal-writer", daemon=True)
+        self.thread.start()
+
+    def append(self, op, value=0, row=0, col=0):
+        """İşlemi günlüğe ekler (OP_CLEAR dosyayı sıfırlar)"""
+        if op == OP_CLEAR:
+            self.reset()
+            return
+        self.records_since_reset += 1
+        if op != OP_ADD:
+            self.bulk_replayable = False
+        self._enqueue(encode_record(op, value, row, col))
+
+    def snapshot_due(self):
+        """Kurtarmanın hızlı kalması için yeni bir anlık görüntü yazılmalı mı"""
+        return not self.bulk_replayable and self.records_since_reset >= SNAPSHOT_INTERVAL
+
+    def reset(self, snapshot=None):
+        """
+        Günlüğü sıfırlar; önceki tüm kayıtlar geçersiz olur
+
+        Args:
+            snapshot (bytes): Verilirse günlük bu oturum verisiyle başlar
+                              (yükleme ya da kurtarma sonrası), yoksa temizleme kaydıyla
+        """
+        record = encode_record(OP_SNAPSHOT, snapshot=snapshot) if snapshot is not None else encode_record(OP_CLEAR)
+        self.records_since_reset = 0
+        self.bulk_replayable = snapshot is None
+        with self.condition:
+            self.pending = [record]
+            self.pending_count = 1
+            self.rewrite = True
+            self.condition.notify()
+
+    def close(self):
+        """Kuyruktaki kayıtları diske yazar ve yazıcıyı durdurur"""
+        with self.condition:
+            self.closing = True
+            self.condition.notify()
+        self.thread.join()
+        self.file.close()
+
+    def _enqueue(self, record):
+        with self.condition:
+            self.pending.append(record)
+            self.pending_count += 1
+            # Yazıcı ilk kayıtla uyanır, toplu yazmayı bekletmeden dolan kuyrukla da
+            if self.pending_count == 1 or self.pending_count >= FLUSH_BATCH:
+                self.condition.notify()
+
+    def _run(self):
+        """Kuyruğu toplu olarak diske yazan döngü"""
+        while True:
+            with self.condition:
+                while not self.pending and not self.closing:
+                    self.condition.wait()
+                # Kısa bir süre daha kayıt biriktir (tek fsync ile yazılır)
+                if not self.closing and self.pending_count < FLUSH_BATCH:
+                    self.condition.wait(FLUSH_INTERVAL)
+                records, self.pending, self.pending_count = self.pending, [], 0
+                rewrite, self.rewrite = self.rewrite, False
+                closing = self.closing
+
+            if rewrite:
+                self.file.close()
+                self._replace(b"".join(records))
+                self.file = open(self.path, "ab")
+            elif records:
+                self.file.write(b"".join(records))
+                self.file.flush()
+                os.fsync(self.file.fileno())
+
+            if closing and not self.pending:
+                return
+
+    def _replace(self, data):
+        """Günlüğü başlık ve verilen kayıtlarla atomik olarak yeniden yazar"""
+        temporary = self.path + ".tmp"
+        with open(temporary, "wb") as journal_file:
+            journal_file.write(self.header + data)
+            journal_file.flush()
+            os.fsync(journal_file.fileno())
+        os.replace(temporary, self.path)
+
+
+def read_header(path):
+    """Günlüğün tahta boyutu (satır, sütun); günlük değilse None"""
+    with open(path, "rb") as journal_file:
+        data = journal_file.read(JOURNAL_HEADER.size)
+    if len(data) < JOURNAL_HEADER.size:
+        return None
+    magic, version, rows, cols = JOURNAL_HEADER.unpack(data)
+    if magic != JOURNAL_MAGIC or version != JOURNAL_VERSION:
+        return None
+    return rows, cols
+
+
+def read_journal(path):
+    """
+    Günlükteki işlemleri okur
+
+    Args:
+        path (str): Günlük dosyası
+
+    Returns:
+        tuple: (tahta boyutu, işlemler); işlemler (op, value, row, col) demetleri,
+               OP_SNAPSHOT için (op, durum sözlüğü)
+
+    Raises:
+        ValueError: Dosya bir günlük değilse
+    """
+    with open(path, "rb") as journal_file:
+        data = journal_file.read()
+
+    if len(data) < JOURNAL_HEADER.size:
+        raise ValueError("Günlük dosyası değil")
+    magic, version, rows, cols = JOURNAL_HEADER.unpack_from(data)
+    if magic != JOURNAL_MAGIC:
+        raise ValueError("Günlük dosyası değil")
+    if version != JOURNAL_VERSION:
+        raise ValueError(f"Desteklenmeyen günlük sürümü: {version}")
+
+    ops = []
+    offset = JOURNAL_HEADER.size
+    # Yarım kalan son kayıt yok sayılır
+    while offset + RECORD.size <= len(data):
+        op, value, row, col = RECORD.unpack_from(data, offset)
+        offset += RECORD.size
+        if op != OP_SNAPSHOT:
+            ops.append((op, value, row, col))
+            continue
+
+        if offset + SNAPSHOT_LENGTH.size > len(data):
+            break
+        (length,) = SNAPSHOT_LENGTH.unpack_from(data, offset)
+        offset += SNAPSHOT_LENGTH.size
+        if offset + length > len(data):
+            break
+        try:
+            ops.append((op, session_from_bytes(data[offset:offset + length])))
+        except ValueError:
+            break
+        offset += length
+
+    return (rows, cols), ops
+
+
+def recover_state(ops, engine):
+    """
+    Günlük işlemlerini motor üzerinden oynatıp oturum durumunu yeniden kurar
+
+    Son temizleme ya da anlık görüntüden sonraki işlemler kullanılır. Boş
+    tahtadan başlayan P/B butonu eklemelerinin hücreleri el sayısından belli
+    olduğundan bunlar yalnızca sonuçlardan Backtester ile yığın halinde, kalanlar
+    (hücreye tıklama, geri alma, yeniden analiz) AnalysisSession ile arayüzdeki
+    sırayla oynatılır. engine.model_stats yerinde güncellenir.
+
+    Args:
+        ops (list): read_journal işlemleri
+        engine (AnalysisEngine): İstatistikleri güncellenecek motor
+
+    Returns:
+        dict: core.persistence.session_bytes yapısında durum
+    """
+    start = 0
+    for index in range(len(ops) - 1, -1, -1):
+        if ops[index][0] in (OP_CLEAR, OP_SNAPSHOT):
+            start = index
+            break
+
+    # AnalysisSession Hibrit hata ayıklama çıktılarını kapatır; motorun ayarı korunur
+    verbose = engine.models[HYBRID_MODEL].verbose
+    session = AnalysisSession(engine)
+    session.reset()
+    if ops and ops[start][0] == OP_SNAPSHOT:
+        session.load_state(ops[start][1])
+        start += 1
+    else:
+        if ops and ops[start][0] == OP_CLEAR:
+            start += 1
+        outcomes = []
+        for op in ops[start:]:
+            if op[0] != OP_ADD:
+                break
+            outcomes.append(op[1])
+        if outcomes:
+            session.load_state(state_from_outcomes(outcomes, engine))
+            start += len(outcomes)
+
+    for op in ops[start:]:
+        if op[0] == OP_ADD:
+            session.add(op[1])
+        elif op[0] == OP_PLACE:
+            session.add_at(op[2], op[3], op[1])
+        elif op[0] == OP_UNDO:
+            session.undo()
+        elif op[0] == OP_REANALYZE:
+            session.reanalyze()
+
+    engine.models[HYBRID_MODEL].verbose = verbose
+    return session.state()
\ No newline at end of file
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+P ve B Pattern Analiz Uygulaması
+İsteğe bağlı Numba (@njit) çekirdekleri
+
+Numba kuruluysa modellerin sıcak döngüleri başlangıçta derlenmiş çekirdeklere
+yönlendirilir; kurulu değilse modeller NumPy yoluna geri döner. Numba yokken
+çekirdekler sıradan Python fonksiyonlarıdır (yalnızca doğrulama için kullanılır).
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Numba yoksa dekoratör fonksiyonu olduğu gibi döndürür"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda function: function
+
+# Çekirdeklerin kullanılıp kullanılmadığı (başlangıçta Numba varsa açık)
+_kernels_enabled = NUMBA_AVAILABLE
+
+
+def kernels_enabled():
+    """Modellerin çekirdek yolunu kullanıp kullanmayacağı"""
+    return _kernels_enabled
+
+
+def use_kernels(enabled):
+    """
+    Çekirdek yolunu açar/kapatır
+
+    Numba yokken açmak çekirdekleri saf Python olarak çalıştırır (yavaş); bu
+    yalnızca parite doğrulaması için anlamlıdır.
+
+    Args:
+        enabled (bool): Çekirdekler kullanılsın mı
+
+    Returns:
+        bool: Önceki durum
+    """
+    global _kernels_enabled
+    previous = _kernels_enabled
+    _kernels_enabled = bool(enabled)
+    return previous
+
+
+@njit(cache=True)
+def order_followers(cells, order):
+    """
+    Verilen sıradaki boş olmayan değerlerde son iki değerin patternini arar
+
+    ordered_values + BaseAnalysisModel._count_pattern_followers ikilisinin tek
+    geçişlik karşılığıdır.
+
+    Args:
+        cells (numpy.ndarray): (25,) int8 düzleştirilmiş tahta
+        order (numpy.ndarray): Düzleştirilmiş hücre indeksleri
+
+    Returns:
+        tuple: (P sayısı, B sayısı, dolu uzunluk); 3'ten kısa dizilerde sayılar 0
+    """
+    values = np.empty(len(order), dtype=np.int8)
+    length = 0
+    for i in range(len(order)):
+        value = cells[order[i]]
+        if value > 0:
+            values[length] = value
+            length += 1
+
+    p_count = 0
+    b_count = 0
+    if length >= 3:
+        first = values[length - 3]
+        second = values[length - 2]
+        for i in range(length - 2):
+            if values[i] == first and values[i + 1] == second:
+                if values[i + 2] == 1:
+                    p_count += 1
+                elif values[i + 2] == 2:
+                    b_count += 1
+    return p_count, b_count, length
+
+
+@njit(cache=True)
+def order_followers_batch(cells, order):
+    """
+    order_followers çekirdeğinin N tahtalık karşılığı
+
+    Args:
+        cells (numpy.ndarray): (N, 25) int8 düzleştirilmiş tahtalar
+        order (numpy.ndarray): Düzleştirilmiş hücre indeksleri
+
+    Returns:
+        tuple: (P sayıları (N,), B sayıları (N,), dolu uzunluklar (N,))
+    """
+    n = cells.shape[0]
+    p_counts = np.zeros(n, dtype=np.int64)
+    b_counts = np.zeros(n, dtype=np.int64)
+    lengths = np.zeros(n, dtype=np.int64)
+    for i in range(n):
+        p_counts[i], b_counts[i], lengths[i] = order_followers(cells[i], order)
+    return p_counts, b_counts, lengths
+
+
+@njit(cache=True)
+def stencil_vote(p_cells, b_cells, stencils, min_cells):
+    """
+    BaseAnalysisModel._stencil_vote hesabının döngü karşılığı
+
+    Oranlar şekil sırasıyla toplanır; bu, NumPy yolundaki cumsum ile aynı
+    kayan nokta sonucunu verir.
+
+    Args:
+        p_cells (numpy.ndarray): (N, 25) P maskeleri
+        b_cells (numpy.ndarray): (N, 25) B maskeleri
+        stencils (numpy.ndarray): (S, 25) şablon matrisi
+        min_cells (int): Bir şeklin sayılması için gereken dolu hücre sayısı
+
+    Returns:
+        numpy.ndarray: (N,) int8 tahminler (0=belirsiz, 1=P, 2=B)
+    """
+    n = p_cells.shape[0]
+    shape_count, cell_count = stencils.shape
+    predictions = np.zeros(n, dtype=np.int8)
+
+    for i in range(n):
+        p_prob = 0.0
+        b_prob = 0.0
+        total_shapes = 0
+        for s in range(shape_count):
+            p_count = 0
+            b_count = 0
+            for c in range(cell_count):
+                if stencils[s, c] != 0:
+                    if p_cells[i, c]:
+                        p_count += 1
+                    elif b_cells[i, c]:
+                        b_count += 1
+            total = p_count + b_count
+            if total >= min_cells:
+                p_prob += p_count / total
+                b_prob += b_count / total
+                total_shapes += 1
+
+        if total_shapes > 0:
+            p_prob /= total_shapes
+            b_prob /= total_shapes
+            if p_prob > b_prob:
+                predictions[i] = 1
+            elif b_prob > p_prob:
+                predictions[i] = 2
+    return predictions
+
+
+def verify_kernels(samples=2000, seed=0, shape=(5, 5)):
+    """
+    Çekirdek yolunun NumPy yoluyla aynı tahminleri verdiğini doğrular
+
+    Rastgele sonuç dizilerinden arayüzdeki gibi doldurulmuş tahtalar üretilir;
+    çekirdekleri kullanan modeller her iki yolda tek tahta (analyze) ve yığın
+    (analyze_batch) olarak çalıştırılıp karşılaştırılır. Numba yoksa çekirdek
+    yolu aynı fonksiyonları saf Python olarak çalıştırır.
+
+    Args:
+        samples (int): Karşılaştırılacak tahta sayısı
+        seed (int): Rastgele sayı üreteci tohumu
+        shape (tuple): Tahta boyutu (satır, sütun)
+
+    Returns:
+        dict: Model adı -> uyuşmayan tahmin sayısı
+    """
+    # Modeller bu modülü içe aktardığından burada yüklenir
+    from core.backtest import window_boards
+    from models.diagonal import DiagonalAnalysis
+    from models.spiral import SpiralAnalysis
+    from models.zigzag import ZigzagAnalysis
+    from models.lshape import LShapeAnalysis
+    from models.tshape import TShapeAnalysis
+
+    model_classes = [DiagonalAnalysis, SpiralAnalysis, ZigzagAnalysis, LShapeAnalysis, TShapeAnalysis]
+    outcomes = np.random.default_rng(seed).integers(1, 3, samples, dtype=np.int8)
+    boards, last_moves, _ = window_boards(outcomes, shape=shape)
+
+    results = {}
+    previous = kernels_enabled()
+    try:
+        for model_class in model_classes:
+            runs = []
+            for enabled in (False, True):
+                use_kernels(enabled)
+                model = model_class()  # Her yol için boş önbellekli yeni model
+                scalar = []
+                for board, (row, col) in zip(boards, last_moves):
+                    matrix = board.astype(int)
+                    scalar.append(model.analyze(matrix, [(row, col, matrix[row, col])]))
+                runs.append((np.array(scalar), model.analyze_batch(boards, last_moves)))
+
+            (scalar_numpy, batch_numpy), (scalar_kernel, batch_kernel) = runs
+            results[model.name] = int(np.count_nonzero(scalar_numpy != scalar_kernel)
+                                      + np.count_nonzero(batch_numpy != batch_kernel))
+    finally:
+        use_kernels(previous)
+
+    return results
+
+
+if __name__ == "__main__":
+    backend = "Numba" if NUMBA_AVAILABLE else "saf Python (Numba yok)"
+    print(f"Çekirdek doğrulaması: {backend}")
+    for name, mismatches in verify_kernels().items():
+        print(f"{name}: {mismatches} uyuşmazlık")
\ No newline at end of file
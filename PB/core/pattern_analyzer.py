@@ -14,7 +14,7 @@ def analyze_pattern(matrix, pattern_type, params=None):
     Belirtilen pattern tipine göre analiz yapar
     
     Args:
-        matrix (numpy.ndarray): 5x5 matris, 0=boş, 1=W, 2=L
+        matrix (numpy.ndarray): Tahta matrisi (varsayılan 5x5), 0=boş, 1=W, 2=L
         pattern_type (str): Analiz edilecek pattern tipi
         params (dict, optional): Ek parametreler
         
@@ -63,8 +63,9 @@ def analyze_pattern(matrix, pattern_type, params=None):
 def get_rop_patterns(matrix):
     """Matristeki yatay satır patternlerini çıkarır"""
     patterns = []
-    for row in range(5):
-        for col in range(3):  # 3 uzunluğunda patternler için
+    rows, cols = matrix.shape
+    for row in range(rows):
+        for col in range(cols - 2):  # 3 uzunluğunda patternler için
             pattern = []
             for i in range(3):
                 if matrix[row, col + i] > 0:  # Boş olmayan hücreler
@@ -76,8 +77,9 @@ def get_rop_patterns(matrix):
 def get_cob_patterns(matrix):
     """Matristeki dikey sütun patternlerini çıkarır"""
     patterns = []
-    for col in range(5):
-        for row in range(3):  # 3 uzunluğunda patternler için
+    rows, cols = matrix.shape
+    for col in range(cols):
+        for row in range(rows - 2):  # 3 uzunluğunda patternler için
             pattern = []
             for i in range(3):
                 if matrix[row + i, col] > 0:  # Boş olmayan hücreler
@@ -89,10 +91,11 @@ def get_cob_patterns(matrix):
 def get_diagonab_patterns(matrix):
     """Matristeki çapraz patternleri çıkarır"""
     patterns = []
+    rows, cols = matrix.shape
     
     # Sol üstten sağ alta
-    for i in range(3):
-        for j in range(3):
+    for i in range(rows - 2):
+        for j in range(cols - 2):
             pattern = []
             for k in range(3):
                 if matrix[i + k, j + k] > 0:
@@ -101,8 +104,8 @@ def get_diagonab_patterns(matrix):
                 patterns.append(pattern)
     
     # Sağ üstten sol alta
-    for i in range(3):
-        for j in range(2, 5):
+    for i in range(rows - 2):
+        for j in range(2, cols):
             pattern = []
             for k in range(3):
                 if matrix[i + k, j - k] > 0:
@@ -115,6 +118,7 @@ def get_diagonab_patterns(matrix):
 def get_neighbors(matrix, row, col):
     """Belirli bir hücrenin komşularını döndürür"""
     neighbors = []
+    rows, cols = matrix.shape
     directions = [
         (-1, -1), (-1, 0), (-1, 1),
         (0, -1),           (0, 1),
@@ -123,7 +127,7 @@ def get_neighbors(matrix, row, col):
     
     for dr, dc in directions:
         r, c = row + dr, col + dc
-        if 0 <= r < 5 and 0 <= c < 5 and matrix[r, c] > 0:
+        if 0 <= r < rows and 0 <= c < cols and matrix[r, c] > 0:
             neighbors.append(matrix[r, c])
     
     return neighbors
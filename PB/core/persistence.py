@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+P ve B Pattern Analiz Uygulaması
+Oturum kaydetme/yükleme (sürümlü ikili biçim) ve düz metin içe/dışa aktarma
+
+İkili biçim (küçük uçlu):
+    başlık      SESSION_HEADER: sihirli sayı, sürüm, satır, sütun, sonuç sayısı,
+                gerçek sonuç sayısı, geçmiş uzunluğu, model sayısı
+    sonuçlar    2 bit/el paketlenmiş (bir baytta 4 el, ilk el en düşük bitlerde)
+    gerçek      actual_results, aynı şekilde paketlenmiş
+    tahta       satır * sütun bayt (0=boş, 1=P/W, 2=B/L)
+    geçmiş      uint16 hücre indeksleri (satır * sütun sayısı + sütun), ekleme sırasıyla
+    skor tablosu  model başına: ad uzunluğu (uint8), UTF-8 ad, doğru, toplam, başarı oranı (int32)
+    CRC32       önceki tüm baytların sağlaması
+
+Yükleme modelleri çalıştırmaz; tahta, geçmiş ve istatistikler doğrudan geri yüklenir.
+"""
+
+import struct
+import zlib
+import numpy as np
+from core.backtest import Backtester, window_boards
+from core.importer import read_outcomes
+
+SESSION_MAGIC = b"PBSS"
+SESSION_VERSION = 1
+
+SESSION_HEADER = struct.Struct("<4sHBBIIIH")
+SCORE_ENTRY = struct.Struct("<iii")
+CRC_TRAILER = struct.Struct("<I")
+
+# Düz metin biçiminde yazılan semboller (okuma core.importer kurallarıyla)
+TEXT_LETTERS = {1: "W", 2: "L"}
+
+
+def pack_outcomes(values):
+    """
+    1/2 sonuçlarını el başına 2 bit olarak paketler
+
+    Args:
+        values (sequence): 0-3 arası değerler
+
+    Returns:
+        bytes: ceil(N / 4) bayt
+    """
+    values = np.asarray(values, dtype=np.uint8)
+    padded = np.zeros(-(-len(values) // 4) * 4, dtype=np.uint8)
+    padded[:len(values)] = values
+    quads = padded.reshape(-1, 4)
+    packed = quads[:, 0] | (quads[:, 1] << 2) | (quads[:, 2] << 4) | (quads[:, 3] << 6)
+    return packed.astype(np.uint8).tobytes()
+
+
+def unpack_outcomes(data, count):
+    """
+    pack_outcomes çıktısını açar
+
+    Args:
+        data (bytes): Paketlenmiş baytlar
+        count (int): Sonuç sayısı
+
+    Returns:
+        numpy.ndarray: (count,) int8
+    """
+    packed = np.frombuffer(data, dtype=np.uint8)
+    quads = (packed[:, None] >> np.array([0, 2, 4, 6], dtype=np.uint8)) & 3
+    return quads.ravel()[:count].astype(np.int8)
+
+
+def session_bytes(state):
+    """
+    Oturum durumunu ikili biçime çevirir (CRC32 dahil)
+
+    Args:
+        state (dict): 'outcomes', 'actual_results', 'board' (R, C), 'history'
+                      (row, col, value listesi) ve 'model_stats'
+
+    Returns:
+        bytes: Oturum verisi
+    """
+    board = np.asarray(state['board'], dtype=np.int8)
+    rows, cols = board.shape
+    outcomes = state['outcomes']
+    actual_results = state['actual_results']
+    history = state['history']
+    model_stats = state['model_stats']
+
+    parts = [
+        SESSION_HEADER.pack(SESSION_MAGIC, SESSION_VERSION, rows, cols, len(outcomes),
+                            len(actual_results), len(history), len(model_stats)),
+        pack_outcomes(outcomes),
+        pack_outcomes(actual_results),
+        board.tobytes(),
+        np.array([row * cols + col for row, col, _ in history], dtype="<u2").tobytes(),
+    ]
+    for name, stat in model_stats.items():
+        encoded = name.encode("utf-8")
+        parts.append(bytes([len(encoded)]) + encoded)
+        parts.append(SCORE_ENTRY.pack(stat["correct"], stat["total"], stat["success_rate"]))
+
+    payload = b"".join(parts)
+    return payload + CRC_TRAILER.pack(zlib.crc32(payload))
+
+
+def session_from_bytes(data):
+    """
+    session_bytes çıktısını durum sözlüğüne çevirir (modeller çalıştırılmaz)
+
+    Args:
+        data (bytes): Oturum verisi
+
+    Returns:
+        dict: session_bytes'a verilen yapıda durum; 'outcomes' ve 'actual_results'
+              int8 dizileri, 'board' int8 matristir
+
+    Raises:
+        ValueError: Veri bir oturum verisi değilse, sürüm desteklenmiyorsa ya da bozuksa
+    """
+    if len(data) < SESSION_HEADER.size + CRC_TRAILER.size or data[:4] != SESSION_MAGIC:
+        raise ValueError("Oturum dosyası değil")
+    payload, (crc,) = data[:-CRC_TRAILER.size], CRC_TRAILER.unpack(data[-CRC_TRAILER.size:])
+    if zlib.crc32(payload) != crc:
+        raise ValueError("Oturum dosyası bozuk (sağlama uyuşmuyor)")
+
+    (_, version, rows, cols, outcome_count, actual_count,
+     history_length, model_count) = SESSION_HEADER.unpack_from(payload)
+    if version != SESSION_VERSION:
+        raise ValueError(f"Desteklenmeyen oturum sürümü: {version}")
+
+    offset = SESSION_HEADER.size
+    sections = {}
+    for key, count in (("outcomes", outcome_count), ("actual_results", actual_count)):
+        size = -(-count // 4)
+        sections[key] = unpack_outcomes(payload[offset:offset + size], count)
+        offset += size
+
+    board = np.frombuffer(payload, dtype=np.int8, count=rows * cols, offset=offset).reshape(rows, cols).copy()
+    offset += rows * cols
+
+    cells = np.frombuffer(payload, dtype="<u2", count=history_length, offset=offset).tolist()
+    offset += 2 * history_length
+    history = [(cell // cols, cell % cols, int(board[cell // cols, cell % cols])) for cell in cells]
+
+    model_stats = {}
+    for _ in range(model_count):
+        length = payload[offset]
+        name = payload[offset + 1:offset + 1 + length].decode("utf-8")
+        offset += 1 + length
+        correct, total, rate = SCORE_ENTRY.unpack_from(payload, offset)
+        offset += SCORE_ENTRY.size
+        model_stats[name] = {"success_rate": rate, "correct": correct, "total": total}
+
+    return {
+        'outcomes': sections["outcomes"],
+        'actual_results': sections["actual_results"],
+        'board': board,
+        'history': history,
+        'model_stats': model_stats
+    }
+
+
+def save_session(path, state):
+    """
+    Oturum durumunu ikili biçimde kaydeder
+
+    Args:
+        path (str): Dosya yolu
+        state (dict): bkz. session_bytes
+    """
+    data = session_bytes(state)
+    with open(path, "wb") as session_file:
+        session_file.write(data)
+
+
+def load_session(path):
+    """
+    save_session ile kaydedilmiş oturumu okur (modeller çalıştırılmaz)
+
+    Args:
+        path (str): Dosya yolu
+
+    Returns:
+        dict: bkz. session_from_bytes
+
+    Raises:
+        ValueError: Dosya bir oturum dosyası değilse, sürüm desteklenmiyorsa ya da bozuksa
+    """
+    with open(path, "rb") as session_file:
+        return session_from_bytes(session_file.read())
+
+
+def is_session_file(path):
+    """Dosyanın ikili oturum dosyası olup olmadığı (sihirli sayıya göre)"""
+    with open(path, "rb") as session_file:
+        return session_file.read(len(SESSION_MAGIC)) == SESSION_MAGIC
+
+
+def export_text(path, outcomes):
+    """Sonuçları README'deki düz metin biçiminde ("W W L W ...") yazar"""
+    with open(path, "w", encoding="utf-8") as text_file:
+        text_file.write(" ".join(TEXT_LETTERS[int(value)] for value in outcomes) + "\n")
+
+
+def import_text(path):
+    """
+    Düz metin sonuç dosyasını okur (W/L veya P/B; core.importer.parse_shoes kuralları)
+
+    Returns:
+        numpy.ndarray: (N,) int8 sonuçlar, 1=W/P, 2=L/B
+    """
+    return read_outcomes(path)
+
+
+def state_from_outcomes(outcomes, engine):
+    """
+    Yalnızca sonuçları bilinen bir oturumun durumunu yığın halinde yeniden kurar
+
+    Sonuçlar arayüzdeki P/B butonlarıyla sırayla girilmiş gibi Backtester ile
+    oynatılır (modeller yığın halinde ve yalnızca istatistik güncellenen ellerde
+    çalışır); engine.model_stats yerinde güncellenir.
+
+    Args:
+        outcomes (sequence): Sonuçlar, 1=W/P, 2=L/B
+        engine (AnalysisEngine): İstatistikleri güncellenecek motor
+
+    Returns:
+        dict: save_session yapısında durum
+    """
+    outcomes = np.asarray(outcomes, dtype=np.int8)
+    Backtester(engine).replay_stats(outcomes)
+
+    board = engine.empty_board().astype(np.int8)
+    history = []
+    actual_results = outcomes[:0]
+    if len(outcomes):
+        boards, _, counts = window_boards(outcomes, len(outcomes) - 1, len(outcomes), engine.shape)
+        board = boards[0]
+        cols = board.shape[1]
+        history = [(cell // cols, cell % cols, int(board.flat[cell])) for cell in range(int(counts[0]))]
+        # _add_at_position: ilk kaydırmaya kadar her el bir önceki tahminin gerçek sonucudur
+        actual_results = outcomes[1:min(len(outcomes), board.size)]
+
+    return {
+        'outcomes': outcomes,
+        'actual_results': actual_results,
+        'board': board,
+        'history': history,
+        'model_stats': engine.model_stats
+    }
\ No newline at end of file
@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+P ve B Pattern Analiz Uygulaması
+Artımlı baccarat yolları: Bead Plate, Big Road, Big Eye Boy, Small Road, Cockroach Road
+
+Türetilmiş yollar Big Road'un mantıksal sütun yüksekliklerinden (seri uzunlukları)
+hesaplanır; her el yalnızca sabit sayıda sütun yüksekliğine bakar, bu nedenle
+bir el eklemek geçmişin uzunluğundan bağımsız olarak O(1) (amorti) sürer.
+"""
+
+from array import array
+import numpy as np
+
+PLAYER = 1
+BANKER = 2
+
+# Türetilmiş yolların renkleri (kırmızı: düzenli, mavi: düzensiz)
+RED = 1
+BLUE = 2
+
+# Yolların ekrandaki satır sayısı (Big Road 6 satırlık ızgarada gösterilir)
+ROAD_ROWS = 6
+
+# Türetilmiş yollar ve karşılaştırdıkları sütun uzaklığı
+DERIVED_ROADS = (
+    ("big_eye_boy", 1),
+    ("small_road", 2),
+    ("cockroach_road", 3),
+)
+
+
+def derived_color(heights, column, row, offset):
+    """
+    Big Road'un (column, row) hücresine gelen el için türetilmiş yol rengini hesaplar
+
+    Yeni sütunun ilk elinde önceki sütun ile offset kadar soldaki sütunun
+    yükseklikleri karşılaştırılır (eşitse kırmızı). Sütun içindeki ellerde offset
+    kadar soldaki sütuna bakılır: aynı satırda el varsa kırmızı, sütun tam bir
+    önceki satırda bitiyorsa mavi, daha önce bitiyorsa kırmızıdır.
+
+    Yalnızca önceki sütunların yüksekliklerine bakılır; bu yüzden eklenmemiş
+    (varsayımsal) bir el için de aynı fonksiyon kullanılabilir.
+
+    Args:
+        heights (sequence): Big Road sütun yükseklikleri
+        column (int): Elin mantıksal sütunu
+        row (int): Elin sütun içindeki sırası (0 tabanlı)
+        offset (int): Yolun sütun uzaklığı (1=Big Eye Boy, 2=Small Road, 3=Cockroach)
+
+    Returns:
+        int: 0=henüz başlamadı, 1=kırmızı, 2=mavi
+    """
+    if row == 0:
+        if column <= offset:
+            return 0
+        return RED if heights[column - 1] == heights[column - 1 - offset] else BLUE
+
+    if column < offset:
+        return 0
+    left = heights[column - offset]
+    if left == row:
+        return BLUE
+    return RED
+
+
+class RoadLayout:
+    """
+    Bir yolun ekrandaki ızgara yerleşimi (ejderha kuyruğu dahil)
+
+    Seri aşağı doğru uzar; alt satıra ulaşınca ya da alttaki hücre doluysa sağa
+    döner ve seri bitene kadar sağa ilerler. Yeni seri, önceki serinin başladığı
+    sütundan sonraki ilk satırı boş sütunda başlar.
+    """
+
+    __slots__ = ("rows", "cells", "row_index", "col_index", "column_start", "turned", "width")
+
+    def __init__(self, rows=ROAD_ROWS):
+        self.rows = rows
+        self.cells = set()
+        self.row_index = array("i")
+        self.col_index = array("i")
+        self.column_start = -1
+        self.turned = False
+        self.width = 0
+
+    def place(self, new_column):
+        """
+        Sıradaki elin hücresini belirler ve kaydeder
+
+        Args:
+            new_column (bool): El yeni bir seri başlatıyor mu
+
+        Returns:
+            tuple: (satır, sütun)
+        """
+        if new_column or not self.row_index:
+            col = self.column_start + 1
+            while (0, col) in self.cells:
+                col += 1
+            self.column_start = col
+            self.turned = False
+            row = 0
+        else:
+            row, col = self.row_index[-1], self.col_index[-1]
+            if not self.turned and row + 1 < self.rows and (row + 1, col) not in self.cells:
+                row += 1
+            else:
+                # Ejderha kuyruğu: seri bitene kadar sağa
+                self.turned = True
+                col += 1
+
+        self.cells.add((row, col))
+        self.row_index.append(row)
+        self.col_index.append(col)
+        self.width = max(self.width, col + 1)
+        return row, col
+
+
+class Road:
+    """
+    Seri sütunlarına dizilen 1/2 değerlerinden oluşan yol
+
+    Big Road'da değerler P/B, türetilmiş yollarda kırmızı/mavidir. Değerler,
+    sütun yükseklikleri ve ızgara yerleşimi kompakt dizilerde (array) tutulur.
+    """
+
+    __slots__ = ("values", "heights", "layout")
+
+    def __init__(self, rows=ROAD_ROWS):
+        self.values = array("b")
+        self.heights = array("i")
+        self.layout = RoadLayout(rows)
+
+    def __len__(self):
+        return len(self.values)
+
+    def append(self, value):
+        """
+        Yola bir değer ekler
+
+        Args:
+            value (int): 1 veya 2
+
+        Returns:
+            tuple: (mantıksal sütun, sütun içindeki sıra)
+        """
+        new_column = not self.values or self.values[-1] != value
+        if new_column:
+            self.heights.append(1)
+        else:
+            self.heights[-1] += 1
+        self.values.append(value)
+        self.layout.place(new_column)
+        return len(self.heights) - 1, self.heights[-1] - 1
+
+    def next_position(self, value):
+        """Değer eklenseydi alacağı (mantıksal sütun, sıra) konumu"""
+        if not self.values or self.values[-1] != value:
+            return len(self.heights), 0
+        return len(self.heights) - 1, self.heights[-1]
+
+    def to_array(self):
+        """Değerler, (N,) int8"""
+        return np.frombuffer(self.values, dtype=np.int8).copy()
+
+    def column_heights(self):
+        """Mantıksal sütun (seri) uzunlukları, (C,) int32"""
+        return np.frombuffer(self.heights, dtype=np.int32).copy()
+
+    def to_grid(self):
+        """
+        Yolun ekrandaki ızgarası
+
+        Returns:
+            numpy.ndarray: (satır, genişlik) int8, 0=boş
+        """
+        grid = np.zeros((self.layout.rows, self.layout.width), dtype=np.int8)
+        grid[np.frombuffer(self.layout.row_index, dtype=np.int32),
+             np.frombuffer(self.layout.col_index, dtype=np.int32)] = self.to_array()
+        return grid
+
+
+class RoadTracker:
+    """
+    Big Road ve türetilmiş yolları el el güncelleyen izleyici
+
+    Yalnızca P (1) ve B (2) sonuçları yollara girer; beraberlik ve diğer
+    değerler sayılır ama yolları değiştirmez.
+    """
+
+    def __init__(self, rows=ROAD_ROWS):
+        self.rows = rows
+        self.big_road = Road(rows)
+        self.derived = {name: Road(rows) for name, _ in DERIVED_ROADS}
+        self.ties = 0
+
+    @classmethod
+    def from_outcomes(cls, outcomes, rows=ROAD_ROWS):
+        """Sonuç dizisinden yolları oluşturur"""
+        tracker = cls(rows)
+        tracker.extend(outcomes)
+        return tracker
+
+    def reset(self):
+        """Tüm yolları boşaltır"""
+        self.__init__(self.rows)
+
+    def add(self, outcome):
+        """
+        Bir el ekler ve türetilmiş yolları günceller
+
+        Args:
+            outcome (int): 1=P, 2=B (diğer değerler beraberlik sayılır)
+
+        Returns:
+            bool: El yollara eklendi mi
+        """
+        if outcome != PLAYER and outcome != BANKER:
+            self.ties += 1
+            return False
+
+        column, row = self.big_road.append(outcome)
+        heights = self.big_road.heights
+        for name, offset in DERIVED_ROADS:
+            color = derived_color(heights, column, row, offset)
+            if color:
+                self.derived[name].append(color)
+        return True
+
+    def extend(self, outcomes):
+        """Sonuçları sırayla ekler"""
+        for outcome in outcomes:
+            self.add(int(outcome))
+
+    def next_colors(self, outcome):
+        """
+        Sıradaki el verilen sonuç olsaydı türetilmiş yollara eklenecek renkler
+
+        Yollar değiştirilmez (masalardaki "ask road" göstergesi).
+
+        Args:
+            outcome (int): 1=P, 2=B
+
+        Returns:
+            dict: Yol adı -> renk (0=henüz başlamadı, 1=kırmızı, 2=mavi)
+        """
+        column, row = self.big_road.next_position(outcome)
+        heights = self.big_road.heights
+        return {name: derived_color(heights, column, row, offset) for name, offset in DERIVED_ROADS}
+
+    def bead_plate(self):
+        """
+        Bead Plate: sonuçlar sırayla, sütun sütun yukarıdan aşağı
+
+        Returns:
+            numpy.ndarray: (satır, sütun) int8, 0=boş
+        """
+        values = self.big_road.to_array()
+        columns = max(1, -(-len(values) // self.rows))
+        plate = np.zeros(columns * self.rows, dtype=np.int8)
+        plate[:len(values)] = values
+        return plate.reshape(columns, self.rows).T
+
+    def roads(self):
+        """
+        Tüm yolların değer dizileri
+
+        Returns:
+            dict: 'big_road' ve türetilmiş yol adları -> (N,) int8
+        """
+        arrays = {"big_road": self.big_road.to_array()}
+        for name, road in self.derived.items():
+            arrays[name] = road.to_array()
+        return arrays
+
+    def grids(self):
+        """
+        Tüm yolların ızgaraları (arayüzde gösterim için)
+
+        Returns:
+            dict: 'bead_plate', 'big_road' ve türetilmiş yol adları -> (satır, sütun) int8
+        """
+        grids = {"bead_plate": self.bead_plate(), "big_road": self.big_road.to_grid()}
+        for name, road in self.derived.items():
+            grids[name] = road.to_grid()
+        return grids
\ No newline at end of file
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+P ve B Pattern Analiz Uygulaması
+Çok süreçli backtest çalıştırıcısı (shoe dosyaları dizini ya da derlem dosyası üzerinde)
+"""
+
+import os
+import glob
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from core.backtest import Backtester
+from core.corpus import Corpus
+from core.importer import read_outcomes
+
+# Her süreçte bir kez oluşturulan backtest motoru (_init_worker)
+_worker_backtester = None
+
+
+def find_shoe_files(directory, pattern="*.txt"):
+    """Dizindeki shoe dosyalarını sıralı olarak listeler"""
+    return sorted(glob.glob(os.path.join(directory, pattern)))
+
+
+def empty_counters():
+    """Boş birleştirilebilir sonuç sayaçları"""
+    return {"shoes": 0, "hands": 0, "models": {}, "empty": []}
+
+
+def merge_counters(left, right):
+    """
+    İki sonuç sayacını birleştirir
+
+    Model başına {"correct", "total"} sayaçları toplanır; işlem birleşmeli ve
+    değişmeli olduğundan kısmi sonuçlar hangi sırayla gelirse gelsin aynı toplam
+    elde edilir.
+
+    Args:
+        left (dict): {"shoes", "hands", "models": {model adı: {"correct", "total"}},
+                      "empty": el bulunamayan dosyalar}
+        right (dict): Aynı yapıda ikinci sayaç
+
+    Returns:
+        dict: Yeni toplam sayaç (girdiler değiştirilmez)
+    """
+    models = {name: dict(counter) for name, counter in left["models"].items()}
+    for name, counter in right["models"].items():
+        merged = models.setdefault(name, {"correct": 0, "total": 0})
+        merged["correct"] += counter["correct"]
+        merged["total"] += counter["total"]
+
+    return {
+        "shoes": left["shoes"] + right["shoes"],
+        "hands": left["hands"] + right["hands"],
+        "models": models,
+        "empty": left["empty"] + right["empty"]
+    }
+
+
+def counter_accuracy(counters):
+    """Model başına isabet oranını (0-1) döndürür"""
+    return {name: (counter["correct"] / counter["total"] if counter["total"] > 0 else 0.0)
+            for name, counter in counters["models"].items()}
+
+
+def _init_worker():
+    """Her işçi süreçte modelleri bir kez oluşturur"""
+    global _worker_backtester
+    _worker_backtester = Backtester()
+
+
+def backtest_shard(paths):
+    """
+    Bir grup shoe dosyasını sırayla oynatır ve kısmi sayaçları döndürür
+
+    Her shoe ayrı bir oturum gibi, sıfırlanmış istatistiklerle oynatılır.
+    Dosyalar core.importer kurallarıyla (P/B ya da W/L) okunur; hiç el
+    bulunamayan dosyalar sayaçların 'empty' listesinde raporlanır.
+
+    Args:
+        paths (list): Shoe dosya yolları
+
+    Returns:
+        dict: Bu grubun sonuç sayaçları
+    """
+    shoes = [read_outcomes(path) for path in paths]
+    counters = _backtest_shoes(shoes)
+    counters["empty"] = [path for path, outcomes in zip(paths, shoes) if len(outcomes) == 0]
+    return counters
+
+
+def backtest_corpus_shard(path, start, stop):
+    """
+    Derlemdeki bir shoe aralığını oynatır ve kısmi sayaçları döndürür
+
+    İşçi derlemi kendisi eşler; shoe'lar süreçler arasında kopyalanmaz.
+
+    Args:
+        path (str): Derlem dosyası
+        start (int): İlk shoe
+        stop (int): Son shoe (hariç)
+
+    Returns:
+        dict: Bu aralığın sonuç sayaçları
+    """
+    with Corpus(path) as corpus:
+        return _backtest_shoes(corpus.shoes(start, stop))
+
+
+def _backtest_shoes(shoes):
+    """Her shoe'yu sıfırlanmış istatistiklerle oynatır ve sayaçları toplar"""
+    backtester = _worker_backtester if _worker_backtester is not None else Backtester()
+    counters = empty_counters()
+
+    for outcomes in shoes:
+        if len(outcomes) == 0:
+            continue
+
+        summary = backtester.run(outcomes)['summary']
+        shoe_counters = {
+            "shoes": 1,
+            "hands": len(outcomes),
+            "models": {name: {"correct": result["correct"], "total": result["total"]}
+                       for name, result in summary.items()},
+            "empty": []
+        }
+        counters = merge_counters(counters, shoe_counters)
+
+    return counters
+
+
+class BacktestRunner:
+    """
+    Shoe dosyalarını ya da derlemdeki shoe'ları süreçlere dağıtarak backtest yapan çalıştırıcı
+
+    Dosyalar (ya da derlemdeki shoe'lar) shard_size'lık gruplara bölünür; her
+    grup bir işçi süreçte oynatılır ve kısmi sonuçlar tamamlandıkça geri akar.
+    """
+
+    def __init__(self, jobs=None, shard_size=32):
+        self.jobs = jobs or os.cpu_count() or 1
+        self.shard_size = shard_size
+
+    def shards(self, paths):
+        """Dosya listesini shard_size'lık gruplara böler"""
+        return [paths[i:i + self.shard_size] for i in range(0, len(paths), self.shard_size)]
+
+    def iter_results(self, paths):
+        """
+        Kısmi sonuçları tamamlanma sırasıyla üretir
+
+        Args:
+            paths (list): Shoe dosya yolları
+
+        Yields:
+            dict: Bir grubun sonuç sayaçları
+        """
+        return self._iter_tasks(backtest_shard, [(shard,) for shard in self.shards(list(paths))])
+
+    def iter_corpus_results(self, path):
+        """
+        Derlem için kısmi sonuçları tamamlanma sırasıyla üretir
+
+        Args:
+            path (str): Derlem dosyası
+
+        Yields:
+            dict: Bir shoe aralığının sonuç sayaçları
+        """
+        with Corpus(path) as corpus:
+            shoe_count = len(corpus)
+        tasks = [(path, start, min(start + self.shard_size, shoe_count))
+                 for start in range(0, shoe_count, self.shard_size)]
+        return self._iter_tasks(backtest_corpus_shard, tasks)
+
+    def _iter_tasks(self, function, tasks):
+        """Görevleri işçilerde çalıştırır ve sonuçları tamamlanma sırasıyla üretir"""
+        # Tek işçi için süreç havuzu kurmaya gerek yok
+        if self.jobs == 1:
+            for task in tasks:
+                yield function(*task)
+            return
+
+        with ProcessPoolExecutor(max_workers=self.jobs, initializer=_init_worker) as executor:
+            futures = [executor.submit(function, *task) for task in tasks]
+            for future in as_completed(futures):
+                yield future.result()
+
+    def run(self, paths, callback=None):
+        """
+        Tüm shoe dosyalarını oynatır ve sonuçları birleştirir
+
+        Args:
+            paths (list): Shoe dosya yolları
+            callback (callable, optional): Her kısmi sonuçtan sonra o ana kadarki
+                toplamla çağrılır (ilerleme bildirimi için)
+
+        Returns:
+            dict: Toplam sonuç sayaçları
+        """
+        return self._collect(self.iter_results(paths), callback)
+
+    def run_corpus(self, path, callback=None):
+        """
+        Derlemdeki tüm shoe'ları oynatır ve sonuçları birleştirir
+
+        Args:
+            path (str): Derlem dosyası
+            callback (callable, optional): bkz. run
+
+        Returns:
+            dict: Toplam sonuç sayaçları
+        """
+        return self._collect(self.iter_corpus_results(path), callback)
+
+    def _collect(self, partials, callback):
+        """Kısmi sonuçları birleştirir"""
+        total = empty_counters()
+        for partial in partials:
+            total = merge_counters(total, partial)
+            if callback is not None:
+                callback(total)
+        return total
+
+    def run_directory(self, directory, pattern="*.txt", callback=None):
+        """Bir dizindeki tüm shoe dosyalarını oynatır"""
+        return self.run(find_shoe_files(directory, pattern), callback)
\ No newline at end of file
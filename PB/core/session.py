@@ -0,0 +1,365 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+P ve B Pattern Analiz Uygulaması
+Arayüzsüz analiz oturumu (tek masa)
+"""
+
+import sys
+from array import array
+import numpy as np
+from core.engine import (AnalysisEngine, COMBINED_MODEL, HYBRID_MODEL, LEAF_MODEL_NAMES,
+                         MIN_RATED_PREDICTIONS)
+from core.features import BoardFeatures
+from models.scatter import ScatterState
+
+# Analizin başlaması için gereken minimum girdi (WLPatternAnalyzer._perform_analysis)
+MIN_HISTORY = 5
+
+# TableSession istatistik dizisindeki model sırası (model kimliği = indeks)
+MODEL_NAMES = LEAF_MODEL_NAMES + [COMBINED_MODEL, HYBRID_MODEL]
+MODEL_IDS = {name: model_id for model_id, name in enumerate(MODEL_NAMES)}
+
+# İstatistik dizisinin sütunları
+CORRECT = 0
+TOTAL = 1
+
+
+def success_rate(correct, total):
+    """record_prediction ile aynı başarı oranı (en az 3 tahminden sonra, aksi halde 50)"""
+    if total >= MIN_RATED_PREDICTIONS:
+        return int((correct / total) * 100)
+    return 50
+
+
+def stats_to_dict(stats):
+    """
+    int32 istatistik dizisini arayüzdeki model_stats sözlüğüne çevirir
+
+    Args:
+        stats (numpy.ndarray): (model sayısı, 2) [doğru, toplam]
+
+    Returns:
+        dict: Model adı -> {"success_rate", "correct", "total"}
+    """
+    return {name: {"success_rate": success_rate(correct, total), "correct": correct, "total": total}
+            for name, (correct, total) in zip(MODEL_NAMES, stats.tolist())}
+
+
+class AnalysisSession:
+    """
+    Sonuçları tek tek alıp analiz eden arayüzsüz oturum
+
+    Matrisin doldurulması/kaydırılması, history/actual_results takibi ve
+    istatistik güncellemeleri WLPatternAnalyzer._add_selection,
+    _shift_matrix_up, _add_at_position ve _perform_analysis ile birebir aynıdır.
+    """
+
+    def __init__(self, engine=None):
+        self.engine = engine if engine is not None else AnalysisEngine()
+        # Hibrit modelin hata ayıklama çıktıları arayüzsüz çalışmada kapatılır
+        self.engine.models[HYBRID_MODEL].verbose = False
+        self.matrix_data = self.engine.empty_board()
+        self.history = []
+        self.actual_results = []
+        # Girilen tüm sonuçlar (kaydırmadan etkilenmez, WLPatternAnalyzer.outcomes)
+        self.outcomes = []
+        self.hands = 0
+        # Serpme modelinin tahtayla birlikte güncellenen artımlı durumu
+        self.scatter_state = ScatterState(self.engine.shape)
+
+    @property
+    def model_stats(self):
+        """Motorun model istatistikleri"""
+        return self.engine.model_stats
+
+    def reset(self):
+        """Tahtayı, geçmişi ve istatistikleri temizler"""
+        self.matrix_data = self.engine.empty_board()
+        self.history = []
+        self.actual_results = []
+        self.outcomes = []
+        self.hands = 0
+        self.scatter_state = ScatterState(self.engine.shape)
+        self.engine.reset_stats()
+
+    def state(self):
+        """Oturumun kaydedilebilir durumu (bkz. core.persistence.session_bytes)"""
+        return {
+            'outcomes': list(self.outcomes),
+            'actual_results': list(self.actual_results),
+            'board': self.matrix_data.copy(),
+            'history': list(self.history),
+            'model_stats': {name: dict(stat) for name, stat in self.model_stats.items()}
+        }
+
+    def load_state(self, state):
+        """
+        Kaydedilmiş durumu geri yükler (modeller çalıştırılmaz)
+
+        Args:
+            state (dict): state() ya da core.persistence.load_session sonucu
+
+        Raises:
+            ValueError: Tahta boyutu motorunkinden farklıysa
+        """
+        board = np.asarray(state['board'])
+        if board.shape != self.engine.shape:
+            raise ValueError(f"Tahta boyutu uyuşmuyor: {board.shape}")
+
+        model_stats = {name: dict(stat) for name, stat in state['model_stats'].items()}
+        self.matrix_data = self.engine.empty_board()
+        self.matrix_data[:] = board
+        self.history = list(state['history'])
+        self.actual_results = np.asarray(state['actual_results']).tolist()
+        self.outcomes = np.asarray(state['outcomes']).tolist()
+        self.hands = len(self.outcomes)
+        self.scatter_state = ScatterState.from_matrix(self.matrix_data)
+
+        # engine.model_stats yerinde güncellenir (arayüz aynı sözlüğü tutar)
+        self.engine.reset_stats()
+        for model_name, stat in model_stats.items():
+            if model_name in self.model_stats:
+                self.model_stats[model_name] = stat
+
+    def add(self, value):
+        """
+        Sıradaki sonucu ilk boş hücreye ekler ve analiz yapar
+
+        Args:
+            value (int): 1=P, 2=B
+
+        Returns:
+            dict: AnalysisEngine.analyze sonucu ('predictions', 'hibrit_confidence');
+                  yeterli veri yoksa None
+        """
+        self.hands += 1
+
+        # Matris doluysa ilk satırı sil ve diğer verileri yukarı kaydır
+        if 0 not in self.matrix_data:
+            self._shift_matrix_up()
+
+        # İlk boş hücre (satır satır)
+        empty = np.flatnonzero(self.matrix_data == 0)
+        row, col = divmod(int(empty[0]), self.matrix_data.shape[1])
+        return self._add_at_position(row, col, value)
+
+    def add_at(self, row, col, value):
+        """
+        Sonucu verilen hücreye ekler (WLPatternAnalyzer._on_cell_clicked)
+
+        Returns:
+            dict: add ile aynı
+        """
+        self.hands += 1
+        return self._add_at_position(row, col, value)
+
+    def undo(self):
+        """
+        Son eklenen değeri geri alır (WLPatternAnalyzer._on_undo_clicked)
+
+        Returns:
+            dict: Kalan geçmişle yapılan analiz; geçmiş boşsa ya da yetersizse None
+        """
+        if not self.history:
+            return None
+
+        row, col, value = self.history.pop()
+        if self.outcomes:
+            self.outcomes.pop()
+            self.hands -= 1
+        self.matrix_data[row, col] = 0
+        self.scatter_state.remove(row, col, value)
+
+        # Son eklenen bir gerçek sonuçsa onu da kaldır
+        if len(self.actual_results) > 0 and len(self.history) < len(self.actual_results):
+            self.actual_results.pop()
+
+        if not self.history:
+            return None
+        return self._perform_analysis()
+
+    def reanalyze(self):
+        """Aynı tahtayla analizi tekrarlar (arayüzde model seçimi değiştiğinde)"""
+        if not self.history:
+            return None
+        return self._perform_analysis()
+
+    def _shift_matrix_up(self):
+        """Matrisi bir satır yukarı kaydırır ve ilk satırdaki geçmişi siler"""
+        self.matrix_data[:-1] = self.matrix_data[1:]
+        self.matrix_data[-1] = 0
+        self.history = [(row - 1, col, value) for row, col, value in self.history if row > 0]
+        self.scatter_state.shift_up()
+
+    def _add_at_position(self, row, col, value):
+        """Değeri verilen hücreye yazar ve analiz yapar"""
+        # Zaten bir tahmin yapılmışsa, onu gerçek sonuç olarak kaydet
+        if self.history and len(self.history) > len(self.actual_results):
+            self.actual_results.append(value)
+
+        self.matrix_data[row, col] = value
+        self.scatter_state.add(row, col, value)
+        self.history.append((row, col, value))
+        self.outcomes.append(value)
+        return self._perform_analysis()
+
+    def _perform_analysis(self):
+        """Tüm modellerle analiz yapar (yeterli veri yoksa None)"""
+        if len(self.history) < MIN_HISTORY:
+            return None
+
+        # Bir önceki tahmin için gerçek sonuç girilmişse, başarıyı ölç
+        actual = None
+        if len(self.actual_results) > 0 and len(self.history) > len(self.actual_results):
+            actual = self.actual_results[-1]
+
+        return self.engine.analyze(self.matrix_data, self.history, actual, self.scatter_state)
+
+
+class TableSession:
+    """
+    Çok masalı kullanım için küçük bellekli masa oturumu
+
+    AnalysisSession ile aynı sonuçları üretir; farklı olarak tahta int8, geçmiş
+    sabit kapasiteli bir halka tampondaki hücre indeksleri, gerçek sonuç listesi
+    iki sayaç ve model istatistikleri model kimliğiyle indekslenen bir int32
+    dizisidir. Modeller ve önbellekleri masalar arasında paylaşılan motordadır.
+    """
+
+    __slots__ = ("engine", "board", "ring", "head", "length", "actual_count", "last_actual",
+                 "hands", "stats", "scatter")
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.engine.models[HYBRID_MODEL].verbose = False
+        self.board = np.zeros(engine.shape, dtype=np.int8)
+        # Geçmiş: doldurulma sırasıyla hücre indeksleri (halka tampon, kapasite = hücre sayısı)
+        self.ring = array("H", bytes(2 * self.board.size))
+        self.head = 0
+        self.length = 0
+        # WLPatternAnalyzer.actual_results yerine uzunluğu ve son elemanı
+        self.actual_count = 0
+        self.last_actual = 0
+        self.hands = 0
+        self.stats = np.zeros((len(MODEL_NAMES), 2), dtype=np.int32)
+        # Serpme modelinin artımlı durumu (bkz. AnalysisSession.scatter_state)
+        self.scatter = ScatterState(engine.shape)
+
+    @property
+    def model_stats(self):
+        """İstatistikler, model adı -> {"success_rate", "correct", "total"}"""
+        return stats_to_dict(self.stats)
+
+    @property
+    def history(self):
+        """Geçmiş hamlelerin listesi (row, col, value), AnalysisSession.history ile aynı"""
+        cols = self.board.shape[1]
+        capacity = len(self.ring)
+        flat = self.board.ravel()
+        moves = []
+        for i in range(self.length):
+            cell = self.ring[(self.head + i) % capacity]
+            moves.append((cell // cols, cell % cols, int(flat[cell])))
+        return moves
+
+    def reset(self):
+        """Tahtayı, geçmişi ve istatistikleri temizler"""
+        self.board[:] = 0
+        self.head = 0
+        self.length = 0
+        self.actual_count = 0
+        self.last_actual = 0
+        self.hands = 0
+        self.stats[:] = 0
+        self.scatter = ScatterState(self.engine.shape)
+
+    def memory_usage(self):
+        """Masaya ait nesnelerin yaklaşık bellek kullanımı (bayt, paylaşılan motor hariç)"""
+        return (sys.getsizeof(self) + sys.getsizeof(self.board) + sys.getsizeof(self.ring)
+                + sys.getsizeof(self.stats) + sys.getsizeof(self.scatter.masks))
+
+    def add(self, value):
+        """
+        Sıradaki sonucu ilk boş hücreye ekler ve analiz yapar
+
+        Args:
+            value (int): 1=P, 2=B
+
+        Returns:
+            dict: 'predictions' (model adı -> tahmin) ve 'hibrit_confidence';
+                  yeterli veri yoksa None
+        """
+        self.hands += 1
+        cells = self.board.size
+
+        # Matris doluysa ilk satırı sil ve diğer verileri yukarı kaydır
+        if self.length == cells:
+            self._shift_up()
+
+        # Hücreler satır satır doldurulduğundan ilk boş hücre geçmiş uzunluğudur
+        cell = self.length
+
+        # Zaten bir tahmin yapılmışsa, onu gerçek sonuç olarak kaydet
+        if self.length and self.length > self.actual_count:
+            self.actual_count += 1
+            self.last_actual = value
+
+        self.board.flat[cell] = value
+        self.scatter.add(*divmod(cell, self.board.shape[1]), value)
+        self.ring[(self.head + self.length) % cells] = cell
+        self.length += 1
+        return self._perform_analysis()
+
+    def _shift_up(self):
+        """Tahtayı bir satır yukarı kaydırır; ilk satırdaki hamleler geçmişten düşer"""
+        cols = self.board.shape[1]
+        capacity = len(self.ring)
+        self.board[:-1] = self.board[1:]
+        self.board[-1] = 0
+        self.scatter.shift_up()
+
+        # En eski hamleler ilk satırdadır: baş ileri alınır, kalanların satırı bir azalır
+        self.head = (self.head + cols) % capacity
+        self.length -= cols
+        for i in range(self.length):
+            self.ring[(self.head + i) % capacity] -= cols
+
+    def _perform_analysis(self):
+        """Tüm modellerle analiz yapar ve istatistik dizisini günceller"""
+        if self.length < MIN_HISTORY:
+            return None
+
+        actual = None
+        if self.actual_count > 0 and self.length > self.actual_count:
+            actual = self.last_actual
+
+        engine = self.engine
+        history = self.history
+        features = BoardFeatures(self.board, history)
+        predictions = engine.predict(self.board, history, features, self.scatter)
+
+        # Önce diğer modellerin istatistiklerini güncelle
+        if actual is not None:
+            self._record([predictions[name] for name in MODEL_NAMES[:-1]], actual, 0)
+
+        prediction, hibrit_confidence = engine._analyze_hybrid(
+            self.board, history, predictions, features, self.model_stats)
+        predictions[HYBRID_MODEL] = prediction
+
+        if actual is not None:
+            self._record([prediction], actual, MODEL_IDS[HYBRID_MODEL])
+
+        return {
+            'predictions': predictions,
+            'hibrit_confidence': hibrit_confidence
+        }
+
+    def _record(self, predictions, actual, first_id):
+        """first_id'den başlayan modellerin tahminlerini istatistik dizisine işler"""
+        predictions = np.asarray(predictions, dtype=np.int8)
+        rows = self.stats[first_id:first_id + len(predictions)]
+        made = predictions != 0
+        rows[:, TOTAL] += made
+        rows[:, CORRECT] += made & (predictions == actual)
\ No newline at end of file
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+P ve B Pattern Analiz Uygulaması
+Masa kimliğiyle anahtarlanan çok masalı oturum kaydı
+"""
+
+from core.engine import AnalysisEngine, BOARD_SHAPE
+from core.session import TableSession
+
+# Her işçi süreçte bir kez oluşturulan kayıt (init_worker)
+_worker_registry = None
+
+
+def analysis_result(table_id, session, analysis):
+    """
+    Bir masanın son analizini JSON'a uygun sözlüğe çevirir
+
+    Args:
+        table_id (str): Masa kimliği
+        session (TableSession): Masanın oturumu
+        analysis (dict): TableSession.add sonucu (yetersiz veride None)
+
+    Returns:
+        dict: 'table', 'hands', 'predictions' (model adı -> 0/1/2, yetersiz veride
+              None) ve 'hibrit_confidence'
+    """
+    result = {"table": table_id, "hands": session.hands, "predictions": None, "hibrit_confidence": None}
+    if analysis is not None:
+        result["predictions"] = {name: int(prediction) for name, prediction in analysis['predictions'].items()}
+        result["hibrit_confidence"] = round(float(analysis['hibrit_confidence']), 4)
+    return result
+
+
+class TableRegistry:
+    """
+    Masa kimliği -> analiz oturumu kaydı
+
+    Tüm masalar tek bir motoru (model nesneleri ve tahmin önbellekleri) paylaşır;
+    her masanın yalnızca tahtası, geçmişi ve istatistikleri ayrı bir
+    TableSession'da tutulur.
+    """
+
+    def __init__(self, shape=BOARD_SHAPE):
+        self.engine = AnalysisEngine(shape)
+        self.tables = {}
+
+    def session(self, table_id):
+        """Masanın oturumunu döndürür (yoksa oluşturur)"""
+        session = self.tables.get(table_id)
+        if session is None:
+            session = TableSession(self.engine)
+            self.tables[table_id] = session
+        return session
+
+    def add(self, table_id, outcomes):
+        """
+        Masaya sonuçları sırayla ekler
+
+        Args:
+            table_id (str): Masa kimliği
+            outcomes (list): Sonuçlar, 1=P, 2=B
+
+        Returns:
+            dict: Son elden sonraki analiz (bkz. analysis_result)
+        """
+        session = self.session(table_id)
+        analysis = None
+        for value in outcomes:
+            analysis = session.add(value)
+        return analysis_result(table_id, session, analysis)
+
+    def state(self, table_id):
+        """Masanın el sayısı ve model istatistikleri (masa yoksa None)"""
+        session = self.tables.get(table_id)
+        if session is None:
+            return None
+        return {"table": table_id, "hands": session.hands, "model_stats": session.model_stats}
+
+    def drop(self, table_id):
+        """Masayı kayıttan siler; masa var mıydı"""
+        return self.tables.pop(table_id, None) is not None
+
+    def count(self):
+        """Kayıtlı masa sayısı"""
+        return len(self.tables)
+
+
+def init_worker(shape=BOARD_SHAPE):
+    """İşçide masa kaydını bir kez oluşturur"""
+    global _worker_registry
+    _worker_registry = TableRegistry(shape)
+
+
+def worker_call(method, *args):
+    """
+    İşçideki kaydın bir metodunu çağırır (yürütücüye gönderilen iş)
+
+    Args:
+        method (str): TableRegistry metod adı ('add', 'state', 'drop', 'count')
+        *args: Metod argümanları
+
+    Returns:
+        Metodun sonucu
+    """
+    return getattr(_worker_registry, method)(*args)
\ No newline at end of file
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+P ve B Pattern Analiz Uygulaması
+Önceden derlenmiş gezinme (traversal) indeks tabloları
+"""
+
+import numpy as np
+
+BOARD_SIZE = 5
+
+
+def _flat(row, col, cols=BOARD_SIZE):
+    """(satır, sütun) konumunu düzleştirilmiş indekse çevirir"""
+    return row * cols + col
+
+
+def build_spiral_order(rows=BOARD_SIZE, cols=BOARD_SIZE):
+    """Dıştan içe spiral sırasını oluşturur"""
+    order = []
+    row_start, col_start = 0, 0
+    row_end, col_end = rows-1, cols-1
+    
+    while row_start <= row_end and col_start <= col_end:
+        # Üst satır
+        for i in range(col_start, col_end + 1):
+            order.append(_flat(row_start, i, cols))
+        row_start += 1
+        
+        # Sağ sütun
+        for i in range(row_start, row_end + 1):
+            order.append(_flat(i, col_end, cols))
+        col_end -= 1
+        
+        # Alt satır
+        if row_start <= row_end:
+            for i in range(col_end, col_start - 1, -1):
+                order.append(_flat(row_end, i, cols))
+            row_end -= 1
+        
+        # Sol sütun
+        if col_start <= col_end:
+            for i in range(row_end, row_start - 1, -1):
+                order.append(_flat(i, col_start, cols))
+            col_start += 1
+    
+    return np.array(order, dtype=np.intp)
+
+
+def build_zigzag_orders(rows=BOARD_SIZE, cols=BOARD_SIZE):
+    """Yatay, dikey ve çapraz zig-zag sıralarını oluşturur"""
+    # Yatay zigzag (soldan sağa, sağdan sola alternatif olarak)
+    horizontal = []
+    for row in range(rows):
+        line = range(cols) if row % 2 == 0 else range(cols-1, -1, -1)
+        horizontal.extend(_flat(row, col, cols) for col in line)
+    
+    # Dikey zigzag (yukarıdan aşağı, aşağıdan yukarı alternatif olarak)
+    vertical = []
+    for col in range(cols):
+        line = range(rows) if col % 2 == 0 else range(rows-1, -1, -1)
+        vertical.extend(_flat(row, col, cols) for row in line)
+    
+    # Çapraz zigzag (ana köşegen, ardından ters köşegen yukarı doğru; kare olmayan
+    # tahtalarda kısa kenar uzunluğunda)
+    size = min(rows, cols)
+    diagonal = [_flat(i, i, cols) for i in range(size)]
+    diagonal.extend(_flat(i, cols-1-i, cols) for i in range(size-2, -1, -1))
+    
+    return [np.array(order, dtype=np.intp) for order in (horizontal, vertical, diagonal)]
+
+
+def build_diagonal_lines(rows=BOARD_SIZE, cols=BOARD_SIZE, min_length=3):
+    """
+    Ana köşegen ve ters köşegen paralellerini oluşturur
+    
+    np.diag(matrix, offset) ve np.diag(np.fliplr(matrix), offset) ile aynı sırada,
+    sadece min_length uzunluğundaki çaprazlar tutulur.
+    """
+    lines = []
+    
+    # Ana köşegen ve paralelleri (sol üst - sağ alt)
+    for offset in range(-(rows-1), cols):
+        line = [_flat(i, i + offset, cols) for i in range(rows) if 0 <= i + offset < cols]
+        if len(line) >= min_length:
+            lines.append(line)
+    
+    # Ters köşegen ve paralelleri (sağ üst - sol alt)
+    for offset in range(-(rows-1), cols):
+        line = [_flat(i, cols-1-i-offset, cols) for i in range(rows) if 0 <= i + offset < cols]
+        if len(line) >= min_length:
+            lines.append(line)
+    
+    return [np.array(line, dtype=np.intp) for line in lines]
+
+
+def stencil_matrix(shapes, cell_count=BOARD_SIZE * BOARD_SIZE):
+    """
+    Şekillerin hücre indeks listelerini (şekil sayısı x hücre sayısı) şablon matrisine çevirir
+    
+    Bir tahtanın düzleştirilmiş maskesiyle matris-vektör çarpımı her şekildeki
+    işaretli hücre sayısını verir.
+    
+    Returns:
+        numpy.ndarray: 0/1 değerli float64 şablon matrisi
+    """
+    stencils = np.zeros((len(shapes), cell_count))
+    for i, cells in enumerate(shapes):
+        stencils[i, cells] = 1
+    return stencils
+
+
+def ordered_values(matrix, order):
+    """
+    Verilen sırada boş olmayan hücre değerlerini döndürür (tek gather + maske)
+    
+    Args:
+        matrix (numpy.ndarray): Tahta matrisi, 0=boş, 1=P, 2=B
+        order (numpy.ndarray): Düzleştirilmiş hücre indeksleri
+        
+    Returns:
+        numpy.ndarray: Sıralı, boş olmayan değerler
+    """
+    values = matrix.ravel()[order]
+    return values[values > 0]
+
+def ordered_values_batch(boards, order):
+    """
+    ordered_values fonksiyonunun N tahtalık yığın karşılığı
+    
+    Boş olmayan değerler sıraları korunarak her satırın başına toplanır.
+    
+    Args:
+        boards (numpy.ndarray): (N, R, C) tahtalar
+        order (numpy.ndarray): Düzleştirilmiş hücre indeksleri
+        
+    Returns:
+        tuple: (diziler (N, len(order)), dolu uzunluklar (N,))
+    """
+    values = boards.reshape(len(boards), -1)[:, order]
+    empty = values == 0
+    packed = np.take_along_axis(values, np.argsort(empty, axis=1, kind='stable'), axis=1)
+    return packed, np.sum(~empty, axis=1)
\ No newline at end of file
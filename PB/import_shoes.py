@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Baccarat P/B Pattern Analiz Uygulaması - Toplu içe aktarma
+Metin/CSV shoe geçmişlerini bit paketli derlem dosyasına (.pbc) dönüştürür
+
+Her satır bir shoe olarak okunur (--per-file ile her dosya bir shoe); P/B ve
+W/L sembolleri kabul edilir, beraberlikler sayılır, ayırıcılar ve sonuç
+sembolü olmayan kelimeler yok sayılır. Özet (el/saniye dahil) stderr'e yazılır.
+
+Örnekler:
+    python import_shoes.py shoes.csv --column 3 -o shoes.pbc
+    python import_shoes.py data/*.txt --per-file -o shoes.pbc
+"""
+
+import sys
+import json
+import argparse
+from core.importer import import_files
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Metin/CSV shoe geçmişlerini derlem dosyasına aktarır")
+    parser.add_argument("inputs", nargs="+", help="Girdi dosyaları")
+    parser.add_argument("-o", "--output", required=True, help="Yazılacak derlem dosyası (.pbc)")
+    parser.add_argument("--alphabet", choices=["PB", "WL"], default=None,
+                        help="Yalnızca bu sembolleri kabul et (varsayılan: ikisi de)")
+    parser.add_argument("--per-file", action="store_true",
+                        help="Her dosyayı tek bir shoe say (varsayılan: her satır bir shoe)")
+    parser.add_argument("--column", type=int, default=None,
+                        help="CSV'de yalnızca bu sütunu oku (0'dan başlayarak)")
+    parser.add_argument("--delimiter", default=",", help="CSV alan ayırıcı (varsayılan: ,)")
+    args = parser.parse_args(argv)
+
+    report = import_files(args.inputs, args.output, args.alphabet, args.per_file,
+                          args.column, args.delimiter)
+    print(json.dumps(report.to_dict()), file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -10,6 +10,7 @@ import sys
 from PyQt5.QtWidgets import QApplication
 from PyQt5.QtCore import Qt
 from ui.main_window import WLPatternAnalyzer
+from core.journal import DEFAULT_JOURNAL_PATH
 
 if __name__ == "__main__":
     # High DPI display support
@@ -21,8 +22,8 @@ if __name__ == "__main__":
     # Fusion stil ile modern görünüm
     app.setStyle("Fusion")
     
-    # Ana pencereyi oluştur ve göster
-    main_window = WLPatternAnalyzer()
+    # Ana pencereyi oluştur ve göster (önceki oturum girdi günlüğünden kurtarılır)
+    main_window = WLPatternAnalyzer(journal_path=DEFAULT_JOURNAL_PATH)
     main_window.show()
     
     sys.exit(app.exec_())
\ No newline at end of file
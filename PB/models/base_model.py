@@ -6,36 +6,323 @@ P ve B Pattern Analiz Uygulaması
 Temel analiz model sınıfı
 """
 
+import functools
 import numpy as np
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from core.features import BoardFeatures, BatchFeatures
+from core.board_key import board_state_key
+from core.traversal import ordered_values, ordered_values_batch, stencil_matrix
+from core.kernels import kernels_enabled, order_followers, order_followers_batch, stencil_vote
+
+
+def memo_key(matrix, history=None, features=None):
+    """
+    Tahmin önbelleği anahtarı: (tahta anahtarı, son hamle, geçmiş uzunluğu)
+    
+    Özellikler verilmediyse anahtar tahta ve geçmişten doğrudan hesaplanır; böylece
+    önbellek isabetinde BoardFeatures hiç oluşturulmaz.
+    """
+    if features is not None:
+        return features.state_key, features.last_move, features.history_length
+    if not history:
+        return board_state_key(matrix), None, 0
+    return board_state_key(matrix), tuple(history[-1]), len(history)
+
+
+def _memoized_analyze(analyze):
+    """
+    analyze() metodunu memo_key ile anahtarlanan sınırlı LRU önbelleğe sarar
+    
+    Tahta, son eller üzerinde kayan bir pencere olduğundan geri alma, model değişimi ve
+    backtest sırasında aynı durumlar sık sık tekrar ziyaret edilir. Artımlı durumla
+    (state=) yapılan çağrılar önbelleğe alınmaz; sonuç tahtadan değil durumdan okunur.
+    """
+    @functools.wraps(analyze)
+    def wrapper(self, matrix, history=None, features=None, **kwargs):
+        if kwargs.get('state') is not None:
+            return analyze(self, matrix, history, features, **kwargs)
+        
+        key = memo_key(matrix, history, features)
+        
+        memo = self._memo
+        if key in memo:
+            memo.move_to_end(key)
+            self.memo_hits += 1
+            return memo[key]
+        
+        self.memo_misses += 1
+        prediction = analyze(self, matrix, history, features, **kwargs)
+        memo[key] = prediction
+        if len(memo) > self.memo_size:
+            memo.popitem(last=False)  # En eski kullanılan kaydı çıkar
+        return prediction
+    
+    return wrapper
+
 
 class BaseAnalysisModel(ABC):
     """Tüm analiz modelleri için temel sınıf"""
     
+    # Tahmin önbelleğinin maksimum kayıt sayısı (0 = önbellek kapalı)
+    memo_size = 4096
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Tahta boyutu -> indeks tabloları (her model sınıfı için ayrı)
+        cls._shape_table_cache = {}
+        # Alt sınıfın kendi analyze() metodunu önbellekle sar
+        if cls.memo_size and 'analyze' in cls.__dict__:
+            cls.analyze = _memoized_analyze(cls.__dict__['analyze'])
+    
     def __init__(self):
         self.name = "Temel Model"
         self.description = "Temel analiz modelidir. Bu model doğrudan kullanılmamalıdır."
         self.min_data_points = 5
+        
+        # Tahmin önbelleği ve isabet sayaçları
+        self._memo = OrderedDict()
+        self.memo_hits = 0
+        self.memo_misses = 0
     
     @abstractmethod
-    def analyze(self, matrix, history=None):
+    def analyze(self, matrix, history=None, features=None):
         """
         Verilen matris ve geçmişi analiz eder
         
         Args:
-            matrix (numpy.ndarray): 5x5 matris, 0=boş, 1=W, 2=L
+            matrix (numpy.ndarray): Tahta matrisi (varsayılan 5x5), 0=boş, 1=W, 2=L
             history (list, optional): Geçmiş hamlelerin listesi (row, col, value)
+            features (BoardFeatures, optional): Önceden hesaplanmış tahta özellikleri
             
         Returns:
             int: Tahmin (0=belirsiz, 1=W, 2=L)
         """
         pass
     
-    def _calculate_basic_stats(self, matrix):
+    def analyze_batch(self, boards, last_moves=None, features=None):
+        """
+        N tahtayı tek seferde analiz eder
+        
+        Varsayılan uygulama her tahta için analyze() çağırır; geometrik modeller
+        bu metodu NumPy ile yığın ekseni üzerinde vektörize eder.
+        
+        Args:
+            boards (numpy.ndarray): (N, R, C) int8 tahtalar, 0=boş, 1=P, 2=B
+            last_moves (numpy.ndarray, optional): (N, 2) son hamle koordinatları (-1 = geçmiş yok)
+            features (BatchFeatures, optional): Önceden hesaplanmış yığın özellikleri
+            
+        Returns:
+            numpy.ndarray: (N,) int8 tahminler (0=belirsiz, 1=P, 2=B)
+        """
+        features = self._get_batch_features(boards, last_moves, features)
+        predictions = np.zeros(features.size, dtype=np.int8)
+        
+        for i in range(features.size):
+            matrix = features.boards[i].astype(int)
+            history = [(row, col, matrix[row, col]) for row, col in np.argwhere(matrix > 0)]
+            
+            # Son hamleyi geçmişin sonuna taşı
+            if features.has_last[i]:
+                last = (features.last_row[i], features.last_col[i])
+                history = [move for move in history if (move[0], move[1]) != last]
+                history.append((last[0], last[1], matrix[last]))
+            else:
+                history = []
+            
+            predictions[i] = self.analyze(matrix, history)
+        
+        return predictions
+    
+    def _shape_tables(self, shape):
+        """
+        Tahta boyutuna özgü indeks tablolarını döndürür
+        
+        Tablolar her (satır, sütun) boyutu için ilk kullanımda _build_shape_tables
+        ile bir kez oluşturulur ve sınıf düzeyinde saklanır.
+        
+        Args:
+            shape (tuple): (satır, sütun)
+            
+        Returns:
+            dict: Modelin tablo adı -> tablo sözlüğü
+        """
+        shape = tuple(shape)
+        tables = self._shape_table_cache.get(shape)
+        if tables is None:
+            tables = self._build_shape_tables(*shape)
+            self._shape_table_cache[shape] = tables
+        return tables
+    
+    def _build_shape_tables(self, rows, cols):
+        """Alt sınıfların boyuta özgü tablolarını oluşturur (varsayılan: tablo yok)"""
+        return {}
+    
+    def _get_batch_features(self, boards, last_moves=None, features=None):
+        """Hazır yığın özellikleri verilmediyse hesaplar"""
+        if features is None:
+            features = BatchFeatures(boards, last_moves)
+        return features
+    
+    def _batch_result(self, predictions, features):
+        """
+        Yığın tahminlerini tamamlar: karar verilemeyen tahtalarda genel istatistiğe
+        göre tahmin yapılır, yetersiz veri olan tahtalar 0 (belirsiz) olur
+        """
+        basic, enough = features.basic_prediction(self.min_data_points)
+        predictions = np.where(predictions != 0, predictions, basic)
+        return np.where(enough, predictions, 0).astype(np.int8)
+    
+    def _count_pattern_followers_batch(self, sequences, lengths):
+        """
+        _count_pattern_followers metodunun yığın karşılığı
+        
+        Args:
+            sequences (numpy.ndarray): (N, L) boş olmayanları başa toplanmış diziler
+            lengths (numpy.ndarray): (N,) her dizinin dolu uzunluğu
+            
+        Returns:
+            tuple: (P sayıları (N,), B sayıları (N,)); 3'ten kısa dizilerde 0
+        """
+        n = len(sequences)
+        rows = np.arange(n)
+        pattern_a = sequences[rows, np.maximum(lengths - 3, 0)]
+        pattern_b = sequences[rows, np.maximum(lengths - 2, 0)]
+        
+        # Pattern başlangıcı i için sonraki değer (i + 2) dizinin içinde olmalı
+        positions = np.arange(sequences.shape[1] - 2)
+        in_range = positions[None, :] < (lengths - 2)[:, None]
+        matches = (in_range
+                   & (sequences[:, :-2] == pattern_a[:, None])
+                   & (sequences[:, 1:-1] == pattern_b[:, None]))
+        followers = sequences[:, 2:]
+        
+        p_count = np.sum(matches & (followers == 1), axis=1)
+        b_count = np.sum(matches & (followers == 2), axis=1)
+        return p_count, b_count
+    
+    def _order_followers_batch(self, boards, order):
+        """
+        _order_followers metodunun yığın karşılığı
+        
+        Args:
+            boards (numpy.ndarray): (N, R, C) int8 tahtalar
+            order (numpy.ndarray): Düzleştirilmiş hücre indeksleri
+            
+        Returns:
+            tuple: (P sayıları (N,), B sayıları (N,), dolu uzunluklar (N,))
+        """
+        if kernels_enabled():
+            return order_followers_batch(boards.reshape(len(boards), -1), order)
+        
+        values, lengths = ordered_values_batch(boards, order)
+        p_count, b_count = self._count_pattern_followers_batch(values, lengths)
+        return p_count, b_count, lengths
+    
+    def _best_follower_prediction_batch(self, followers):
+        """
+        Birden çok dizi arasından en yüksek güvenli pattern tahminini seçer (yığın halinde)
+        
+        Args:
+            followers (list): _order_followers_batch sonuçları, analyze() içindeki sırayla
+            
+        Returns:
+            numpy.ndarray: (N,) tahminler; hiçbir dizide pattern yoksa 0
+        """
+        best_prediction = None
+        best_confidence = None
+        
+        for p_count, b_count, lengths in followers:
+            total = p_count + b_count
+            found = (lengths >= 3) & (total > 0)
+            confidence = np.maximum(p_count, b_count) / np.where(found, total, 1)
+            
+            if best_prediction is None:
+                best_prediction = np.zeros(len(lengths), dtype=np.int8)
+                best_confidence = np.zeros(len(lengths))
+            
+            # Eşit güvende ilk dizinin tahmini korunur
+            better = found & (confidence > best_confidence)
+            best_confidence = np.where(better, confidence, best_confidence)
+            best_prediction = np.where(better, np.where(p_count > b_count, 1, 2), best_prediction)
+        
+        return best_prediction
+    
+    def _stencil_vote(self, stencils, p_mask, b_mask, min_cells=4):
+        """
+        Şablon matrisindeki şekillerin ortalama P/B oranına göre tahmin yapar
+        
+        Her şekildeki P ve B sayıları maskelerle şablon matrisinin çarpımından
+        bulunur; en az min_cells dolu hücresi olan şekiller değerlendirilir.
+        
+        Args:
+            stencils (numpy.ndarray): (S, R*C) şablon matrisi
+            p_mask (numpy.ndarray): (R, C) veya (N, R, C) P maskesi
+            b_mask (numpy.ndarray): (R, C) veya (N, R, C) B maskesi
+            min_cells (int): Bir şeklin sayılması için gereken dolu hücre sayısı
+            
+        Returns:
+            numpy.ndarray: Tahmin(ler) (0=belirsiz, 1=P, 2=B)
+        """
+        cells = stencils.shape[1]
+        # Küçük tahtalarda (ör. 2xN) hiçbir şekil sığmaz
+        if stencils.shape[0] == 0:
+            return np.zeros(p_mask.shape[:-2], dtype=np.int8)
+        if kernels_enabled():
+            batch_shape = p_mask.shape[:-2]
+            predictions = stencil_vote(p_mask.reshape(-1, cells), b_mask.reshape(-1, cells),
+                                       stencils, min_cells)
+            return predictions.reshape(batch_shape) if batch_shape else predictions[0]
+        
+        p_counts = p_mask.reshape(p_mask.shape[:-2] + (cells,)) @ stencils.T
+        b_counts = b_mask.reshape(b_mask.shape[:-2] + (cells,)) @ stencils.T
+        totals = p_counts + b_counts
+        
+        used = totals >= min_cells
+        safe_totals = np.where(used, totals, 1)
+        
+        # Oranlar şekil sırasıyla toplanır (cumsum sıralı toplama yapar)
+        p_prob = np.cumsum(np.where(used, p_counts / safe_totals, 0.0), axis=-1)[..., -1]
+        b_prob = np.cumsum(np.where(used, b_counts / safe_totals, 0.0), axis=-1)[..., -1]
+        total_shapes = used.sum(axis=-1)
+        
+        counted = np.maximum(total_shapes, 1)
+        p_prob = p_prob / counted
+        b_prob = b_prob / counted
+        
+        predictions = np.where(p_prob > b_prob, 1, np.where(b_prob > p_prob, 2, 0))
+        return np.where(total_shapes > 0, predictions, 0)
+    
+    def memo_info(self):
+        """Tahmin önbelleği istatistiklerini döndürür"""
+        return {
+            'hits': self.memo_hits,
+            'misses': self.memo_misses,
+            'size': len(self._memo),
+            'max_size': self.memo_size
+        }
+    
+    def clear_memo(self):
+        """Tahmin önbelleğini ve sayaçları sıfırlar"""
+        self._memo.clear()
+        self.memo_hits = 0
+        self.memo_misses = 0
+    
+    def _get_features(self, matrix, history=None, features=None):
+        """Hazır özellikler verilmediyse tahta özelliklerini hesaplar"""
+        if features is None:
+            features = BoardFeatures(matrix, history)
+        return features
+    
+    def _calculate_basic_stats(self, matrix, features=None):
         """Temel istatistikleri hesaplar"""
-        # P ve B sayıları
-        p_count = np.sum(matrix == 1)
-        b_count = np.sum(matrix == 2)
+        # P ve B sayıları (hazır özellikler varsa tekrar saymaya gerek yok)
+        if features is not None:
+            p_count = features.p_count
+            b_count = features.b_count
+        else:
+            p_count = np.sum(matrix == 1)
+            b_count = np.sum(matrix == 2)
         total = p_count + b_count
         
         # Boş hücre yoksa veya yeterli veri yoksa analiz yapma
@@ -44,7 +331,8 @@ class BaseAnalysisModel(ABC):
                 'prediction': 0,
                 'confidence': 0,
                 'p_probability': 0,
-                'b_probability': 0
+                'b_probability': 0,
+                'total': total
             }
         
         # P ve B oranları
@@ -69,6 +357,44 @@ class BaseAnalysisModel(ABC):
             'total': total
         }
     
+    def _count_pattern_followers(self, sequence):
+        """
+        Dizinin son iki değerinden oluşan patterni dizi boyunca arar
+        
+        Args:
+            sequence (numpy.ndarray): En az 3 elemanlı, boş olmayan değerler dizisi
+            
+        Returns:
+            tuple: Pattern sonrası gelen (P sayısı, B sayısı)
+        """
+        pattern = (sequence[-3], sequence[-2])
+        matches = (sequence[:-2] == pattern[0]) & (sequence[1:-1] == pattern[1])
+        followers = sequence[2:][matches]
+        return np.sum(followers == 1), np.sum(followers == 2)
+    
+    def _order_followers(self, matrix, order):
+        """
+        Verilen sıradaki boş olmayan değerlerin son iki değerlik patternini arar
+        
+        Numba çekirdekleri açıksa tek geçişlik çekirdek, değilse ordered_values ve
+        _count_pattern_followers kullanılır.
+        
+        Args:
+            matrix (numpy.ndarray): Tahta matrisi, 0=boş, 1=P, 2=B
+            order (numpy.ndarray): Düzleştirilmiş hücre indeksleri
+            
+        Returns:
+            tuple: (P sayısı, B sayısı, dolu uzunluk); 3'ten kısa dizilerde sayılar 0
+        """
+        if kernels_enabled():
+            return order_followers(matrix.ravel().astype(np.int8), order)
+        
+        values = ordered_values(matrix, order)
+        if len(values) < 3:
+            return 0, 0, len(values)
+        p_count, b_count = self._count_pattern_followers(values)
+        return p_count, b_count, len(values)
+    
     def _convert_history_to_sequence(self, history):
         """Geçmiş hamleleri sıralı bir diziye dönüştürür"""
         if not history:
@@ -118,4 +444,69 @@ class BaseAnalysisModel(ABC):
                 'count': total
             }
         
-        return probabilities
\ No newline at end of file
+        return probabilities
+
+
+class StencilAnalysisModel(BaseAnalysisModel):
+    """
+    Sabit şekillerin (L, T) tahtaya sığan tüm yerleşimlerinde P/B oranlarına bakan
+    modeller için temel sınıf
+    
+    Alt sınıflar yalnızca _build_stencil_shapes ile şekil yerleşimlerini tanımlar;
+    tek tahta ve yığın analizi ortak _stencil_vote üzerinden yapılır.
+    """
+    
+    def analyze(self, matrix, history=None, features=None):
+        """
+        Şekil yerleşimlerindeki patternleri analiz eder
+        
+        Args:
+            matrix (numpy.ndarray): Tahta matrisi (varsayılan 5x5), 0=boş, 1=W, 2=L
+            history (list, optional): Geçmiş hamlelerin listesi (row, col, value)
+            features (BoardFeatures, optional): Önceden hesaplanmış tahta özellikleri
+            
+        Returns:
+            int: Tahmin (0=belirsiz, 1=W, 2=L)
+        """
+        # Temel istatistikler
+        features = self._get_features(matrix, history, features)
+        stats = self._calculate_basic_stats(matrix, features)
+        
+        if stats['total'] < self.min_data_points:
+            return 0  # Yetersiz veri
+        
+        # Tüm şekillerdeki P/B sayıları tek matris-vektör çarpımıyla bulunur
+        stencils = self._shape_tables(matrix.shape)['stencils']
+        prediction = self._stencil_vote(stencils, features.p_mask, features.b_mask)
+        if prediction:
+            return int(prediction)
+        
+        # Belirgin bir pattern yoksa genel istatistiklere göre tahmin yap
+        return stats['prediction']
+    
+    def analyze_batch(self, boards, last_moves=None, features=None):
+        """Şekil yerleşimlerindeki patternleri N tahta için tek seferde analiz eder (bkz. BaseAnalysisModel.analyze_batch)"""
+        features = self._get_batch_features(boards, last_moves, features)
+        
+        # Her tahta ve şekil için P/B sayıları: (N, R*C) x (R*C, S) matris çarpımı
+        stencils = self._shape_tables(features.shape)['stencils']
+        predictions = self._stencil_vote(stencils, features.p_mask, features.b_mask)
+        return self._batch_result(predictions, features)
+    
+    def _build_shape_tables(self, rows, cols):
+        """Tahtaya sığan tüm şekil yerleşimlerinin şablon matrisi"""
+        return {'stencils': stencil_matrix(self._build_stencil_shapes(rows, cols), rows * cols)}
+    
+    @abstractmethod
+    def _build_stencil_shapes(self, rows, cols):
+        """
+        Tahtaya sığan şekil yerleşimlerini oluşturur
+        
+        Args:
+            rows (int): Satır sayısı
+            cols (int): Sütun sayısı
+            
+        Returns:
+            list: Yerleşim başına düzleştirilmiş hücre indeksleri listesi
+        """
+        pass
\ No newline at end of file
@@ -8,6 +8,32 @@ Sınır Analiz Modeli
 
 import numpy as np
 from models.base_model import BaseAnalysisModel
+from core.features import region_bounds, region_sum
+from core.bitboard import shape_masks
+
+REGION_NAMES = ('border', 'inner', 'corner', 'edge')
+
+
+def _build_border_masks(rows=5, cols=5):
+    """Sınır ve köşe maskeleri (son hamlenin bölgesi için)"""
+    last_row, last_col = rows - 1, cols - 1
+    border = np.zeros((rows, cols), dtype=bool)
+    border[[0, last_row], :] = True
+    border[:, [0, last_col]] = True
+    corner = np.zeros((rows, cols), dtype=bool)
+    corner[[0, 0, last_row, last_row], [0, last_col, 0, last_col]] = True
+    return border, corner
+
+
+def _build_region_bounds(rows=5, cols=5):
+    """Bölge sınırları (top, left, bottom, right): tüm matris, iç kısım ve köşeler"""
+    whole = (0, 0, rows, cols)
+    # Tek satırlı/sütunlu tahtalarda iç kısım boştur ve köşeler çakışır
+    inner = (1, 1, max(rows - 1, 1), max(cols - 1, 1))
+    corner_cells = sorted({(0, 0), (0, cols - 1), (rows - 1, 0), (rows - 1, cols - 1)})
+    corners = region_bounds([(row, col, row + 1, col + 1) for row, col in corner_cells])
+    return whole, inner, corners
+
 
 class BorderAnalysis(BaseAnalysisModel):
     """Sınır analizini yapan model"""
@@ -18,42 +44,32 @@ class BorderAnalysis(BaseAnalysisModel):
         self.description = "Matrisin kenar ve köşelerindeki sonuçların iç kısımdan farklı olup olmadığını analiz eder."
         self.min_data_points = 5
     
-    def analyze(self, matrix, history=None):
+    def analyze(self, matrix, history=None, features=None):
         """
         Sınır analizini yapar
         
         Args:
-            matrix (numpy.ndarray): 5x5 matris, 0=boş, 1=W, 2=L
+            matrix (numpy.ndarray): Tahta matrisi (varsayılan 5x5), 0=boş, 1=W, 2=L
             history (list, optional): Geçmiş hamlelerin listesi (row, col, value)
+            features (BoardFeatures, optional): Önceden hesaplanmış tahta özellikleri
             
         Returns:
             int: Tahmin (0=belirsiz, 1=W, 2=L)
         """
         # Temel istatistikler
-        stats = self._calculate_basic_stats(matrix)
+        features = self._get_features(matrix, history, features)
+        stats = self._calculate_basic_stats(matrix, features)
         
         if stats['total'] < self.min_data_points:
             return 0  # Yetersiz veri
         
-        # Sınır ve iç kısım maskelerini oluştur
-        border_mask = np.zeros((5, 5), dtype=bool)
-        border_mask[0, :] = True  # Üst kenar
-        border_mask[4, :] = True  # Alt kenar
-        border_mask[:, 0] = True  # Sol kenar
-        border_mask[:, 4] = True  # Sağ kenar
-        
-        inner_mask = ~border_mask  # İç kısım (sınır olmayan yerler)
-        
-        # Sadece dolu hücreleri al
-        non_empty = matrix > 0
-        border_non_empty = border_mask & non_empty
-        inner_non_empty = inner_mask & non_empty
-        
-        # Sınırdaki ve iç kısımdaki P/B sayıları
-        border_w = np.sum((matrix == 1) & border_non_empty)
-        border_l = np.sum((matrix == 2) & border_non_empty)
-        inner_w = np.sum((matrix == 1) & inner_non_empty)
-        inner_l = np.sum((matrix == 2) & inner_non_empty)
+        # Sınırdaki, iç kısımdaki, köşelerdeki ve kenarlardaki P/B sayıları
+        tables = self._shape_tables(matrix.shape)
+        border_mask = tables['border_mask']
+        bitboard = features.bitboard
+        counts = {region: bitboard.count(mask) for region, mask in tables['region_bits']}
+        border_w, border_l = counts['border']
+        inner_w, inner_l = counts['inner']
         
         # Oran hesapları
         border_total = border_w + border_l
@@ -66,8 +82,8 @@ class BorderAnalysis(BaseAnalysisModel):
         
         # Tahmin için faktörler
         # 1. Son hamle sınırda mı değil mi?
-        if history and len(history) > 0:
-            last_row, last_col, _ = history[-1]
+        if features.last_move:
+            last_row, last_col, _ = features.last_move
             is_last_border = border_mask[last_row, last_col]
             
             # Sınır ile iç kısım arasında belirgin fark var mı?
@@ -91,30 +107,26 @@ class BorderAnalysis(BaseAnalysisModel):
             # Sınır içi kontrastı (köşeler vs kenarlar)
             if is_last_border:
                 # Son hamle bir köşe mi?
-                is_corner = (last_row == 0 or last_row == 4) and (last_col == 0 or last_col == 4)
-                
-                # Köşeler ve köşe dışı kenarlar için P/B hesaplama
-                corners = [(0,0), (0,4), (4,0), (4,4)]
-                corner_values = [matrix[r,c] for r,c in corners if matrix[r,c] > 0]
+                is_corner = tables['corner_mask'][last_row, last_col]
                 
-                edges = []
-                for r in range(5):
-                    for c in range(5):
-                        if border_mask[r,c] and (r,c) not in corners and matrix[r,c] > 0:
-                            edges.append(matrix[r,c])
+                # Köşeler ve köşe dışı kenarlar için P/B sayıları
+                corner_w, corner_l = counts['corner']
+                edge_w, edge_l = counts['edge']
+                corner_total = corner_w + corner_l
+                edge_total = edge_w + edge_l
                 
-                if corner_values and edges:
-                    corner_p_ratio = corner_values.count(1) / len(corner_values)
-                    edge_p_ratio = edges.count(1) / len(edges)
+                if corner_total > 0 and edge_total > 0:
+                    corner_p_ratio = corner_w / corner_total
+                    edge_p_ratio = edge_w / edge_total
                     
                     if abs(corner_p_ratio - edge_p_ratio) > 0.3:  # Belirgin fark var
                         if is_corner:
-                            if corner_p_ratio > corner_values.count(2) / len(corner_values):
+                            if corner_p_ratio > corner_l / corner_total:
                                 return 1  # P
                             else:
                                 return 2  # B
                         else:  # Kenardaysa
-                            if edge_p_ratio > edges.count(2) / len(edges):
+                            if edge_p_ratio > edge_l / edge_total:
                                 return 1  # P
                             else:
                                 return 2  # B
@@ -126,17 +138,99 @@ class BorderAnalysis(BaseAnalysisModel):
                 if (border_p_ratio > border_b_ratio and inner_p_ratio < inner_b_ratio) or \
                    (border_p_ratio < border_b_ratio and inner_p_ratio > inner_b_ratio):
                     # Son hamle sınırdaysa ve W çoğunluktaysa
-                    if history and border_mask[history[-1][0], history[-1][1]]:
+                    if features.last_move and border_mask[last_row, last_col]:
                         if border_p_ratio > border_b_ratio:
                             return 1  # P
                         else:
                             return 2  # B
                     # Son hamle iç kısımdaysa
-                    elif history and not border_mask[history[-1][0], history[-1][1]]:
+                    elif features.last_move and not border_mask[last_row, last_col]:
                         if inner_p_ratio > inner_b_ratio:
                             return 1  # P
                         else:
                             return 2  # B
         
         # Belirgin bir pattern yoksa genel istatistiklere göre tahmin yap
-        return stats['prediction']
\ No newline at end of file
+        return stats['prediction']
+    
+    def analyze_batch(self, boards, last_moves=None, features=None):
+        """Sınır analizini N tahta için tek seferde yapar (bkz. BaseAnalysisModel.analyze_batch)"""
+        features = self._get_batch_features(boards, last_moves, features)
+        
+        # Sınırdaki, iç kısımdaki, köşelerdeki ve kenarlardaki P/B sayıları
+        tables = self._shape_tables(features.shape)
+        counts = self._region_counts(features.p_table, features.b_table, tables)
+        border_w, border_l = counts['border']
+        inner_w, inner_l = counts['inner']
+        border_total = border_w + border_l
+        inner_total = inner_w + inner_l
+        border_p_ratio = np.where(border_total > 0, border_w / np.maximum(border_total, 1), 0)
+        inner_p_ratio = np.where(inner_total > 0, inner_w / np.maximum(inner_total, 1), 0)
+        
+        has_last = features.has_last
+        is_last_border = tables['border_mask'][features.last_row, features.last_col]
+        
+        # 1. Sınır ile iç kısım arasında belirgin fark varsa son hamlenin bölgesine göre tahmin
+        contrast = (has_last & (border_total >= 3) & (inner_total >= 3)
+                    & (np.abs(border_p_ratio - inner_p_ratio) > 0.2))
+        region_prediction = np.where(
+            is_last_border,
+            np.where(border_w > border_l, 1, 2),
+            np.where(inner_w > inner_l, 1, 2))
+        predictions = np.where(contrast, region_prediction, 0).astype(np.int8)
+        
+        # 2. Sınır içi kontrast (köşeler vs kenarlar)
+        corner_w, corner_l = counts['corner']
+        edge_w, edge_l = counts['edge']
+        corner_total = corner_w + corner_l
+        edge_total = edge_w + edge_l
+        corner_p_ratio = corner_w / np.maximum(corner_total, 1)
+        edge_p_ratio = edge_w / np.maximum(edge_total, 1)
+        
+        is_corner = tables['corner_mask'][features.last_row, features.last_col]
+        edge_contrast = (has_last & (predictions == 0) & is_last_border
+                         & (corner_total > 0) & (edge_total > 0)
+                         & (np.abs(corner_p_ratio - edge_p_ratio) > 0.3))
+        edge_prediction = np.where(
+            is_corner,
+            np.where(corner_w > corner_l, 1, 2),
+            np.where(edge_w > edge_l, 1, 2))
+        predictions = np.where(edge_contrast, edge_prediction, predictions)
+        
+        # analyze() içindeki 3. blok (fark > 0.3) son hamle varken 1. bloğa, yokken
+        # hiçbir dala düşmediği için yığın sürümünde ayrıca hesaplanmaz
+        return self._batch_result(predictions, features)
+    
+    def _region_counts(self, p_table, b_table, tables):
+        """
+        Sınır, iç kısım, köşe ve kenar bölgelerindeki P/B sayılarını integral
+        görüntülerden okur ((N, R+1, C+1) yığın; tek tahta için bitboard maskeleri kullanılır)
+        
+        Returns:
+            dict: Bölge adı -> (P sayısı, B sayısı)
+        """
+        whole_bounds, inner_bounds, corner_bounds = tables['bounds']
+        counts = {}
+        for name, table in (('p', p_table), ('b', b_table)):
+            whole = region_sum(table, whole_bounds)
+            inner = region_sum(table, inner_bounds)
+            corner = region_sum(table, corner_bounds).sum(axis=-1)
+            counts[name] = {
+                'border': whole - inner,
+                'inner': inner,
+                'corner': corner,
+                'edge': whole - inner - corner
+            }
+        return {region: (counts['p'][region], counts['b'][region])
+                for region in REGION_NAMES}
+    
+    def _build_shape_tables(self, rows, cols):
+        """Bölge maskeleri, integral görüntü sınırları ve tek tahta için bitboard maskeleri"""
+        border, corner = _build_border_masks(rows, cols)
+        masks = shape_masks(rows, cols)
+        return {
+            'border_mask': border,
+            'corner_mask': corner,
+            'bounds': _build_region_bounds(rows, cols),
+            'region_bits': [(region, masks[region]) for region in REGION_NAMES]
+        }
\ No newline at end of file
@@ -45,28 +45,42 @@ class CombinedAnalysis(BaseAnalysisModel):
             BorderAnalysis(),
             HeatmapAnalysis()
         ]
+        
+        # Hazır tahmin sözlüğünde alt modellerin anahtarları (self.models ile aynı sırada)
+        self.model_names = [
+            "Çapraz (Diagonal)", "Dikdörtgen", "L-Şekli", "T-Şekli",
+            "Spiral", "Komşuluk", "Zig-Zag", "Serpme",
+            "Kuadran", "Simetri", "Sınır", "Isı Haritası"
+        ]
     
-    def analyze(self, matrix, history=None):
+    def analyze(self, matrix, history=None, features=None, predictions=None):
         """
         Tüm modelleri kullanarak karma analiz yapar
         
         Args:
-            matrix (numpy.ndarray): 5x5 matris, 0=boş, 1=W, 2=L
+            matrix (numpy.ndarray): Tahta matrisi (varsayılan 5x5), 0=boş, 1=W, 2=L
             history (list, optional): Geçmiş hamlelerin listesi (row, col, value)
+            features (BoardFeatures, optional): Önceden hesaplanmış tahta özellikleri
+            predictions (dict, optional): Alt modellerin hazır tahminleri (AnalysisEngine tarafından sağlanır)
             
         Returns:
             int: Tahmin (0=belirsiz, 1=W, 2=L)
         """
         # Temel istatistikler
-        stats = self._calculate_basic_stats(matrix)
+        features = self._get_features(matrix, history, features)
+        stats = self._calculate_basic_stats(matrix, features)
         
         if stats['total'] < self.min_data_points:
             return 0  # Yetersiz veri
         
-        # Her modelden tahmin al
+        # Her modelden tahmin al (hazır tahminler varsa modelleri tekrar çalıştırma)
+        if predictions is not None:
+            model_predictions = [predictions[name] for name in self.model_names]
+        else:
+            model_predictions = [model.analyze(matrix, history, features) for model in self.models]
+        
         results = {}
-        for model in self.models:
-            prediction = model.analyze(matrix, history)
+        for prediction in model_predictions:
             
             if prediction not in results:
                 results[prediction] = 0
@@ -91,4 +105,30 @@ class CombinedAnalysis(BaseAnalysisModel):
             if stats['p_probability'] > stats['b_probability']:
                 return 1  # P
             else:
-                return 2  # B
\ No newline at end of file
+                return 2  # B
+    
+    def analyze_batch(self, boards, last_moves=None, features=None, predictions=None):
+        """
+        Karma analizi N tahta için tek seferde yapar
+        
+        Args:
+            boards (numpy.ndarray): (N, 5, 5) int8 tahtalar, 0=boş, 1=P, 2=B
+            last_moves (numpy.ndarray, optional): (N, 2) son hamle koordinatları (-1 = geçmiş yok)
+            features (BatchFeatures, optional): Önceden hesaplanmış yığın özellikleri
+            predictions (numpy.ndarray, optional): (N, 12) alt model tahminleri (self.model_names sırasıyla)
+            
+        Returns:
+            numpy.ndarray: (N,) int8 tahminler (0=belirsiz, 1=P, 2=B)
+        """
+        features = self._get_batch_features(boards, last_moves, features)
+        
+        if predictions is None:
+            predictions = np.stack(
+                [model.analyze_batch(boards, last_moves, features) for model in self.models], axis=1)
+        
+        # Oy sayıları (belirsiz tahminler sayılmaz); eşitlikte genel istatistik kullanılır
+        p_votes = np.sum(predictions == 1, axis=1)
+        b_votes = np.sum(predictions == 2, axis=1)
+        result = np.where(p_votes > b_votes, 1, np.where(b_votes > p_votes, 2, 0))
+        
+        return self._batch_result(result, features)
\ No newline at end of file
@@ -8,6 +8,7 @@ P ve B Pattern Analiz Uygulaması
 
 import numpy as np
 from models.base_model import BaseAnalysisModel
+from core.traversal import build_diagonal_lines
 
 class DiagonalAnalysis(BaseAnalysisModel):
     """Çapraz patternleri analiz eden model"""
@@ -18,70 +19,40 @@ class DiagonalAnalysis(BaseAnalysisModel):
         self.description = "5x5 matriste sol üstten sağ alta ve sağ üstten sol alta çapraz olarak ilerleyen patternleri analiz eder."
         self.min_data_points = 5
     
-    def analyze(self, matrix, history=None):
+    def analyze(self, matrix, history=None, features=None):
         """
         Çapraz patternleri analiz eder
         
         Args:
-            matrix (numpy.ndarray): 5x5 matris, 0=boş, 1=W, 2=L
+            matrix (numpy.ndarray): Tahta matrisi (varsayılan 5x5), 0=boş, 1=W, 2=L
             history (list, optional): Geçmiş hamlelerin listesi (row, col, value)
+            features (BoardFeatures, optional): Önceden hesaplanmış tahta özellikleri
             
         Returns:
             int: Tahmin (0=belirsiz, 1=W, 2=L)
         """
         # Temel istatistikler
-        stats = self._calculate_basic_stats(matrix)
+        features = self._get_features(matrix, history, features)
+        stats = self._calculate_basic_stats(matrix, features)
         
         if stats['total'] < self.min_data_points:
             return 0  # Yetersiz veri
         
-        # Çapraz patternleri topla
-        diagonals = []
-        
-        # Ana köşegen ve paralelleri (sol üst - sağ alt)
-        for offset in range(-4, 5):
-            diagonal = np.diag(matrix, offset)
-            diagonals.append(diagonal)
-        
-        # Ters köşegen ve paralelleri (sağ üst - sol alt)
-        flipped = np.fliplr(matrix)
-        for offset in range(-4, 5):
-            diagonal = np.diag(flipped, offset)
-            diagonals.append(diagonal)
-        
         # Her çapraz için P/B oranını kontrol et
         p_prob = 0
         b_prob = 0
         totab_patterns = 0
         
-        for diagonal in diagonals:
-            if len(diagonal) >= 3:  # En az 3 uzunluğunda patternler
-                values = [v for v in diagonal if v > 0]  # Boş olmayanlar
-                
-                if len(values) >= 3:
-                    p_count = values.count(1)
-                    b_count = values.count(2)
-                    
-                    # Son iki değere göre tahmin yap
-                    if len(values) >= 3 and values[-3] > 0 and values[-2] > 0:
-                        pattern = (values[-3], values[-2])
-                        
-                        # Bu pattern önceden kaç kez P/B ile devam etmiş
-                        p_pattern = 0
-                        b_pattern = 0
-                        
-                        for i in range(len(values) - 2):
-                            if values[i] == pattern[0] and values[i+1] == pattern[1]:
-                                if i+2 < len(values):
-                                    if values[i+2] == 1:
-                                        p_pattern += 1
-                                    elif values[i+2] == 2:
-                                        b_pattern += 1
-                        
-                        if p_pattern + b_pattern > 0:
-                            p_prob += p_pattern / (p_pattern + b_pattern)
-                            b_prob += b_pattern / (p_pattern + b_pattern)
-                            totab_patterns += 1
+        # Çaprazlar (en az 3 uzunluğunda) tahta boyutu başına bir kez indeks tablosu olarak hazırlanır
+        for line in self._shape_tables(matrix.shape)['lines']:
+            # Son iki değere göre pattern - önceden kaç kez P/B ile devam etmiş (boşlar atlanır)
+            p_pattern, b_pattern, length = self._order_followers(matrix, line)
+            
+            if length >= 3:
+                if p_pattern + b_pattern > 0:
+                    p_prob += p_pattern / (p_pattern + b_pattern)
+                    b_prob += b_pattern / (p_pattern + b_pattern)
+                    totab_patterns += 1
         
         # Sonucu belirle
         if totab_patterns > 0:
@@ -94,4 +65,37 @@ class DiagonalAnalysis(BaseAnalysisModel):
                 return 2  # B tahmini
         
         # Belirgin bir pattern yoksa genel istatistiklere göre tahmin yap
-        return stats['prediction']
\ No newline at end of file
+        return stats['prediction']
+    
+    def analyze_batch(self, boards, last_moves=None, features=None):
+        """Çapraz patternleri N tahta için tek seferde analiz eder (bkz. BaseAnalysisModel.analyze_batch)"""
+        features = self._get_batch_features(boards, last_moves, features)
+        n = features.size
+        
+        p_prob = np.zeros(n)
+        b_prob = np.zeros(n)
+        totab_patterns = np.zeros(n, dtype=int)
+        
+        # Olasılıklar analyze() ile aynı sırada toplanır
+        for line in self._shape_tables(features.shape)['lines']:
+            p_pattern, b_pattern, lengths = self._order_followers_batch(features.boards, line)
+            
+            total = p_pattern + b_pattern
+            found = (lengths >= 3) & (total > 0)
+            safe_total = np.where(found, total, 1)
+            p_prob += np.where(found, p_pattern / safe_total, 0.0)
+            b_prob += np.where(found, b_pattern / safe_total, 0.0)
+            totab_patterns += found
+        
+        # Sonucu belirle
+        counted = np.maximum(totab_patterns, 1)
+        p_prob /= counted
+        b_prob /= counted
+        
+        predictions = np.where(p_prob > b_prob, 1, np.where(b_prob > p_prob, 2, 0))
+        predictions = np.where(totab_patterns > 0, predictions, 0)
+        return self._batch_result(predictions, features)
+    
+    def _build_shape_tables(self, rows, cols):
+        """En az 3 hücreli ana ve ters köşegen çizgileri"""
+        return {'lines': build_diagonal_lines(rows, cols)}
\ No newline at end of file
@@ -8,6 +8,12 @@ Yoğunluk Haritası Analiz Modeli
 
 import numpy as np
 from models.base_model import BaseAnalysisModel
+from core.features import NEIGHBOR_DIRECTIONS, neighbor_counts
+
+def window_sizes(rows, cols):
+    """Her hücre için kırpılmış 3x3 pencerenin boyutu (iç 9, kenar 6, köşe 4)"""
+    return neighbor_counts(np.ones((rows, cols), dtype=bool)) + 1
+
 
 class HeatmapAnalysis(BaseAnalysisModel):
     """Yoğunluk haritası analizini yapan model"""
@@ -18,107 +24,45 @@ class HeatmapAnalysis(BaseAnalysisModel):
         self.description = "P ve B sonuçlarının matris üzerindeki yoğunluğunu ısı haritası olarak görselleştirerek yoğun bölgelerdeki değişimleri analiz eder."
         self.min_data_points = 5
     
-    def analyze(self, matrix, history=None):
+    def analyze(self, matrix, history=None, features=None):
         """
         Yoğunluk haritası analizini yapar
         
         Args:
-            matrix (numpy.ndarray): 5x5 matris, 0=boş, 1=W, 2=L
+            matrix (numpy.ndarray): Tahta matrisi (varsayılan 5x5), 0=boş, 1=W, 2=L
             history (list, optional): Geçmiş hamlelerin listesi (row, col, value)
+            features (BoardFeatures, optional): Önceden hesaplanmış tahta özellikleri
             
         Returns:
             int: Tahmin (0=belirsiz, 1=W, 2=L)
         """
         # Temel istatistikler
-        stats = self._calculate_basic_stats(matrix)
+        features = self._get_features(matrix, history, features)
+        stats = self._calculate_basic_stats(matrix, features)
         
         if stats['total'] < self.min_data_points:
             return 0  # Yetersiz veri
         
-        # P ve B yoğunluk haritaları oluştur
-        w_heatmap = np.zeros((5, 5))
-        l_heatmap = np.zeros((5, 5))
-        
-        # 3x3 pencerelerle yoğunluk hesapla
-        for row in range(3):
-            for col in range(3):
-                window = matrix[row:row+3, col:col+3]
-                
-                p_count = np.sum(window == 1)
-                b_count = np.sum(window == 2)
-                
-                # Merkez hücredeki yoğunluğu artır
-                w_heatmap[row+1, col+1] += p_count / 9  # Normalize
-                l_heatmap[row+1, col+1] += b_count / 9  # Normalize
-        
-        # Kenar hücreler için daha küçük pencereler kullan
-        # Üst kenar
-        for col in range(1, 4):
-            window = matrix[0:2, col-1:col+2]
-            p_count = np.sum(window == 1)
-            b_count = np.sum(window == 2)
-            w_heatmap[0, col] += p_count / 6  # Normalize
-            l_heatmap[0, col] += b_count / 6  # Normalize
-        
-        # Alt kenar
-        for col in range(1, 4):
-            window = matrix[3:5, col-1:col+2]
-            p_count = np.sum(window == 1)
-            b_count = np.sum(window == 2)
-            w_heatmap[4, col] += p_count / 6  # Normalize
-            l_heatmap[4, col] += b_count / 6  # Normalize
-        
-        # Sol kenar
-        for row in range(1, 4):
-            window = matrix[row-1:row+2, 0:2]
-            p_count = np.sum(window == 1)
-            b_count = np.sum(window == 2)
-            w_heatmap[row, 0] += p_count / 6  # Normalize
-            l_heatmap[row, 0] += b_count / 6  # Normalize
-        
-        # Sağ kenar
-        for row in range(1, 4):
-            window = matrix[row-1:row+2, 3:5]
-            p_count = np.sum(window == 1)
-            b_count = np.sum(window == 2)
-            w_heatmap[row, 4] += p_count / 6  # Normalize
-            l_heatmap[row, 4] += b_count / 6  # Normalize
-        
-        # Köşeler için 2x2 pencere
-        corners = [(0,0), (0,4), (4,0), (4,4)]
-        for row, col in corners:
-            r_start = max(0, row-1)
-            r_end = min(5, row+2)
-            c_start = max(0, col-1)
-            c_end = min(5, col+2)
-            
-            window = matrix[r_start:r_end, c_start:c_end]
-            p_count = np.sum(window == 1)
-            b_count = np.sum(window == 2)
-            
-            window_size = (r_end-r_start) * (c_end-c_start)
-            w_heatmap[row, col] += p_count / window_size  # Normalize
-            l_heatmap[row, col] += b_count / window_size  # Normalize
+        # P ve B yoğunluk haritaları (her hücrenin 3x3 penceresindeki oran)
+        w_heatmap = self._heatmap(features.p_neighbors, features.p_mask)
+        l_heatmap = self._heatmap(features.b_neighbors, features.b_mask)
         
         # Yoğunluk haritalarına göre tahmin
-        if history and len(history) > 0:
-            last_row, last_col, last_val = history[-1]
+        if features.last_move:
+            last_row, last_col, last_val = features.last_move
             
             # Son hamlenin çevresindeki yoğunluğa bak
+            rows, cols = matrix.shape
             neighbors = []
-            for dr in [-1, 0, 1]:
-                for dc in [-1, 0, 1]:
-                    if dr == 0 and dc == 0:
-                        continue
+            for dr, dc in NEIGHBOR_DIRECTIONS:
+                r, c = last_row + dr, last_col + dc
+                if 0 <= r < rows and 0 <= c < cols and matrix[r, c] == 0:
+                    # Bu boş hücre için P ve B yoğunlukları
+                    w_density = w_heatmap[r, c]
+                    l_density = l_heatmap[r, c]
                     
-                    r, c = last_row + dr, last_col + dc
-                    if 0 <= r < 5 and 0 <= c < 5 and matrix[r, c] == 0:
-                        # Bu boş hücre için P ve B yoğunlukları
-                        w_density = w_heatmap[r, c]
-                        l_density = l_heatmap[r, c]
-                        
-                        if w_density > 0 or l_density > 0:
-                            neighbors.append((r, c, w_density, l_density))
+                    if w_density > 0 or l_density > 0:
+                        neighbors.append((r, c, w_density, l_density))
             
             if neighbors:
                 # En yüksek yoğunluğa sahip komşuyu bul
@@ -148,4 +92,64 @@ class HeatmapAnalysis(BaseAnalysisModel):
             return 2  # B tahmini
         
         # Belirgin bir pattern yoksa genel istatistiklere göre tahmin yap
-        return stats['prediction']
\ No newline at end of file
+        return stats['prediction']
+    
+    def analyze_batch(self, boards, last_moves=None, features=None):
+        """Yoğunluk haritası analizini N tahta için tek seferde yapar (bkz. BaseAnalysisModel.analyze_batch)"""
+        features = self._get_batch_features(boards, last_moves, features)
+        n = features.size
+        
+        # Yoğunluk haritaları (N, R, C)
+        w_heatmap = self._heatmap(features.p_neighbors, features.p_mask)
+        l_heatmap = self._heatmap(features.b_neighbors, features.b_mask)
+        
+        # Son hamlenin çevresindeki en yoğun boş komşu (eşitlikte ilk yön)
+        index = np.arange(n)
+        found = np.zeros(n, dtype=bool)
+        best_density = np.full(n, -1.0)
+        best_w = np.zeros(n)
+        best_l = np.zeros(n)
+        rows, cols = features.shape
+        for dr, dc in NEIGHBOR_DIRECTIONS:
+            r = features.last_row + dr
+            c = features.last_col + dc
+            inside = (r >= 0) & (r < rows) & (c >= 0) & (c < cols)
+            r = np.clip(r, 0, rows - 1)
+            c = np.clip(c, 0, cols - 1)
+            w_density = w_heatmap[index, r, c]
+            l_density = l_heatmap[index, r, c]
+            density = np.maximum(w_density, l_density)
+            candidate = (inside & features.empty_mask[index, r, c]
+                         & ((w_density > 0) | (l_density > 0)) & (density > best_density))
+            best_density = np.where(candidate, density, best_density)
+            best_w = np.where(candidate, w_density, best_w)
+            best_l = np.where(candidate, l_density, best_l)
+            found |= candidate
+        
+        found &= features.has_last
+        alternate = np.where(features.last_value == 1, 2, 1)
+        neighbor_prediction = np.where(
+            np.abs(best_w - best_l) > 0.2,
+            np.where(best_w > best_l, 1, 2),
+            alternate)
+        
+        # Matrisin tamamındaki yoğun bölgeler
+        w_hotspots = (w_heatmap > 0.5).sum(axis=(1, 2))
+        l_hotspots = (l_heatmap > 0.5).sum(axis=(1, 2))
+        hotspot_prediction = np.where(
+            (w_hotspots > l_hotspots) & (w_hotspots >= 2), 1,
+            np.where((l_hotspots > w_hotspots) & (l_hotspots >= 2), 2, 0))
+        
+        predictions = np.where(found, neighbor_prediction, hotspot_prediction)
+        return self._batch_result(predictions, features)
+    
+    def _heatmap(self, neighbors, mask):
+        """
+        Yoğunluk haritası: her hücreyi merkez alan kırpılmış 3x3 penceredeki
+        sayının pencere boyutuna oranı (komşu sayısı + hücrenin kendisi)
+        """
+        return (neighbors + mask) / self._shape_tables(mask.shape[-2:])['window_sizes']
+    
+    def _build_shape_tables(self, rows, cols):
+        """Hücre başına kırpılmış 3x3 pencere boyutları"""
+        return {'window_sizes': window_sizes(rows, cols)}
\ No newline at end of file
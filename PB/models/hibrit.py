@@ -7,7 +7,6 @@ Yeni Hibrit Analiz Modeli
 En başarılı 3 modelin ortalamasını alır
 """
 
-import numpy as np
 from models.base_model import BaseAnalysisModel
 from models.diagonal import DiagonalAnalysis
 from models.rectangle import RectangleAnalysis
@@ -25,6 +24,9 @@ from models.heatmap import HeatmapAnalysis
 class HibritAnalysis(BaseAnalysisModel):
     """En başarılı 3 modelin ortalamasını alan hibrit model"""
     
+    # Tahmin model istatistiklerine de bağlı olduğundan önbelleğe alınmaz
+    memo_size = 0
+    
     def __init__(self):
         super().__init__()
         self.name = "Hibrit Analiz"
@@ -49,21 +51,27 @@ class HibritAnalysis(BaseAnalysisModel):
         
         # Minimum tahmin sayısı (bu sayıdan az olan modeller dikkate alınmaz)
         self.min_predictions = 3
+        
+        # Seçilen modelleri ve oyları ekrana yazdır (arayüzsüz çalışmada kapatılır)
+        self.verbose = True
     
-    def analyze(self, matrix, history=None, model_stats=None):
+    def analyze(self, matrix, history=None, model_stats=None, predictions=None, features=None):
         """
         Hibrit analiz yapar
         
         Args:
-            matrix (numpy.ndarray): 5x5 matris, 0=boş, 1=W, 2=L
+            matrix (numpy.ndarray): Tahta matrisi (varsayılan 5x5), 0=boş, 1=W, 2=L
             history (list, optional): Geçmiş hamlelerin listesi (row, col, value)
             model_stats (dict, optional): Mevcut model istatistikleri (UI tarafından sağlanır)
+            predictions (dict, optional): Modellerin hazır tahminleri (AnalysisEngine tarafından sağlanır)
+            features (BoardFeatures, optional): Önceden hesaplanmış tahta özellikleri
             
         Returns:
             int: Tahmin (0=belirsiz, 1=W, 2=L)
         """
         # Temel istatistikler
-        stats = self._calculate_basic_stats(matrix)
+        features = self._get_features(matrix, history, features)
+        stats = self._calculate_basic_stats(matrix, features)
         
         if stats['total'] < self.min_data_points:
             return 0  # Yetersiz veri
@@ -74,27 +82,13 @@ class HibritAnalysis(BaseAnalysisModel):
             return stats['prediction']
         
         # En başarılı 3 modeli bul
-        top_models = []
-        
-        for model_name, model_stat in model_stats.items():
-            # Hibrit modeli ve Karma modelini dahil etme
-            if model_name == "Hibrit Analiz" or model_name == "Karma Analiz":
-                continue
-                
-            # Sadece en az belirlenen sayıda tahmin yapan modelleri değerlendir
-            if model_stat["total"] >= self.min_predictions:
-                top_models.append({
-                    "name": model_name,
-                    "success_rate": model_stat["success_rate"]
-                })
-        
-        # Başarı oranına göre sırala ve en iyi 3'ü al
-        top_models = sorted(top_models, key=lambda x: x["success_rate"], reverse=True)[:3]
+        top_models = self.select_top_models(model_stats)
         
         # Hata ayıklama - hangi modellerin seçildiğini görmek için
-        print("En başarılı 3 model:")
-        for model in top_models:
-            print(f"{model['name']}: %{model['success_rate']}")
+        if self.verbose:
+            print("En başarılı 3 model:")
+            for model in top_models:
+                print(f"{model['name']}: %{model['success_rate']}")
         
         # Eğer 3 model seçilemezse, mevcut modelleri kullan
         if len(top_models) < 1:
@@ -106,10 +100,12 @@ class HibritAnalysis(BaseAnalysisModel):
         
         for model_info in top_models:
             model_name = model_info["name"]
-            model = self.models[model_name]
             
-            # Modelin tahminini al
-            prediction = model.analyze(matrix, history)
+            # Modelin tahminini al (hazır tahmin varsa modeli tekrar çalıştırma)
+            if predictions is not None and model_name in predictions:
+                prediction = predictions[model_name]
+            else:
+                prediction = self.models[model_name].analyze(matrix, history, features)
             
             # Eğer model bir tahmin yaptıysa, kaydet
             if prediction != 0:  # 0 = belirsiz tahmin, almamalıyız
@@ -122,7 +118,48 @@ class HibritAnalysis(BaseAnalysisModel):
         # Eğer hiçbir model tahmin yapamadıysa
         if not model_predictions:
             return stats['prediction']
+        
+        return self.weighted_vote(model_predictions, stats['prediction'], verbose=self.verbose)
+    
+    def select_top_models(self, model_stats):
+        """
+        Başarı oranına göre en iyi 3 modeli seçer
+        
+        Args:
+            model_stats (dict): Model adı -> {"success_rate", "correct", "total"}
             
+        Returns:
+            list: {"name", "success_rate"} sözlükleri (en başarılıdan başlayarak)
+        """
+        top_models = []
+        
+        for model_name, model_stat in model_stats.items():
+            # Hibrit modeli ve Karma modelini dahil etme
+            if model_name == "Hibrit Analiz" or model_name == "Karma Analiz":
+                continue
+                
+            # Sadece en az belirlenen sayıda tahmin yapan modelleri değerlendir
+            if model_stat["total"] >= self.min_predictions:
+                top_models.append({
+                    "name": model_name,
+                    "success_rate": model_stat["success_rate"]
+                })
+        
+        # Başarı oranına göre sırala ve en iyi 3'ü al
+        return sorted(top_models, key=lambda x: x["success_rate"], reverse=True)[:3]
+    
+    def weighted_vote(self, model_predictions, default_prediction, verbose=False):
+        """
+        Seçilen modellerin tahminlerini başarı oranlarıyla ağırlıklandırarak oylar
+        
+        Args:
+            model_predictions (list): {"name", "prediction", "success_rate"} sözlükleri (belirsizler hariç)
+            default_prediction (int): Her şey eşitse kullanılacak genel istatistik tahmini
+            verbose (bool): Oy sayılarını ekrana yazdır
+            
+        Returns:
+            dict: 'prediction' ve 'confidence'
+        """
         # Oy sayılarını hesapla
         w_votes = 0
         l_votes = 0
@@ -140,8 +177,9 @@ class HibritAnalysis(BaseAnalysisModel):
                 l_weight += success_rate
         
         # Hata ayıklama
-        print(f"W oyları: {w_votes}, L oyları: {l_votes}")
-        print(f"W ağırlık: {w_weight}, L ağırlık: {l_weight}")
+        if verbose:
+            print(f"W oyları: {w_votes}, L oyları: {l_votes}")
+            print(f"W ağırlık: {w_weight}, L ağırlık: {l_weight}")
         
         # Toplam ağırlık
         total_weight = w_weight + l_weight
@@ -167,7 +205,7 @@ class HibritAnalysis(BaseAnalysisModel):
                 confidence = 0.55  # Düşük güven
             else:
                 # Her şey eşitse, genel istatistiklere göre tahmin yap
-                result = stats['prediction']
+                result = default_prediction
                 confidence = 0.5  # Belirsiz durum
         
         # Güven seviyesi ve tahmin sonucunu döndür
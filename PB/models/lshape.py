@@ -6,10 +6,28 @@ P ve B Pattern Analiz Uygulaması
 L-Şekli Pattern Analiz Modeli
 """
 
-import numpy as np
-from models.base_model import BaseAnalysisModel
+from models.base_model import StencilAnalysisModel
 
-class LShapeAnalysis(BaseAnalysisModel):
+
+def _build_l_shapes(rows=5, cols=5):
+    """4 yöndeki (┌ ┐ └ ┘) tüm L şekli yerleşimlerinin hücre indekslerini oluşturur"""
+    shapes = []
+    for i in range(4):
+        for row in range(rows - 2):
+            for col in range(cols - 2):
+                if i == 0:  # ┌ şekli
+                    cells = [(row+r, col) for r in range(3)] + [(row, col+c) for c in range(1, 3)]
+                elif i == 1:  # ┐ şekli
+                    cells = [(row+r, col+2) for r in range(3)] + [(row, col+c) for c in range(2)]
+                elif i == 2:  # └ şekli
+                    cells = [(row+r, col) for r in range(3)] + [(row+2, col+c) for c in range(1, 3)]
+                else:  # ┘ şekli
+                    cells = [(row+r, col+2) for r in range(3)] + [(row+2, col+c) for c in range(2)]
+                shapes.append([r * cols + c for r, c in cells])
+    return shapes
+
+
+class LShapeAnalysis(StencilAnalysisModel):
     """L şeklindeki patternleri analiz eden model"""
     
     def __init__(self):
@@ -18,87 +36,6 @@ class LShapeAnalysis(BaseAnalysisModel):
         self.description = "Matris üzerinde L şeklinde (yatay ve dikey birleşim) ilerleyen patternleri analiz eder."
         self.min_data_points = 5
     
-    def analyze(self, matrix, history=None):
-        """
-        L şeklindeki patternleri analiz eder
-        
-        Args:
-            matrix (numpy.ndarray): 5x5 matris, 0=boş, 1=W, 2=L
-            history (list, optional): Geçmiş hamlelerin listesi (row, col, value)
-            
-        Returns:
-            int: Tahmin (0=belirsiz, 1=W, 2=L)
-        """
-        # Temel istatistikler
-        stats = self._calculate_basic_stats(matrix)
-        
-        if stats['total'] < self.min_data_points:
-            return 0  # Yetersiz veri
-        
-        # Tüm olası L şekilleri için P/B oranlarını topla
-        l_shapes = []
-        
-        # 4 farklı yönde L şekli oluştur: ┌ ┐ └ ┘
-        for i in range(4):
-            for row in range(3):
-                for col in range(3):
-                    shape = []
-                    if i == 0:  # ┌ şekli
-                        for r in range(3):
-                            if matrix[row+r, col] > 0:
-                                shape.append(matrix[row+r, col])
-                        for c in range(1, 3):
-                            if matrix[row, col+c] > 0:
-                                shape.append(matrix[row, col+c])
-                    elif i == 1:  # ┐ şekli
-                        for r in range(3):
-                            if matrix[row+r, col+2] > 0:
-                                shape.append(matrix[row+r, col+2])
-                        for c in range(2):
-                            if matrix[row, col+c] > 0:
-                                shape.append(matrix[row, col+c])
-                    elif i == 2:  # └ şekli
-                        for r in range(3):
-                            if matrix[row+r, col] > 0:
-                                shape.append(matrix[row+r, col])
-                        for c in range(1, 3):
-                            if matrix[row+2, col+c] > 0:
-                                shape.append(matrix[row+2, col+c])
-                    elif i == 3:  # ┘ şekli
-                        for r in range(3):
-                            if matrix[row+r, col+2] > 0:
-                                shape.append(matrix[row+r, col+2])
-                        for c in range(2):
-                            if matrix[row+2, col+c] > 0:
-                                shape.append(matrix[row+2, col+c])
-                                
-                    if len(shape) >= 4:  # En az 4 değer olmalı
-                        l_shapes.append(shape)
-        
-        # L şekillerine göre tahmin yap
-        p_prob = 0
-        b_prob = 0
-        total_shapes = 0
-        
-        for shape in l_shapes:
-            p_count = shape.count(1)
-            b_count = shape.count(2)
-            total = p_count + b_count
-            
-            if total > 0:
-                p_prob += p_count / total
-                b_prob += b_count / total
-                total_shapes += 1
-        
-        # Sonucu belirle
-        if total_shapes > 0:
-            p_prob /= total_shapes
-            b_prob /= total_shapes
-            
-            if p_prob > b_prob:
-                return 1  # P tahmini
-            elif b_prob > p_prob:
-                return 2  # B tahmini
-        
-        # Belirgin bir pattern yoksa genel istatistiklere göre tahmin yap
-        return stats['prediction']
\ No newline at end of file
+    def _build_stencil_shapes(self, rows, cols):
+        """Tahtaya sığan tüm L şekli yerleşimleri (bkz. _build_l_shapes)"""
+        return _build_l_shapes(rows, cols)
\ No newline at end of file
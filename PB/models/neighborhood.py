@@ -8,6 +8,24 @@ Komşuluk Pattern Analiz Modeli
 
 import numpy as np
 from models.base_model import BaseAnalysisModel
+from core.features import NEIGHBOR_DIRECTIONS
+
+
+def _build_ratio_keys():
+    """
+    (P komşu sayısı, dolu komşu sayısı) çiftlerini analyze() içindeki yuvarlanmış
+    (P oranı, B oranı) anahtarlarının kimliklerine eşleyen tabloyu oluşturur
+    """
+    key_ids = {}
+    table = np.full((9, 9), -1, dtype=np.intp)
+    for total in range(1, 9):
+        for p_count in range(total + 1):
+            key = (round(p_count / total, 2), round((total - p_count) / total, 2))
+            table[p_count, total] = key_ids.setdefault(key, len(key_ids))
+    return table, len(key_ids)
+
+
+_RATIO_KEYS, _RATIO_KEY_COUNT = _build_ratio_keys()
 
 class NeighborhoodAnalysis(BaseAnalysisModel):
     """Komşuluk patternlerini analiz eden model"""
@@ -18,96 +36,94 @@ class NeighborhoodAnalysis(BaseAnalysisModel):
         self.description = "Bir hücrenin 8 komşusu içinde W veya L oranının bir sonraki sonucu nasıl etkilediğini analiz eder."
         self.min_data_points = 5
     
-    def analyze(self, matrix, history=None):
+    def analyze(self, matrix, history=None, features=None):
         """
         Komşuluk patternlerini analiz eder
         
         Args:
-            matrix (numpy.ndarray): 5x5 matris, 0=boş, 1=W, 2=L
+            matrix (numpy.ndarray): Tahta matrisi (varsayılan 5x5), 0=boş, 1=W, 2=L
             history (list, optional): Geçmiş hamlelerin listesi (row, col, value)
+            features (BoardFeatures, optional): Önceden hesaplanmış tahta özellikleri
             
         Returns:
             int: Tahmin (0=belirsiz, 1=W, 2=L)
         """
         # Temel istatistikler
-        stats = self._calculate_basic_stats(matrix)
+        features = self._get_features(matrix, history, features)
+        stats = self._calculate_basic_stats(matrix, features)
         
-        if stats['total'] < self.min_data_points or not history:
+        if stats['total'] < self.min_data_points or not features.last_move:
             return 0  # Yetersiz veri
         
-        # Komşuluk oranlarına göre tahmin yapma
-        neighborhood_stats = {}
+        # Her hücrenin dolu komşuları içindeki P ve toplam sayıları (tek geçişte hesaplanmış)
+        p_neighbors = features.p_neighbors
+        all_neighbors = p_neighbors + features.b_neighbors
+        keys = _RATIO_KEYS[p_neighbors, all_neighbors]
         
-        # 8 komşuluktaki P/B oranları
-        for row in range(5):
-            for col in range(5):
-                if matrix[row, col] > 0:
-                    # Bu hücrenin komşularını bul
-                    neighbors = []
-                    for dr in [-1, 0, 1]:
-                        for dc in [-1, 0, 1]:
-                            if dr == 0 and dc == 0:
-                                continue  # Hücrenin kendisi
-                            
-                            r, c = row + dr, col + dc
-                            if 0 <= r < 5 and 0 <= c < 5 and matrix[r, c] > 0:
-                                neighbors.append(matrix[r, c])
-                    
-                    if neighbors:
-                        # Komşuluktaki P/B oranı
-                        p_ratio = neighbors.count(1) / len(neighbors)
-                        b_ratio = neighbors.count(2) / len(neighbors)
-                        
-                        # Bu orana sahip komşuluklar için istatistik tut
-                        key = (round(p_ratio, 2), round(b_ratio, 2))
-                        if key not in neighborhood_stats:
-                            neighborhood_stats[key] = {'w': 0, 'l': 0}
-                        
-                        # Merkez hücrenin değerini ekle
-                        if matrix[row, col] == 1:
-                            neighborhood_stats[key]['w'] += 1
-                        else:
-                            neighborhood_stats[key]['l'] += 1
+        # Komşuluk oranı anahtarı başına merkez hücre P/B sayıları (neighborhood_stats)
+        counted = features.non_empty & (all_neighbors > 0)
+        w_stats = np.bincount(keys[counted & features.p_mask], minlength=_RATIO_KEY_COUNT)
+        l_stats = np.bincount(keys[counted & features.b_mask], minlength=_RATIO_KEY_COUNT)
         
-        # Son eklenen hücrenin komşuluğunu analiz et
-        if history:
-            last_row, last_col, _ = history[-1]
-            
-            # Boş bir komşuluk bul
-            for dr in [-1, 0, 1]:
-                for dc in [-1, 0, 1]:
-                    if dr == 0 and dc == 0:
-                        continue
-                    
-                    r, c = last_row + dr, last_col + dc
-                    if 0 <= r < 5 and 0 <= c < 5 and matrix[r, c] == 0:
-                        # Bu boş hücrenin komşularını bul
-                        neighbors = []
-                        for d2r in [-1, 0, 1]:
-                            for d2c in [-1, 0, 1]:
-                                if d2r == 0 and d2c == 0:
-                                    continue
-                                
-                                r2, c2 = r + d2r, c + d2c
-                                if 0 <= r2 < 5 and 0 <= c2 < 5 and matrix[r2, c2] > 0:
-                                    neighbors.append(matrix[r2, c2])
-                        
-                        if neighbors:
-                            # Komşuluktaki P/B oranı
-                            p_ratio = neighbors.count(1) / len(neighbors)
-                            b_ratio = neighbors.count(2) / len(neighbors)
-                            
-                            key = (round(p_ratio, 2), round(b_ratio, 2))
-                            if key in neighborhood_stats:
-                                # Bu komşuluk oranında daha önce ne görülmüş?
-                                p_count = neighborhood_stats[key]['w']
-                                b_count = neighborhood_stats[key]['l']
-                                
-                                if p_count + b_count > 0:
-                                    if p_count > b_count:
-                                        return 1  # P tahmini
-                                    elif b_count > p_count:
-                                        return 2  # B tahmini
+        # Son eklenen hücrenin boş komşularını sırayla dene
+        rows, cols = matrix.shape
+        last_row, last_col, _ = features.last_move
+        for dr, dc in NEIGHBOR_DIRECTIONS:
+            r, c = last_row + dr, last_col + dc
+            if 0 <= r < rows and 0 <= c < cols and matrix[r, c] == 0 and all_neighbors[r, c] > 0:
+                # Bu komşuluk oranında daha önce ne görülmüş?
+                key = keys[r, c]
+                p_count = w_stats[key]
+                b_count = l_stats[key]
+                
+                if p_count > b_count:
+                    return 1  # P tahmini
+                elif b_count > p_count:
+                    return 2  # B tahmini
         
         # Belirgin bir pattern yoksa genel istatistiklere göre tahmin yap
-        return stats['prediction']
\ No newline at end of file
+        return stats['prediction']
+    
+    def analyze_batch(self, boards, last_moves=None, features=None):
+        """Komşuluk patternlerini N tahta için tek seferde analiz eder (bkz. BaseAnalysisModel.analyze_batch)"""
+        features = self._get_batch_features(boards, last_moves, features)
+        n = features.size
+        rows = np.arange(n)
+        
+        # Her hücrenin dolu komşuları içindeki P ve toplam sayıları (N, R, C)
+        p_neighbors = features.p_neighbors
+        all_neighbors = p_neighbors + features.b_neighbors
+        keys = _RATIO_KEYS[p_neighbors, all_neighbors]
+        
+        # Komşuluk oranı anahtarı başına merkez hücre P/B sayıları (N, anahtar sayısı)
+        counted = features.non_empty & (all_neighbors > 0)
+        slots = rows[:, None, None] * _RATIO_KEY_COUNT + keys
+        size = n * _RATIO_KEY_COUNT
+        w_stats = np.bincount(slots[counted & features.p_mask], minlength=size).reshape(n, -1)
+        l_stats = np.bincount(slots[counted & features.b_mask], minlength=size).reshape(n, -1)
+        
+        # Son hamlenin boş komşularını analyze() ile aynı sırada dene
+        board_rows, board_cols = features.shape
+        predictions = np.zeros(n, dtype=np.int8)
+        decided = np.zeros(n, dtype=bool)
+        
+        for dr, dc in NEIGHBOR_DIRECTIONS:
+            r = features.last_row + dr
+            c = features.last_col + dc
+            inside = features.has_last & (r >= 0) & (r < board_rows) & (c >= 0) & (c < board_cols)
+            r = np.clip(r, 0, board_rows - 1)
+            c = np.clip(c, 0, board_cols - 1)
+            
+            total = all_neighbors[rows, r, c]
+            key = np.maximum(keys[rows, r, c], 0)
+            p_count = w_stats[rows, key]
+            b_count = l_stats[rows, key]
+            
+            # Bu komşuluk oranında daha önce belirgin bir çoğunluk görülmüşse karar ver
+            hit = (~decided & inside & features.empty_mask[rows, r, c]
+                   & (total > 0) & (p_count != b_count))
+            predictions = np.where(hit, np.where(p_count > b_count, 1, 2), predictions)
+            decided |= hit
+        
+        predictions = self._batch_result(predictions, features)
+        return np.where(features.has_last, predictions, 0).astype(np.int8)  # Geçmiş yoksa belirsiz
\ No newline at end of file
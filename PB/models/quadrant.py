@@ -8,6 +8,9 @@ Kuadran Analiz Modeli
 
 import numpy as np
 from models.base_model import BaseAnalysisModel
+from core.features import region_bounds, region_sum
+from core.bitboard import quadrant_regions, quadrant_splits, shape_masks
+
 
 class QuadrantAnalysis(BaseAnalysisModel):
     """Kuadran analizini yapan model"""
@@ -18,37 +21,32 @@ class QuadrantAnalysis(BaseAnalysisModel):
         self.description = "Matrisi 4 eşit parçaya bölerek her bölgedeki P/B oranının diğer bölgelere göre nasıl değiştiğini inceler."
         self.min_data_points = 5
     
-    def analyze(self, matrix, history=None):
+    def analyze(self, matrix, history=None, features=None):
         """
         Kuadran analizini yapar
         
         Args:
-            matrix (numpy.ndarray): 5x5 matris, 0=boş, 1=W, 2=L
+            matrix (numpy.ndarray): Tahta matrisi (varsayılan 5x5), 0=boş, 1=W, 2=L
             history (list, optional): Geçmiş hamlelerin listesi (row, col, value)
+            features (BoardFeatures, optional): Önceden hesaplanmış tahta özellikleri
             
         Returns:
             int: Tahmin (0=belirsiz, 1=W, 2=L)
         """
         # Temel istatistikler
-        stats = self._calculate_basic_stats(matrix)
+        features = self._get_features(matrix, history, features)
+        stats = self._calculate_basic_stats(matrix, features)
         
         if stats['total'] < self.min_data_points:
             return 0  # Yetersiz veri
         
-        # Matrisi 4 kuadranta böl
-        # Q1: Sol üst, Q2: Sağ üst, Q3: Sol alt, Q4: Sağ alt
-        q1 = matrix[0:3, 0:3]
-        q2 = matrix[0:3, 2:5]
-        q3 = matrix[2:5, 0:3]
-        q4 = matrix[2:5, 2:5]
-        
-        # Her kuadranttaki P ve B sayılarını hesapla
-        quadrants = [q1, q2, q3, q4]
+        # Her kuadranttaki P ve B sayıları bitboard maskelerinden okunur
+        tables = self._shape_tables(matrix.shape)
+        bitboard = features.bitboard
         quadrant_stats = []
         
-        for i, q in enumerate(quadrants):
-            p_count = np.sum(q == 1)
-            b_count = np.sum(q == 2)
+        for i, quadrant_bits in enumerate(tables['bits']):
+            p_count, b_count = bitboard.count(quadrant_bits)
             total = p_count + b_count
             
             if total > 0:
@@ -74,15 +72,16 @@ class QuadrantAnalysis(BaseAnalysisModel):
                 })
         
         # Son eklenen konum hangi kuadranda?
-        if history:
-            last_row, last_col, _ = history[-1]
+        if features.last_move:
+            last_row, last_col, _ = features.last_move
+            top_end, bottom_start, left_end, right_start = tables['splits']
             last_quadrant = 0
             
-            if last_row < 3 and last_col < 3:
+            if last_row < top_end and last_col < left_end:
                 last_quadrant = 1  # Q1
-            elif last_row < 3 and last_col >= 2:
+            elif last_row < top_end and last_col >= right_start:
                 last_quadrant = 2  # Q2
-            elif last_row >= 2 and last_col < 3:
+            elif last_row >= bottom_start and last_col < left_end:
                 last_quadrant = 3  # Q3
             else:
                 last_quadrant = 4  # Q4
@@ -112,4 +111,59 @@ class QuadrantAnalysis(BaseAnalysisModel):
                     return 2  # B
         
         # Belirgin bir pattern yoksa genel istatistiklere göre tahmin yap
-        return stats['prediction']
\ No newline at end of file
+        return stats['prediction']
+    
+    def analyze_batch(self, boards, last_moves=None, features=None):
+        """Kuadran analizini N tahta için tek seferde yapar (bkz. BaseAnalysisModel.analyze_batch)"""
+        features = self._get_batch_features(boards, last_moves, features)
+        n = features.size
+        
+        # Her kuadranttaki P ve B sayıları (N, 4)
+        tables = self._shape_tables(features.shape)
+        p_counts = region_sum(features.p_table, tables['bounds'])
+        b_counts = region_sum(features.b_table, tables['bounds'])
+        totals = p_counts + b_counts
+        valid = totals > 0
+        safe_totals = np.maximum(totals, 1)
+        p_ratios = np.where(valid, p_counts / safe_totals, 0)
+        b_ratios = np.where(valid, b_counts / safe_totals, 0)
+        
+        # Son eklenen konumun kuadranı (0 tabanlı)
+        last_row = features.last_row
+        last_col = features.last_col
+        top_end, _, left_end, _ = tables['splits']
+        last_quadrant = np.where(
+            (last_row < top_end) & (last_col < left_end), 0,
+            np.where(last_row < top_end, 1,
+                     np.where(last_col < left_end, 2, 3)))
+        
+        index = np.arange(n)
+        last_p = p_counts[index, last_quadrant]
+        last_b = b_counts[index, last_quadrant]
+        last_total = totals[index, last_quadrant]
+        
+        predictions = np.zeros(n, dtype=np.int8)
+        dense = last_total >= 3
+        predictions = np.where(dense & (last_p > last_b), 1, predictions)
+        predictions = np.where(dense & (last_b > last_p), 2, predictions)
+        
+        # Kuadranlar arası karşılaştırma (eşitlikte ilk kuadran seçilir)
+        max_p_quadrant = np.argmax(np.where(valid, p_ratios, -1), axis=1)
+        max_b_quadrant = np.argmax(np.where(valid, b_ratios, -1), axis=1)
+        p_dominant = (max_p_quadrant == last_quadrant) & (p_ratios[index, max_p_quadrant] > 0.6)
+        b_dominant = (max_b_quadrant == last_quadrant) & (b_ratios[index, max_b_quadrant] > 0.6)
+        
+        undecided = predictions == 0
+        predictions = np.where(undecided & p_dominant, 1, predictions)
+        predictions = np.where(undecided & ~p_dominant & b_dominant, 2, predictions)
+        predictions = np.where(features.has_last, predictions, 0)
+        
+        return self._batch_result(predictions, features)
+    
+    def _build_shape_tables(self, rows, cols):
+        """Kuadran sınırları (yığın yolu), bitboard maskeleri (tek tahta) ve yarı sınırları"""
+        return {
+            'bounds': region_bounds(quadrant_regions(rows, cols)),
+            'bits': shape_masks(rows, cols)['quadrants'],
+            'splits': quadrant_splits(rows, cols)
+        }
\ No newline at end of file
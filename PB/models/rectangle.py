@@ -8,7 +8,24 @@ Dikdörtgen/Kare Bölge Analiz Modeli
 
 import numpy as np
 from models.base_model import BaseAnalysisModel
-from itertools import product
+from core.features import region_bounds, region_sum
+
+# Analiz edilecek dikdörtgen boyutları
+RECTANGLE_SIZES = [(2, 2), (2, 3), (3, 2), (3, 3)]
+
+
+def _build_rectangles(board_rows=5, board_cols=5):
+    """Tüm dikdörtgen bölgeler (top, left, bottom, right), boyut ve konum sırasıyla"""
+    return [(i, j, i + rows, j + cols)
+            for rows, cols in RECTANGLE_SIZES
+            for i in range(board_rows + 1 - rows)
+            for j in range(board_cols + 1 - cols)]
+
+
+def _rectangle_areas(rectangles):
+    """Bölgelerin hücre sayıları"""
+    return np.array([(bottom - top) * (right - left) for top, left, bottom, right in rectangles])
+
 
 class RectangleAnalysis(BaseAnalysisModel):
     """Dikdörtgen/kare bölgelerdeki patternleri analiz eden model"""
@@ -19,55 +36,28 @@ class RectangleAnalysis(BaseAnalysisModel):
         self.description = "Matris üzerinde 2x2, 2x3, 3x2, 3x3 gibi dikdörtgen alanlar içindeki sonuçları analiz eder."
         self.min_data_points = 5
     
-    def analyze(self, matrix, history=None):
+    def analyze(self, matrix, history=None, features=None):
         """
         Dikdörtgen bölgeleri analiz eder
         
         Args:
-            matrix (numpy.ndarray): 5x5 matris, 0=boş, 1=W, 2=L
+            matrix (numpy.ndarray): Tahta matrisi (varsayılan 5x5), 0=boş, 1=W, 2=L
             history (list, optional): Geçmiş hamlelerin listesi (row, col, value)
+            features (BoardFeatures, optional): Önceden hesaplanmış tahta özellikleri
             
         Returns:
             int: Tahmin (0=belirsiz, 1=W, 2=L)
         """
         # Temel istatistikler
-        stats = self._calculate_basic_stats(matrix)
+        features = self._get_features(matrix, history, features)
+        stats = self._calculate_basic_stats(matrix, features)
         
         if stats['total'] < self.min_data_points:
             return 0  # Yetersiz veri
         
-        # Analiz edilecek dikdörtgen boyutları
-        rectangle_sizes = [(2, 2), (2, 3), (3, 2), (3, 3)]
-        
-        w_weight = 0
-        l_weight = 0
-        total_weight = 0
-        
-        for rows, cols in rectangle_sizes:
-            # Tüm olası başlangıç noktaları
-            for i in range(6 - rows):
-                for j in range(6 - cols):
-                    # Dikdörtgen bölgeyi al
-                    rect = matrix[i:i+rows, j:j+cols]
-                    
-                    # Boş olmayan hücreleri say
-                    non_empty = np.sum(rect > 0)
-                    
-                    # Yeterli veri varsa analiz et
-                    if non_empty >= 4:
-                        p_count = np.sum(rect == 1)
-                        b_count = np.sum(rect == 2)
-                        
-                        if p_count + b_count > 0:
-                            # Bölgedeki P/B oranı
-                            p_ratio = p_count / (p_count + b_count)
-                            b_ratio = b_count / (p_count + b_count)
-                            
-                            # Ağırlıklı toplama ekle
-                            weight = non_empty / (rows * cols)  # Doluluk oranı kadar ağırlık
-                            w_weight += p_ratio * weight
-                            l_weight += b_ratio * weight
-                            total_weight += weight
+        # Tüm bölgelerin sayımları integral görüntülerden tek seferde okunur
+        w_weight, l_weight, total_weight = self._region_weights(
+            features.filled_table, features.p_table, features.b_table, matrix.shape)
         
         # Sonucu belirle
         if total_weight > 0:
@@ -80,4 +70,54 @@ class RectangleAnalysis(BaseAnalysisModel):
                 return 2  # B tahmini
         
         # Belirgin bir pattern yoksa genel istatistiklere göre tahmin yap
-        return stats['prediction']
\ No newline at end of file
+        return stats['prediction']
+    
+    def analyze_batch(self, boards, last_moves=None, features=None):
+        """Dikdörtgen bölgeleri N tahta için tek seferde analiz eder (bkz. BaseAnalysisModel.analyze_batch)"""
+        features = self._get_batch_features(boards, last_moves, features)
+        
+        w_weight, l_weight, total_weight = self._region_weights(
+            features.filled_table, features.p_table, features.b_table, features.shape)
+        
+        # Sonucu belirle
+        safe_weight = np.where(total_weight > 0, total_weight, 1)
+        p_prob = w_weight / safe_weight
+        b_prob = l_weight / safe_weight
+        
+        predictions = np.where(p_prob > b_prob, 1, np.where(b_prob > p_prob, 2, 0))
+        predictions = np.where(total_weight > 0, predictions, 0)
+        return self._batch_result(predictions, features)
+    
+    def _region_weights(self, filled_table, p_table, b_table, shape):
+        """
+        Dikdörtgen bölgelerin ağırlıklı P/B oranlarını toplar
+        
+        Ağırlıklar bölge sırasıyla (cumsum) biriktirilir, böylece kayan nokta
+        toplamları bölge bölge toplamayla bit düzeyinde aynı kalır.
+        
+        Returns:
+            tuple: (w_weight, l_weight, total_weight), tahta başına toplamlar
+        """
+        tables = self._shape_tables(shape)
+        # Dikdörtgenlerin sığmadığı tahtalarda (ör. 1xN) bölge yok
+        if len(tables['areas']) == 0:
+            zeros = np.zeros(filled_table.shape[:-2])
+            return zeros, zeros, zeros
+        non_empty = region_sum(filled_table, tables['bounds'])
+        p_count = region_sum(p_table, tables['bounds'])
+        b_count = region_sum(b_table, tables['bounds'])
+        
+        # Yeterli veri olan bölgeler (en az 4 dolu hücre)
+        used = non_empty >= 4
+        total = np.where(used, p_count + b_count, 1)
+        weight = non_empty / tables['areas']  # Doluluk oranı kadar ağırlık
+        
+        w_weight = np.cumsum(np.where(used, p_count / total * weight, 0.0), axis=-1)
+        l_weight = np.cumsum(np.where(used, b_count / total * weight, 0.0), axis=-1)
+        total_weight = np.cumsum(np.where(used, weight, 0.0), axis=-1)
+        return w_weight[..., -1], l_weight[..., -1], total_weight[..., -1]
+    
+    def _build_shape_tables(self, rows, cols):
+        """Tahtaya sığan tüm dikdörtgen bölgelerin sınırları ve alanları"""
+        rectangles = _build_rectangles(rows, cols)
+        return {'bounds': region_bounds(rectangles), 'areas': _rectangle_areas(rectangles)}
\ No newline at end of file
@@ -6,10 +6,141 @@ P ve B Pattern Analiz Uygulaması
 Serpme Analiz Modeli
 """
 
+import functools
 import numpy as np
 from models.base_model import BaseAnalysisModel
 import math
 
+
+@functools.lru_cache(maxsize=None)
+def scatter_tables(rows=5, cols=5):
+    """
+    Tahta boyutu için hücre koordinatları ve mesafe tabloları
+    
+    Returns:
+        dict: 'cell_rows', 'cell_cols' (düzleştirilmiş hücre koordinatları),
+              'distances' (tüm hücre çiftleri arasındaki Öklid mesafeleri),
+              'distances_upper' (her çift bir kez sayılsın diye üst üçgen),
+              'max_distance' (merkezden köşeye mesafe, 5x5 için sqrt(8) = 2.83)
+              ve 'center' (renk yoksa kullanılan merkez)
+    """
+    cell_rows, cell_cols = np.divmod(np.arange(rows * cols), cols)
+    distances = np.sqrt((cell_rows[:, None] - cell_rows[None, :])**2
+                        + (cell_cols[:, None] - cell_cols[None, :])**2)
+    return {
+        'cell_rows': cell_rows,
+        'cell_cols': cell_cols,
+        'distances': distances,
+        'distances_upper': np.triu(distances, k=1),
+        'max_distance': round(math.hypot((rows - 1) / 2, (cols - 1) / 2), 2),
+        'center': (rows // 2, cols // 2)
+    }
+
+
+def clustering_level(cells, tables=None):
+    """
+    Hücre maskelerinin kümelenme seviyesi (1'e yaklaştıkça daha fazla kümelenme)
+    
+    Ortalama ikili mesafe, maskenin üst üçgen mesafe matrisiyle çarpımından bulunur.
+    
+    Args:
+        cells (numpy.ndarray): (..., R*C) 0/1 hücre maskeleri
+        tables (dict, optional): scatter_tables çıktısı (varsayılan 5x5)
+        
+    Returns:
+        numpy.ndarray: (...) kümelenme seviyeleri (2'den az hücrede 0)
+    """
+    if tables is None:
+        tables = scatter_tables()
+    cells = np.asarray(cells, dtype=float)
+    count = cells.sum(axis=-1)
+    pairs = count * (count - 1) / 2
+    distance_sum = np.sum((cells @ tables['distances_upper']) * cells, axis=-1)
+    avg_distance = distance_sum / np.maximum(pairs, 1)
+    # 1x1 tahtada en büyük mesafe 0'dır (iki hücre de yoktur)
+    max_distance = max(tables['max_distance'], 1)
+    return np.where(count >= 2, 1 - (avg_distance / max_distance), 0)
+
+
+class ScatterState:
+    """
+    Serpme analizinin artımlı durumu
+    
+    Her renk için hücre maskesi, ikili mesafe toplamı ve koordinat toplamları
+    tutulur; hücre eklemek veya silmek mesafe matrisinin tek satırıyla O(hücre sayısı)
+    sürer. Sonuçlar tahtadan yeniden hesaplananlarla yuvarlama farkı dışında aynıdır.
+    
+    Oturumlar (AnalysisSession, TableSession, arayüz) durumu ekleme, geri alma ve
+    kaydırmada günceller ve analize state= ile verir.
+    """
+    
+    def __init__(self, shape=(5, 5)):
+        self.tables = scatter_tables(*shape)
+        self.cols = shape[1]
+        
+        # İndeks 1=P, 2=B (0 kullanılmaz)
+        self.masks = np.zeros((3, shape[0] * shape[1]))
+        self.distance_sums = [0.0, 0.0, 0.0]
+        self.counts = [0, 0, 0]
+        self.row_sums = [0, 0, 0]
+        self.col_sums = [0, 0, 0]
+    
+    @classmethod
+    def from_matrix(cls, matrix):
+        """Mevcut bir matristen durum oluşturur"""
+        state = cls(matrix.shape)
+        for row, col in np.argwhere(matrix > 0):
+            state.add(row, col, matrix[row, col])
+        return state
+    
+    def add(self, row, col, value):
+        """Bir hücre ekler (O(hücre sayısı))"""
+        cell = row * self.cols + col
+        self.distance_sums[value] += float(self.tables['distances'][cell] @ self.masks[value])
+        self.masks[value, cell] = 1
+        self.counts[value] += 1
+        self.row_sums[value] += row
+        self.col_sums[value] += col
+    
+    def remove(self, row, col, value):
+        """Bir hücreyi siler (O(hücre sayısı))"""
+        cell = row * self.cols + col
+        self.masks[value, cell] = 0
+        self.distance_sums[value] -= float(self.tables['distances'][cell] @ self.masks[value])
+        self.counts[value] -= 1
+        self.row_sums[value] -= row
+        self.col_sums[value] -= col
+    
+    def shift_up(self):
+        """
+        Tahtanın bir satır yukarı kaydırılmasını uygular
+        
+        İlk satırdaki hücreler silinir; mesafeler kaydırmayla değişmediğinden kalan
+        hücreler için yalnızca maske ve satır toplamları güncellenir.
+        """
+        for value in (1, 2):
+            for col in np.flatnonzero(self.masks[value, :self.cols]):
+                self.remove(0, int(col), value)
+            self.masks[value, :-self.cols] = self.masks[value, self.cols:]
+            self.masks[value, -self.cols:] = 0
+            self.row_sums[value] -= self.counts[value]
+    
+    def clustering(self, value):
+        """Verilen rengin kümelenme seviyesi"""
+        count = self.counts[value]
+        if count < 2:
+            return 0
+        avg_distance = self.distance_sums[value] / (count * (count - 1) / 2)
+        return 1 - (avg_distance / max(self.tables['max_distance'], 1))
+    
+    def center(self, value):
+        """Verilen rengin dağılım merkezi (renk yoksa matris merkezi)"""
+        count = self.counts[value]
+        if count == 0:
+            return self.tables['center']  # Merkez
+        return (self.row_sums[value] / count, self.col_sums[value] / count)
+
+
 class ScatterAnalysis(BaseAnalysisModel):
     """Serpme analizini yapan model"""
     
@@ -19,45 +150,47 @@ class ScatterAnalysis(BaseAnalysisModel):
         self.description = "Belirli bir sonucun (W veya L) matristeki dağılımını ve kümelenme seviyesini ölçerek bir sonraki sonucu tahmin eder."
         self.min_data_points = 5
     
-    def analyze(self, matrix, history=None):
+    def analyze(self, matrix, history=None, features=None, state=None):
         """
         Serpme analizini yapar
         
         Args:
-            matrix (numpy.ndarray): 5x5 matris, 0=boş, 1=W, 2=L
+            matrix (numpy.ndarray): Tahta matrisi (varsayılan 5x5), 0=boş, 1=W, 2=L
             history (list, optional): Geçmiş hamlelerin listesi (row, col, value)
+            features (BoardFeatures, optional): Önceden hesaplanmış tahta özellikleri
+            state (ScatterState, optional): Artımlı durum; verilirse kümelenme ve
+                merkezler tahtadan yeniden hesaplanmaz
             
         Returns:
             int: Tahmin (0=belirsiz, 1=W, 2=L)
         """
         # Temel istatistikler
-        stats = self._calculate_basic_stats(matrix)
+        features = self._get_features(matrix, history, features)
+        stats = self._calculate_basic_stats(matrix, features)
         
         if stats['total'] < self.min_data_points:
             return 0  # Yetersiz veri
         
-        # P ve B konumlarını topla
-        w_positions = []
-        l_positions = []
-        
-        for row in range(5):
-            for col in range(5):
-                if matrix[row, col] == 1:
-                    w_positions.append((row, col))
-                elif matrix[row, col] == 2:
-                    l_positions.append((row, col))
-        
-        # Kümelenme seviyesini hesapla
-        w_clustering = self._calculate_clustering(w_positions)
-        l_clustering = self._calculate_clustering(l_positions)
+        # Kümelenme seviyesi ve dağılım merkezleri
+        if state is not None:
+            w_clustering = state.clustering(1)
+            l_clustering = state.clustering(2)
+            w_center = state.center(1)
+            l_center = state.center(2)
+        else:
+            tables = self._shape_tables(matrix.shape)
+            w_clustering, l_clustering = clustering_level(
+                np.stack([features.p_mask.ravel(), features.b_mask.ravel()]), tables)
+            w_center = self._center(features.p_mask, features.p_count, tables)
+            l_center = self._center(features.b_mask, features.b_count, tables)
         
         # Kümelenme eğilimine göre tahmin yap
         if w_clustering > 0.3 and l_clustering > 0.3:
             # Her iki değer de kümelenme eğiliminde
             # Son değere göre tahmin yap
-            if history and history[-1][2] == 1:
+            if features.last_value == 1:
                 return 1  # P
-            elif history and history[-1][2] == 2:
+            elif features.last_value == 2:
                 return 2  # B
         elif w_clustering > 0.3:
             # W kümelenme eğiliminde
@@ -66,20 +199,9 @@ class ScatterAnalysis(BaseAnalysisModel):
             # L kümelenme eğiliminde
             return 2  # B
         
-        # Dağılım merkezlerini hesapla
-        if w_positions:
-            w_center = np.mean(w_positions, axis=0)
-        else:
-            w_center = (2, 2)  # Merkez
-            
-        if l_positions:
-            l_center = np.mean(l_positions, axis=0)
-        else:
-            l_center = (2, 2)  # Merkez
-        
         # En son eklenen konumlara göre merkeze yakınlık analizi
-        if history and len(history) >= 2:
-            last_row, last_col, last_val = history[-1]
+        if features.history_length >= 2:
+            last_row, last_col, last_val = features.last_move
             if last_val == 1:
                 # Son W eklendiyse, bir sonraki W tahmin et
                 distance_to_w = self._calculate_distance((last_row, last_col), w_center)
@@ -98,27 +220,69 @@ class ScatterAnalysis(BaseAnalysisModel):
         # Belirgin bir pattern yoksa genel istatistiklere göre tahmin yap
         return stats['prediction']
     
-    def _calculate_clustering(self, positions):
-        """Pozisyonlar arasındaki kümelenme seviyesini hesaplar"""
-        if len(positions) < 2:
-            return 0
+    def _center(self, mask, count, tables):
+        """Maskedeki hücrelerin dağılım merkezi (hücre yoksa matris merkezi)"""
+        if count == 0:
+            return tables['center']  # Merkez
+        cells = mask.ravel()
+        return (np.sum(tables['cell_rows'][cells]) / count, np.sum(tables['cell_cols'][cells]) / count)
+    
+    def _calculate_distance(self, pos1, pos2):
+        """İki nokta arasındaki Öklid mesafesini hesaplar"""
+        return math.sqrt((pos2[0] - pos1[0])**2 + (pos2[1] - pos1[1])**2)
+    
+    def analyze_batch(self, boards, last_moves=None, features=None):
+        """Serpme analizini N tahta için tek seferde yapar (bkz. BaseAnalysisModel.analyze_batch)"""
+        features = self._get_batch_features(boards, last_moves, features)
+        n = features.size
+        tables = self._shape_tables(features.shape)
+        
+        p_cells = features.p_mask.reshape(n, -1).astype(float)
+        b_cells = features.b_mask.reshape(n, -1).astype(float)
         
-        # Tüm noktalar arası mesafeleri hesapla
-        distances = []
-        for i in range(len(positions)):
-            for j in range(i+1, len(positions)):
-                dist = self._calculate_distance(positions[i], positions[j])
-                distances.append(dist)
+        # Kümelenme seviyesi (ortalama ikili mesafe üzerinden)
+        w_clustering = clustering_level(p_cells, tables)
+        l_clustering = clustering_level(b_cells, tables)
         
-        # Ortalama mesafe
-        avg_distance = np.mean(distances)
+        last_value = features.last_value
+        w_clustered = w_clustering > 0.3
+        l_clustered = l_clustering > 0.3
+        both = w_clustered & l_clustered
         
-        # Kümelenme oranı (1'e yaklaştıkça daha fazla kümelenme var)
-        # 5x5 matris için max mesafe sqrt(8) = 2.83
-        clustering = 1 - (avg_distance / 2.83)
+        predictions = np.zeros(n, dtype=np.int8)
+        predictions = np.where(both & (last_value == 1), 1, predictions)
+        predictions = np.where(both & (last_value == 2), 2, predictions)
+        predictions = np.where(~both & w_clustered, 1, predictions)
+        predictions = np.where(~both & ~w_clustered & l_clustered, 2, predictions)
+        decided = predictions != 0
         
-        return clustering
+        # Dağılım merkezleri (renk yoksa matris merkezi)
+        w_total = p_cells.sum(axis=1)
+        l_total = b_cells.sum(axis=1)
+        safe_w = np.maximum(w_total, 1)
+        safe_l = np.maximum(l_total, 1)
+        cell_rows, cell_cols = tables['cell_rows'], tables['cell_cols']
+        center_row, center_col = tables['center']
+        w_center = (np.where(w_total > 0, p_cells @ cell_rows / safe_w, center_row),
+                    np.where(w_total > 0, p_cells @ cell_cols / safe_w, center_col))
+        l_center = (np.where(l_total > 0, b_cells @ cell_rows / safe_l, center_row),
+                    np.where(l_total > 0, b_cells @ cell_cols / safe_l, center_col))
+        
+        # Son eklenen konumun kendi rengindeki merkeze yakınlığı
+        last_row = features.last_row
+        last_col = features.last_col
+        distance_to_w = np.sqrt((w_center[0] - last_row)**2 + (w_center[1] - last_col)**2)
+        distance_to_l = np.sqrt((l_center[0] - last_row)**2 + (l_center[1] - last_col)**2)
+        
+        center_prediction = np.where(
+            last_value == 1,
+            np.where(distance_to_w < 1.5, 1, 2),
+            np.where(distance_to_l < 1.5, 2, 1))
+        use_center = ~decided & features.has_last & (features.total >= 2)
+        predictions = np.where(use_center, center_prediction, predictions)
+        
+        return self._batch_result(predictions, features)
     
-    def _calculate_distance(self, pos1, pos2):
-        """İki nokta arasındaki Öklid mesafesini hesaplar"""
-        return math.sqrt((pos2[0] - pos1[0])**2 + (pos2[1] - pos1[1])**2)
\ No newline at end of file
+    def _build_shape_tables(self, rows, cols):
+        """Hücre koordinatları ve mesafe tabloları (bkz. scatter_tables)"""
+        return scatter_tables(rows, cols)
\ No newline at end of file
@@ -6,8 +6,15 @@ P ve B Pattern Analiz Uygulaması
 Spiral Pattern Analiz Modeli
 """
 
-import numpy as np
 from models.base_model import BaseAnalysisModel
+from core.traversal import build_spiral_order
+
+
+def spiral_orders(rows, cols):
+    """Dıştan içe ve içten dışa (dıştan içe sıranın tersi) spiral sıraları"""
+    outside_in = build_spiral_order(rows, cols)
+    return [outside_in, outside_in[::-1].copy()]
+
 
 class SpiralAnalysis(BaseAnalysisModel):
     """Spiral şeklindeki patternleri analiz eden model"""
@@ -18,85 +25,35 @@ class SpiralAnalysis(BaseAnalysisModel):
         self.description = "Matriste dıştan içe veya içten dışa spiral şeklinde ilerleyen sonuçları analiz eder."
         self.min_data_points = 5
     
-    def analyze(self, matrix, history=None):
+    def analyze(self, matrix, history=None, features=None):
         """
         Spiral patternleri analiz eder
         
         Args:
-            matrix (numpy.ndarray): 5x5 matris, 0=boş, 1=W, 2=L
+            matrix (numpy.ndarray): Tahta matrisi (varsayılan 5x5), 0=boş, 1=W, 2=L
             history (list, optional): Geçmiş hamlelerin listesi (row, col, value)
+            features (BoardFeatures, optional): Önceden hesaplanmış tahta özellikleri
             
         Returns:
             int: Tahmin (0=belirsiz, 1=W, 2=L)
         """
         # Temel istatistikler
-        stats = self._calculate_basic_stats(matrix)
+        features = self._get_features(matrix, history, features)
+        stats = self._calculate_basic_stats(matrix, features)
         
         if stats['total'] < self.min_data_points:
             return 0  # Yetersiz veri
         
-        # Dıştan içe doğru spiral oluştur
-        spiral_outside_in = []
-        
-        n = 5  # 5x5 matris
-        row_start, col_start = 0, 0
-        row_end, col_end = n-1, n-1
-        
-        while row_start <= row_end and col_start <= col_end:
-            # Üst satır
-            for i in range(col_start, col_end + 1):
-                if matrix[row_start, i] > 0:
-                    spiral_outside_in.append(matrix[row_start, i])
-            row_start += 1
-            
-            # Sağ sütun
-            for i in range(row_start, row_end + 1):
-                if matrix[i, col_end] > 0:
-                    spiral_outside_in.append(matrix[i, col_end])
-            col_end -= 1
-            
-            # Alt satır
-            if row_start <= row_end:
-                for i in range(col_end, col_start - 1, -1):
-                    if matrix[row_end, i] > 0:
-                        spiral_outside_in.append(matrix[row_end, i])
-                row_end -= 1
-            
-            # Sol sütun
-            if col_start <= col_end:
-                for i in range(row_end, row_start - 1, -1):
-                    if matrix[i, col_start] > 0:
-                        spiral_outside_in.append(matrix[i, col_start])
-                col_start += 1
-        
-        # İçten dışa doğru spiral (dıştan içe spirali ters çevirerek elde edilir)
-        spiral_inside_out = spiral_outside_in[::-1]
-        
-        # Her iki spiral için pattern analizi yap
-        spirals = [spiral_outside_in, spiral_inside_out]
-        
+        # Dıştan içe ve içten dışa spiraller için pattern analizi yap
         best_prediction = 0
         best_confidence = 0
         
-        for spiral in spirals:
-            if len(spiral) < 3:
+        for order in self._shape_tables(matrix.shape)['orders']:
+            # Son iki elemanı pattern olarak kullan ve sonrasında gelen P/B sayılarını bul
+            p_count, b_count, length = self._order_followers(matrix, order)
+            if length < 3:
                 continue
             
-            # Son iki elemanı pattern olarak kullan
-            pattern = (spiral[-3], spiral[-2])
-            
-            # Bu pattern sonrası gelen P/B olasılıklarını hesapla
-            p_count = 0
-            b_count = 0
-            
-            for i in range(len(spiral) - 2):
-                if spiral[i] == pattern[0] and spiral[i+1] == pattern[1]:
-                    if i+2 < len(spiral):
-                        if spiral[i+2] == 1:
-                            p_count += 1
-                        elif spiral[i+2] == 2:
-                            b_count += 1
-            
             # Olasılıkları hesapla
             total = p_count + b_count
             if total > 0:
@@ -113,4 +70,19 @@ class SpiralAnalysis(BaseAnalysisModel):
             return best_prediction
         
         # Belirgin bir pattern yoksa genel istatistiklere göre tahmin yap
-        return stats['prediction']
\ No newline at end of file
+        return stats['prediction']
+    
+    def analyze_batch(self, boards, last_moves=None, features=None):
+        """Spiral patternleri N tahta için tek seferde analiz eder (bkz. BaseAnalysisModel.analyze_batch)"""
+        features = self._get_batch_features(boards, last_moves, features)
+        
+        # Dıştan içe ve içten dışa spiraller (ters sıra ile gather, boşlar atılmadan önce)
+        spirals = [self._order_followers_batch(features.boards, order)
+                   for order in self._shape_tables(features.shape)['orders']]
+        
+        predictions = self._best_follower_prediction_batch(spirals)
+        return self._batch_result(predictions, features)
+    
+    def _build_shape_tables(self, rows, cols):
+        """Dıştan içe ve içten dışa spiral sıraları"""
+        return {'orders': spiral_orders(rows, cols)}
\ No newline at end of file
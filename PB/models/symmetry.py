@@ -9,6 +9,114 @@ Simetri Analiz Modeli
 import numpy as np
 from models.base_model import BaseAnalysisModel
 
+
+# 8 dihedral dönüşüm (dihedral_transforms sırası); son dördü ayna simetrileridir
+DIHEDRAL_NAMES = ["identity", "rot90", "rot180", "rot270",
+                  "flipud", "fliplr", "transpose", "anti_transpose"]
+REFLECTION_INDICES = [4, 5, 6, 7]
+
+# Kare olmayan tahtalarda yalnızca yatay ve dikey eksen aynaları tanımlıdır
+# (axis_reflections sırası)
+AXIS_REFLECTION_INDICES = [0, 1]
+
+
+def _build_axis_masks(board_rows=5, board_cols=5):
+    """Yatay ve dikey eksen için karşılaştırılacak hücreler (eksen dışındaki üst/sol yarı)"""
+    rows, cols = np.indices((board_rows, board_cols))
+    return [rows < board_rows // 2, cols < board_cols // 2]
+
+
+def _build_dihedral_masks(size=5):
+    """
+    Her dönüşüm için karşılaştırılacak hücreler (8, n, n)
+    
+    Ayna simetrilerinde analyze() ile aynı hücre çiftleri sayılır: yatay/dikey
+    eksende eksen dışındaki üst/sol yarı (5x5'te ilk iki satır/sütun), köşegenlerde
+    ise üst yarının köşegen dışı hücreleri. Dönmelerde tüm tahta karşılaştırılır.
+    """
+    rows, cols = np.indices((size, size))
+    full = np.ones((size, size), dtype=bool)
+    half = rows < size // 2
+    return np.array([full, full, full, full]
+                    + _build_axis_masks(size, size)     # Yatay ve dikey eksen
+                    + [half & (cols > rows),            # Ana köşegen
+                       half & (rows + cols < size - 1)])  # Ters köşegen
+
+
+DIHEDRAL_MASKS = _build_dihedral_masks()
+REFLECTION_MASKS = DIHEDRAL_MASKS[REFLECTION_INDICES]
+
+
+def reflections(matrix):
+    """
+    Tek bir tahtanın ayna görüntüleri: yatay ve dikey eksen, kare tahtalarda
+    ayrıca ana köşegen ve ters köşegen
+    """
+    mirrors = [np.flipud(matrix), np.fliplr(matrix)]
+    if matrix.shape[0] == matrix.shape[1]:
+        transposed = matrix.T
+        mirrors += [transposed, np.flipud(np.fliplr(transposed))]
+    return mirrors
+
+
+def axis_reflections(boards):
+    """
+    N tahtanın yatay ve dikey eksen aynaları (her boyutta)
+    
+    Args:
+        boards (numpy.ndarray): (N, R, C) tahtalar
+        
+    Returns:
+        numpy.ndarray: (N, 2, R, C)
+    """
+    return np.stack([np.flip(boards, -2), np.flip(boards, -1)], axis=-3)
+
+
+def dihedral_transforms(boards):
+    """
+    N tahtanın 8 dihedral dönüşümünü tek dizide döndürür
+    
+    Args:
+        boards (numpy.ndarray): (N, n, n) kare tahtalar
+        
+    Returns:
+        numpy.ndarray: (N, 8, n, n), DIHEDRAL_NAMES sırasıyla
+    """
+    transposed = np.swapaxes(boards, -1, -2)
+    return np.stack([
+        boards,
+        np.rot90(boards, 1, axes=(-2, -1)),
+        np.rot90(boards, 2, axes=(-2, -1)),
+        np.rot90(boards, 3, axes=(-2, -1)),
+        np.flip(boards, -2),
+        np.flip(boards, -1),
+        transposed,
+        np.flip(transposed, (-2, -1)),
+    ], axis=-3)
+
+
+def symmetry_scores(boards, transformed, masks):
+    """
+    Tahta ile dönüşümleri arasındaki eşleşme oranları
+    
+    Maske içinde iki tarafı da dolu olan hücrelerden kaçının aynı değeri
+    taşıdığını tek vektör ifadesiyle hesaplar.
+    
+    Args:
+        boards (numpy.ndarray): (..., R, C) tahtalar
+        transformed (numpy.ndarray): (..., K, R, C) dönüşümler
+        masks (numpy.ndarray): (K, R, C) karşılaştırılacak hücreler
+        
+    Returns:
+        numpy.ndarray: (..., K) skorlar (karşılaştırılabilir hücre yoksa 0)
+    """
+    boards = boards[..., None, :, :]
+    both = masks & (boards > 0) & (transformed > 0)
+    total = both.sum(axis=(-2, -1))
+    same = (both & (boards == transformed)).sum(axis=(-2, -1))
+    return np.where(total > 0, same / np.maximum(total, 1), 0)
+
+
 class SymmetryAnalysis(BaseAnalysisModel):
     """Simetri analizini yapan model"""
     
@@ -18,91 +126,32 @@ class SymmetryAnalysis(BaseAnalysisModel):
         self.description = "Matristeki sonuçların yatay, dikey veya çapraz simetri gösterip göstermediğini ve bunun sonuçları nasıl etkilediğini inceler."
         self.min_data_points = 5
     
-    def analyze(self, matrix, history=None):
+    def analyze(self, matrix, history=None, features=None):
         """
         Simetri analizini yapar
         
         Args:
-            matrix (numpy.ndarray): 5x5 matris, 0=boş, 1=W, 2=L
+            matrix (numpy.ndarray): Tahta matrisi (varsayılan 5x5), 0=boş, 1=W, 2=L
             history (list, optional): Geçmiş hamlelerin listesi (row, col, value)
+            features (BoardFeatures, optional): Önceden hesaplanmış tahta özellikleri
             
         Returns:
             int: Tahmin (0=belirsiz, 1=W, 2=L)
         """
         # Temel istatistikler
-        stats = self._calculate_basic_stats(matrix)
+        features = self._get_features(matrix, history, features)
+        stats = self._calculate_basic_stats(matrix, features)
         
         if stats['total'] < self.min_data_points:
             return 0  # Yetersiz veri
         
-        # Boş olmayan hücreleri işaretle
-        non_empty = matrix > 0
-        
-        # Yatay simetri skoru (yatay eksene göre)
-        h_sym_score = 0
-        h_sym_total = 0
-        
-        for row in range(2):  # Sadece üst yarıyı kontrol et (orta satır hariç)
-            for col in range(5):
-                mirror_row = 4 - row  # Alttan ayna görüntüsü
-                
-                # Her iki hücre de doluysa karşılaştır
-                if non_empty[row, col] and non_empty[mirror_row, col]:
-                    h_sym_total += 1
-                    if matrix[row, col] == matrix[mirror_row, col]:
-                        h_sym_score += 1
-        
-        h_symmetry = h_sym_score / h_sym_total if h_sym_total > 0 else 0
-        
-        # Dikey simetri skoru (dikey eksene göre)
-        v_sym_score = 0
-        v_sym_total = 0
-        
-        for row in range(5):
-            for col in range(2):  # Sadece sol yarıyı kontrol et (orta sütun hariç)
-                mirror_col = 4 - col  # Sağdan ayna görüntüsü
-                
-                # Her iki hücre de doluysa karşılaştır
-                if non_empty[row, col] and non_empty[row, mirror_col]:
-                    v_sym_total += 1
-                    if matrix[row, col] == matrix[row, mirror_col]:
-                        v_sym_score += 1
-        
-        v_symmetry = v_sym_score / v_sym_total if v_sym_total > 0 else 0
-        
-        # Çapraz simetri skoru (ana köşegen ve ters köşegene göre)
-        d1_sym_score = 0
-        d1_sym_total = 0
-        
-        for i in range(2):  # Sadece köşegenin üst kısmını kontrol et (orta hariç)
-            for j in range(i, 5):
-                if i != j:  # Köşegendeki hücreleri hariç tut
-                    # Ana köşegene göre simetri
-                    if non_empty[i, j] and non_empty[j, i]:
-                        d1_sym_total += 1
-                        if matrix[i, j] == matrix[j, i]:
-                            d1_sym_score += 1
-        
-        d1_symmetry = d1_sym_score / d1_sym_total if d1_sym_total > 0 else 0
-        
-        # Ters köşegen simetrisi
-        d2_sym_score = 0
-        d2_sym_total = 0
-        
-        for i in range(2):  # Sadece köşegenin üst kısmını kontrol et (orta hariç)
-            for j in range(5-i-1):
-                if i != 4-j:  # Köşegendeki hücreleri hariç tut
-                    # Ters köşegene göre simetri
-                    if non_empty[i, j] and non_empty[4-j, 4-i]:
-                        d2_sym_total += 1
-                        if matrix[i, j] == matrix[4-j, 4-i]:
-                            d2_sym_score += 1
-        
-        d2_symmetry = d2_sym_score / d2_sym_total if d2_sym_total > 0 else 0
+        # Ayna görüntüleri ve simetri skorları (yatay, dikey, ana köşegen, ters köşegen)
+        mirrors = reflections(matrix)
+        reflection_masks = self._shape_tables(matrix.shape)['reflection_masks']
+        axis_scores = symmetry_scores(matrix, np.array(mirrors), reflection_masks).tolist()
         
         # Genel simetri skoru
-        symmetry_scores = [h_symmetry, v_symmetry, d1_symmetry, d2_symmetry]
-        valid_scores = [s for s in symmetry_scores if s > 0]
+        valid_scores = [s for s in axis_scores if s > 0]
         
         if valid_scores:
             overall_symmetry = sum(valid_scores) / len(valid_scores)
@@ -112,38 +161,84 @@ class SymmetryAnalysis(BaseAnalysisModel):
         # Simetri analizi sonuçlarına göre tahmin
         if overall_symmetry > 0.7:
             # Yüksek simetri var, simetriye göre pattern devam eder
-            if history and len(history) > 0:
-                last_row, last_col, last_val = history[-1]
-                
-                # Yatay simetri yüksekse, yatay ayna noktasına bak
-                if h_symmetry > 0.6:
-                    mirror_row = 4 - last_row
-                    if 0 <= mirror_row < 5 and matrix[mirror_row, last_col] > 0:
-                        return matrix[mirror_row, last_col]  # Ayna görüntüsü değeri
-                
-                # Dikey simetri yüksekse, dikey ayna noktasına bak
-                if v_symmetry > 0.6:
-                    mirror_col = 4 - last_col
-                    if 0 <= mirror_col < 5 and matrix[last_row, mirror_col] > 0:
-                        return matrix[last_row, mirror_col]  # Ayna görüntüsü değeri
+            if features.last_move:
+                last_row, last_col, last_val = features.last_move
                 
-                # Çapraz simetri yüksekse, çapraz ayna noktasına bak
-                if d1_symmetry > 0.6:
-                    if matrix[last_col, last_row] > 0:
-                        return matrix[last_col, last_row]  # Ana köşegen ayna görüntüsü
-                
-                if d2_symmetry > 0.6:
-                    if matrix[4-last_col, 4-last_row] > 0:
-                        return matrix[4-last_col, 4-last_row]  # Ters köşegen ayna görüntüsü
+                # Simetrisi yüksek eksenlerin ayna noktasındaki değere bak
+                # (ayna görüntüsünün son hamle konumundaki hücresi)
+                for score, mirror in zip(axis_scores, mirrors):
+                    if score > 0.6 and mirror[last_row, last_col] > 0:
+                        return mirror[last_row, last_col]  # Ayna görüntüsü değeri
         
         # Simetri kırılma eğilimi
-        if 0.3 < overall_symmetry < 0.7 and history and len(history) > 0:
+        if 0.3 < overall_symmetry < 0.7 and features.last_move:
             # Kısmi simetri var, kırılma eğilimi olabilir
-            last_val = history[-1][2]  # Son hamlenin değerini al
+            last_val = features.last_value  # Son hamlenin değerini al
             if last_val == 1:
                 return 2  # W sonrası L
             elif last_val == 2:
                 return 1  # L sonrası W
         
         # Belirgin bir pattern yoksa genel istatistiklere göre tahmin yap
-        return stats['prediction']
\ No newline at end of file
+        return stats['prediction']
+    
+    def analyze_batch(self, boards, last_moves=None, features=None):
+        """Simetri analizini N tahta için tek seferde yapar (bkz. BaseAnalysisModel.analyze_batch)"""
+        features = self._get_batch_features(boards, last_moves, features)
+        n = features.size
+        
+        # Kare tahtalarda 8 dihedral dönüşümün skorları tek seferde (N, 8), diğerlerinde
+        # yalnızca eksen aynaları (N, 2); model ayna simetrilerini kullanır
+        tables = self._shape_tables(features.shape)
+        transformed = tables['transform'](features.boards)
+        all_scores = symmetry_scores(features.boards, transformed, tables['masks'])
+        reflection_indices = tables['reflection_indices']
+        scores = [all_scores[:, i] for i in reflection_indices]
+        
+        # Genel simetri skoru: pozitif skorların sıralı ortalaması
+        score_sum = np.zeros(n)
+        score_count = np.zeros(n, dtype=np.intp)
+        for score in scores:
+            score_sum = score_sum + np.where(score > 0, score, 0.0)
+            score_count = score_count + (score > 0)
+        overall = np.where(score_count > 0, score_sum / np.maximum(score_count, 1), 0)
+        
+        index = np.arange(n)
+        last_row = features.last_row
+        last_col = features.last_col
+        has_last = features.has_last
+        
+        # Ayna görüntülerinin son hamle konumundaki değerleri
+        mirrors = [transformed[index, i, last_row, last_col] for i in reflection_indices]
+        
+        predictions = np.zeros(n, dtype=np.int8)
+        symmetric = has_last & (overall > 0.7)
+        for score, mirror in zip(scores, mirrors):
+            use = symmetric & (predictions == 0) & (score > 0.6) & (mirror > 0)
+            predictions = np.where(use, mirror, predictions)
+        
+        # Simetri kırılma eğilimi
+        breaking = has_last & (predictions == 0) & (overall > 0.3) & (overall < 0.7)
+        predictions = np.where(breaking & (features.last_value == 1), 2, predictions)
+        predictions = np.where(breaking & (features.last_value == 2), 1, predictions)
+        
+        return self._batch_result(predictions, features)
+    
+    def _build_shape_tables(self, rows, cols):
+        """Dönüşüm fonksiyonu, karşılaştırma maskeleri ve ayna simetrilerinin indeksleri"""
+        if rows == cols:
+            masks = _build_dihedral_masks(rows)
+            return {
+                'transform': dihedral_transforms,
+                'masks': masks,
+                'reflection_indices': REFLECTION_INDICES,
+                'reflection_masks': masks[REFLECTION_INDICES]
+            }
+        
+        masks = np.array(_build_axis_masks(rows, cols))
+        return {
+            'transform': axis_reflections,
+            'masks': masks,
+            'reflection_indices': AXIS_REFLECTION_INDICES,
+            'reflection_masks': masks
+        }
\ No newline at end of file
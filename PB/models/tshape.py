@@ -6,10 +6,28 @@ P ve B Pattern Analiz Uygulaması
 T-Şekli Pattern Analiz Modeli
 """
 
-import numpy as np
-from models.base_model import BaseAnalysisModel
+from models.base_model import StencilAnalysisModel
 
-class TShapeAnalysis(BaseAnalysisModel):
+
+def _build_t_shapes(rows=5, cols=5):
+    """4 yöndeki (┳ ┣ ┻ ┫) tüm T şekli yerleşimlerinin hücre indekslerini oluşturur"""
+    shapes = []
+    for i in range(4):
+        for row in range(rows - 2):
+            for col in range(cols - 2):
+                if i == 0:  # ┳ şekli (yukarı T)
+                    cells = [(row, col+c) for c in range(3)] + [(row+r, col+1) for r in range(1, 3)]
+                elif i == 1:  # ┣ şekli (sola T)
+                    cells = [(row+r, col) for r in range(3)] + [(row+1, col+c) for c in range(1, 3)]
+                elif i == 2:  # ┻ şekli (aşağı T)
+                    cells = [(row+2, col+c) for c in range(3)] + [(row+r, col+1) for r in range(2)]
+                else:  # ┫ şekli (sağa T)
+                    cells = [(row+r, col+2) for r in range(3)] + [(row+1, col+c) for c in range(2)]
+                shapes.append([r * cols + c for r, c in cells])
+    return shapes
+
+
+class TShapeAnalysis(StencilAnalysisModel):
     """T şeklindeki patternleri analiz eden model"""
     
     def __init__(self):
@@ -18,87 +36,6 @@ class TShapeAnalysis(BaseAnalysisModel):
         self.description = "Matris üzerinde T şeklinde ilerleyen sonuçları analiz eder."
         self.min_data_points = 5
     
-    def analyze(self, matrix, history=None):
-        """
-        T şeklindeki patternleri analiz eder
-        
-        Args:
-            matrix (numpy.ndarray): 5x5 matris, 0=boş, 1=W, 2=L
-            history (list, optional): Geçmiş hamlelerin listesi (row, col, value)
-            
-        Returns:
-            int: Tahmin (0=belirsiz, 1=W, 2=L)
-        """
-        # Temel istatistikler
-        stats = self._calculate_basic_stats(matrix)
-        
-        if stats['total'] < self.min_data_points:
-            return 0  # Yetersiz veri
-        
-        # Tüm olası T şekilleri için P/B oranlarını topla
-        t_shapes = []
-        
-        # 4 farklı yönde T şekli oluştur: ┳ ┣ ┻ ┫
-        for i in range(4):
-            for row in range(3):
-                for col in range(3):
-                    shape = []
-                    if i == 0:  # ┳ şekli (yukarı T)
-                        for c in range(3):
-                            if matrix[row, col+c] > 0:
-                                shape.append(matrix[row, col+c])
-                        for r in range(1, 3):
-                            if matrix[row+r, col+1] > 0:
-                                shape.append(matrix[row+r, col+1])
-                    elif i == 1:  # ┣ şekli (sola T)
-                        for r in range(3):
-                            if matrix[row+r, col] > 0:
-                                shape.append(matrix[row+r, col])
-                        for c in range(1, 3):
-                            if matrix[row+1, col+c] > 0:
-                                shape.append(matrix[row+1, col+c])
-                    elif i == 2:  # ┻ şekli (aşağı T)
-                        for c in range(3):
-                            if matrix[row+2, col+c] > 0:
-                                shape.append(matrix[row+2, col+c])
-                        for r in range(2):
-                            if matrix[row+r, col+1] > 0:
-                                shape.append(matrix[row+r, col+1])
-                    elif i == 3:  # ┫ şekli (sağa T)
-                        for r in range(3):
-                            if matrix[row+r, col+2] > 0:
-                                shape.append(matrix[row+r, col+2])
-                        for c in range(2):
-                            if matrix[row+1, col+c] > 0:
-                                shape.append(matrix[row+1, col+c])
-                                
-                    if len(shape) >= 4:  # En az 4 değer olmalı
-                        t_shapes.append(shape)
-        
-        # T şekillerine göre tahmin yap
-        p_prob = 0
-        b_prob = 0
-        total_shapes = 0
-        
-        for shape in t_shapes:
-            p_count = shape.count(1)
-            b_count = shape.count(2)
-            total = p_count + b_count
-            
-            if total > 0:
-                p_prob += p_count / total
-                b_prob += b_count / total
-                total_shapes += 1
-        
-        # Sonucu belirle
-        if total_shapes > 0:
-            p_prob /= total_shapes
-            b_prob /= total_shapes
-            
-            if p_prob > b_prob:
-                return 1  # P tahmini
-            elif b_prob > p_prob:
-                return 2  # B tahmini
-        
-        # Belirgin bir pattern yoksa genel istatistiklere göre tahmin yap
-        return stats['prediction']
\ No newline at end of file
+    def _build_stencil_shapes(self, rows, cols):
+        """Tahtaya sığan tüm T şekli yerleşimleri (bkz. _build_t_shapes)"""
+        return _build_t_shapes(rows, cols)
\ No newline at end of file
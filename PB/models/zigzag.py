@@ -6,8 +6,8 @@ P ve B Pattern Analiz Uygulaması
 Zig-Zag Pattern Analiz Modeli
 """
 
-import numpy as np
 from models.base_model import BaseAnalysisModel
+from core.traversal import build_zigzag_orders
 
 class ZigzagAnalysis(BaseAnalysisModel):
     """Zig-zag patternlerini analiz eden model"""
@@ -18,88 +18,35 @@ class ZigzagAnalysis(BaseAnalysisModel):
         self.description = "Matris üzerinde zig-zag şeklinde ilerleyen sonuçları inceler."
         self.min_data_points = 5
     
-    def analyze(self, matrix, history=None):
+    def analyze(self, matrix, history=None, features=None):
         """
         Zig-zag patternleri analiz eder
         
         Args:
-            matrix (numpy.ndarray): 5x5 matris, 0=boş, 1=W, 2=L
+            matrix (numpy.ndarray): Tahta matrisi (varsayılan 5x5), 0=boş, 1=W, 2=L
             history (list, optional): Geçmiş hamlelerin listesi (row, col, value)
+            features (BoardFeatures, optional): Önceden hesaplanmış tahta özellikleri
             
         Returns:
             int: Tahmin (0=belirsiz, 1=W, 2=L)
         """
         # Temel istatistikler
-        stats = self._calculate_basic_stats(matrix)
+        features = self._get_features(matrix, history, features)
+        stats = self._calculate_basic_stats(matrix, features)
         
         if stats['total'] < self.min_data_points:
             return 0  # Yetersiz veri
         
-        # Farklı zig-zag patternleri oluştur
-        zigzags = []
-        
-        # Yatay zigzag (soldan sağa, sağdan sola alternatif olarak)
-        horizontal_zigzag = []
-        for row in range(5):
-            if row % 2 == 0:  # Soldan sağa
-                for col in range(5):
-                    if matrix[row, col] > 0:
-                        horizontal_zigzag.append(matrix[row, col])
-            else:  # Sağdan sola
-                for col in range(4, -1, -1):
-                    if matrix[row, col] > 0:
-                        horizontal_zigzag.append(matrix[row, col])
-        
-        zigzags.append(horizontal_zigzag)
-        
-        # Dikey zigzag (yukarıdan aşağı, aşağıdan yukarı alternatif olarak)
-        vertical_zigzag = []
-        for col in range(5):
-            if col % 2 == 0:  # Yukarıdan aşağı
-                for row in range(5):
-                    if matrix[row, col] > 0:
-                        vertical_zigzag.append(matrix[row, col])
-            else:  # Aşağıdan yukarı
-                for row in range(4, -1, -1):
-                    if matrix[row, col] > 0:
-                        vertical_zigzag.append(matrix[row, col])
-        
-        zigzags.append(vertical_zigzag)
-        
-        # Çapraz zigzag (ana köşegen boyunca)
-        diagonal_zigzag = []
-        for i in range(5):
-            if matrix[i, i] > 0:
-                diagonal_zigzag.append(matrix[i, i])
-        for i in range(3, -1, -1):
-            if matrix[i, 4-i] > 0:
-                diagonal_zigzag.append(matrix[i, 4-i])
-        
-        zigzags.append(diagonal_zigzag)
-        
-        # Her zigzag pattern için analiz yap
+        # Yatay, dikey ve çapraz zig-zag dizileri için pattern analizi yap (indeks tablolarından)
         best_prediction = 0
         best_confidence = 0
         
-        for zigzag in zigzags:
-            if len(zigzag) < 3:
+        for order in self._shape_tables(matrix.shape)['orders']:
+            # Son iki elemanı pattern olarak kullan ve sonrasında gelen P/B sayılarını bul
+            p_count, b_count, length = self._order_followers(matrix, order)
+            if length < 3:
                 continue
             
-            # Son iki elemanı pattern olarak kullan
-            pattern = (zigzag[-3], zigzag[-2])
-            
-            # Bu pattern sonrası gelen P/B olasılıklarını hesapla
-            p_count = 0
-            b_count = 0
-            
-            for i in range(len(zigzag) - 2):
-                if zigzag[i] == pattern[0] and zigzag[i+1] == pattern[1]:
-                    if i+2 < len(zigzag):
-                        if zigzag[i+2] == 1:
-                            p_count += 1
-                        elif zigzag[i+2] == 2:
-                            b_count += 1
-            
             # Olasılıkları hesapla
             total = p_count + b_count
             if total > 0:
@@ -116,4 +63,18 @@ class ZigzagAnalysis(BaseAnalysisModel):
             return best_prediction
         
         # Belirgin bir pattern yoksa genel istatistiklere göre tahmin yap
-        return stats['prediction']
\ No newline at end of file
+        return stats['prediction']
+    
+    def analyze_batch(self, boards, last_moves=None, features=None):
+        """Zig-zag patternleri N tahta için tek seferde analiz eder (bkz. BaseAnalysisModel.analyze_batch)"""
+        features = self._get_batch_features(boards, last_moves, features)
+        
+        zigzags = [self._order_followers_batch(features.boards, order)
+                   for order in self._shape_tables(features.shape)['orders']]
+        
+        predictions = self._best_follower_prediction_batch(zigzags)
+        return self._batch_result(predictions, features)
+    
+    def _build_shape_tables(self, rows, cols):
+        """Yatay, dikey ve çapraz zig-zag sıraları"""
+        return {'orders': build_zigzag_orders(rows, cols)}
\ No newline at end of file
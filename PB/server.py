@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Baccarat P/B Pattern Analiz Uygulaması - Çok masalı tahmin sunucusu
+localhost üzerinde masa kimliğiyle anahtarlanan asyncio HTTP sunucusu
+
+Uç noktalar (yanıtlar JSON):
+    POST   /tables/<id>   Gövdedeki P/B sonuçlarını masaya ekler, tüm modellerin
+                          tahminlerini ve Hibrit güvenini döndürür
+    GET    /tables/<id>   Masanın el sayısı ve model istatistikleri
+    DELETE /tables/<id>   Masayı siler
+    GET    /stats         Toplam masa sayısı
+
+Masalar kimliklerine göre işçilere (shard) dağıtılır; her işçi kendi masalarını
+tutan tek işlemli bir yürütücüdür. Analiz işçide çalıştığından olay döngüsü
+hiçbir zaman modelleri beklemez, aynı masanın istekleri de sırayla işlenir.
+
+Örnek:
+    python server.py --port 8765
+    curl -X POST -d "P B B" http://127.0.0.1:8765/tables/masa-1
+"""
+
+import os
+import sys
+import json
+import zlib
+import asyncio
+import argparse
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from core.engine import BOARD_SHAPE
+from core.tables import init_worker, worker_call
+from core.importer import class_table, parse_strict
+
+HTTP_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+                500: "Internal Server Error"}
+
+# Gövde sembolleri (stream, batch ve import_shoes ile aynı alfabe)
+BODY_TABLE = class_table()
+
+# İstek gövdesi için üst sınır (bayt)
+MAX_BODY_SIZE = 1 << 20
+
+
+class ShardPool:
+    """
+    Masaları işçilere dağıtan yürütücü havuzu
+
+    Her işçi tek işçili bir yürütücüdür; böylece bir masanın tüm istekleri aynı
+    işçide, geliş sırasıyla çalışır. workers=0 ise tüm masalar bu süreçteki
+    tek bir iş parçacığında tutulur.
+    """
+
+    def __init__(self, workers=None, shape=BOARD_SHAPE):
+        if workers == 0:
+            self.executors = [ThreadPoolExecutor(max_workers=1, initializer=init_worker, initargs=(shape,))]
+        else:
+            workers = workers or os.cpu_count() or 1
+            self.executors = [ProcessPoolExecutor(max_workers=1, initializer=init_worker, initargs=(shape,))
+                              for _ in range(workers)]
+
+    def executor(self, table_id):
+        """Masanın işçisi (kimliğin sabit özetine göre)"""
+        return self.executors[zlib.crc32(table_id.encode("utf-8")) % len(self.executors)]
+
+    async def call(self, table_id, method, *args):
+        """Masanın işçisinde bir kayıt metodunu çalıştırır"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor(table_id), worker_call, method, table_id, *args)
+
+    async def count(self):
+        """Tüm işçilerdeki toplam masa sayısı"""
+        loop = asyncio.get_running_loop()
+        counts = await asyncio.gather(*(loop.run_in_executor(executor, worker_call, "count")
+                                        for executor in self.executors))
+        return sum(counts)
+
+    def shutdown(self):
+        for executor in self.executors:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+class PredictionServer:
+    """Masa isteklerini işçilere yönlendiren HTTP/1.1 (keep-alive) sunucusu"""
+
+    def __init__(self, pool):
+        self.pool = pool
+
+    async def handle_connection(self, reader, writer):
+        """Bir bağlantıdaki istekleri sırayla yanıtlar"""
+        try:
+            while True:
+                request = await self._read_request(reader)
+                if request is None:
+                    break
+                method, path, body, keep_alive = request
+
+                try:
+                    status, payload = await self.dispatch(method, path, body)
+                except Exception as error:  # İşçi hatası bağlantıyı düşürmesin
+                    status, payload = 500, {"error": str(error)}
+
+                self._write_response(writer, status, payload, keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def dispatch(self, method, path, body):
+        """
+        İsteği ilgili işleme yönlendirir
+
+        Returns:
+            tuple: (HTTP durum kodu, JSON yanıt)
+        """
+        parts = [part for part in path.split("?", 1)[0].split("/") if part]
+
+        if parts == ["stats"] and method == "GET":
+            return 200, {"tables": await self.pool.count()}
+
+        if len(parts) != 2 or parts[0] != "tables":
+            return 404, {"error": "bulunamadı"}
+        table_id = parts[1]
+
+        if method == "POST":
+            # Gövde "P B B" ya da bitişik "PBB" olabilir; başka karakter kabul edilmez
+            try:
+                outcomes = parse_strict(body, BODY_TABLE).tolist()
+            except ValueError as error:
+                return 400, {"error": str(error)}
+            if not outcomes:
+                return 400, {"error": "gövdede P/B sonucu yok"}
+            return 200, await self.pool.call(table_id, "add", outcomes)
+
+        if method == "GET":
+            state = await self.pool.call(table_id, "state")
+            return (200, state) if state is not None else (404, {"error": "masa yok"})
+
+        if method == "DELETE":
+            return 200, {"table": table_id, "deleted": await self.pool.call(table_id, "drop")}
+
+        return 405, {"error": "desteklenmeyen metod"}
+
+    async def _read_request(self, reader):
+        """
+        Bir HTTP isteğini okur
+
+        Returns:
+            tuple: (metod, yol, gövde, keep-alive) ya da bağlantı kapandıysa None
+        """
+        request_line = await reader.readline()
+        if not request_line:
+            return None
+        method, path, version = request_line.decode("latin-1").split()
+
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        length = int(headers.get("content-length", 0))
+        if length > MAX_BODY_SIZE:
+            raise ValueError("istek gövdesi çok büyük")
+        body = await reader.readexactly(length) if length else b""
+
+        connection = headers.get("connection", "").lower()
+        keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+        return method.upper(), path, body, keep_alive
+
+    def _write_response(self, writer, status, payload, keep_alive):
+        """JSON yanıtını yazar"""
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        head = (f"HTTP/1.1 {status} {HTTP_REASONS.get(status, '')}\r\n"
+                f"Content-Type: application/json; charset=utf-8\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+        writer.write(head.encode("latin-1") + body)
+
+
+async def serve(host, port, workers):
+    """Sunucuyu başlatır ve durdurulana kadar çalıştırır"""
+    pool = ShardPool(workers)
+    server = await asyncio.start_server(PredictionServer(pool).handle_connection, host, port)
+    print(f"Tahmin sunucusu http://{host}:{port} ({len(pool.executors)} işçi)", file=sys.stderr)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        pool.shutdown()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Çok masalı P/B tahmin sunucusu")
+    parser.add_argument("--host", default="127.0.0.1", help="Dinlenecek adres (varsayılan: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8765, help="Dinlenecek port")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="İşçi süreç sayısı (varsayılan: CPU sayısı, 0: tek süreç)")
+    args = parser.parse_args(argv)
+
+    try:
+        asyncio.run(serve(args.host, args.port, args.workers))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Baccarat P/B Pattern Analiz Uygulaması - Akış modu
+Sonuçları stdin'den, bir FIFO'dan ya da takip edilen bir dosyadan okur
+
+Her el için tüm modellerin tahminleri JSON satırı olarak stdout'a yazılır;
+el başına işlem süresi yüzdelikleri stderr'e raporlanır.
+
+Örnekler:
+    python stream.py < shoe.txt
+    python stream.py /tmp/feed.fifo
+    python stream.py --follow table1.log
+"""
+
+import sys
+import json
+import time
+import argparse
+from array import array
+import numpy as np
+from core.session import AnalysisSession
+from core.importer import class_table, parse_outcomes
+
+# Girdi sembolleri core.importer kurallarıyla okunur (P/B ya da W/L, T yok sayılır)
+TOKEN_TABLE = class_table()
+
+# Raporlanan gecikme yüzdelikleri
+LATENCY_PERCENTILES = (50, 90, 99, 99.9)
+
+
+def read_lines(source, follow=False, poll_interval=0.1):
+    """
+    Kaynaktaki satırları sırayla üretir
+
+    Args:
+        source (file): Okunacak akış (stdin, FIFO veya dosya)
+        follow (bool): Dosya sonunda bitirmek yerine yeni satırları bekle (tail -f)
+        poll_interval (float): Takip modunda bekleme aralığı (saniye)
+
+    Yields:
+        str: Satır
+    """
+    while True:
+        line = source.readline()
+        if line:
+            yield line
+        elif follow:
+            time.sleep(poll_interval)
+        else:
+            return
+
+
+def parse_tokens(line):
+    """
+    Satırdaki sonuç sembollerini sonuç kodlarına çevirir
+
+    "P B B", "PBB" ve "P,B,B" aynı üç eli verir; batch ve import_shoes ile aynı
+    kurallar geçerlidir (sonuç sembolü dışında harf içeren kelimeler atlanır).
+    """
+    return parse_outcomes(line.encode("utf-8"), TOKEN_TABLE)[0].tolist()
+
+
+def latency_summary(latencies):
+    """
+    El başına işlem sürelerinin özeti
+
+    Args:
+        latencies (sequence): Saniye cinsinden süreler
+
+    Returns:
+        dict: 'hands' ve mikrosaniye cinsinden 'latency_us' (yüzdelikler, ortalama, en büyük)
+    """
+    if len(latencies) == 0:
+        return {"hands": 0, "latency_us": {}}
+
+    values = np.asarray(latencies, dtype=np.float64) * 1e6
+    summary = {f"p{percentile:g}": round(float(value), 1)
+               for percentile, value in zip(LATENCY_PERCENTILES, np.percentile(values, LATENCY_PERCENTILES))}
+    summary["mean"] = round(float(values.mean()), 1)
+    summary["max"] = round(float(values.max()), 1)
+    return {"hands": len(values), "latency_us": summary}
+
+
+def hand_record(hand, value, analysis, latency):
+    """Bir elin JSON satırı (tahminler: 0=belirsiz, 1=P, 2=B; yetersiz veride null)"""
+    record = {
+        "hand": hand,
+        "outcome": "P" if value == 1 else "B",
+        "predictions": None,
+        "hibrit_confidence": None,
+        "latency_us": round(latency * 1e6, 1)
+    }
+    if analysis is not None:
+        record["predictions"] = {name: int(prediction) for name, prediction in analysis['predictions'].items()}
+        record["hibrit_confidence"] = round(float(analysis['hibrit_confidence']), 4)
+    return record
+
+
+def run_stream(source, output, follow=False, report_every=0, quiet=False):
+    """
+    Kaynaktaki sonuçları oturumdan geçirir ve tahminleri yazar
+
+    Args:
+        source (file): Girdi akışı
+        output (file): JSON satırlarının yazılacağı akış
+        follow (bool): Dosya sonunda yeni satırları bekle
+        report_every (int): Bu kadar elde bir gecikme özetini stderr'e yaz (0=yalnızca sonda)
+        quiet (bool): Tahmin satırlarını yazma (yalnızca gecikme özeti)
+
+    Returns:
+        dict: latency_summary sonucu
+    """
+    session = AnalysisSession()
+    latencies = array("d")
+
+    try:
+        for line in read_lines(source, follow):
+            for value in parse_tokens(line):
+                started = time.perf_counter()
+                analysis = session.add(value)
+                latency = time.perf_counter() - started
+                latencies.append(latency)
+
+                if not quiet:
+                    output.write(json.dumps(hand_record(len(latencies), value, analysis, latency),
+                                            ensure_ascii=False) + "\n")
+                    output.flush()
+
+                if report_every and len(latencies) % report_every == 0:
+                    print(json.dumps(latency_summary(latencies)), file=sys.stderr, flush=True)
+    except KeyboardInterrupt:
+        pass
+
+    return latency_summary(latencies)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="P/B sonuçlarını akıştan okuyup tahmin üretir")
+    parser.add_argument("source", nargs="?", default="-",
+                        help="Girdi dosyası veya FIFO (varsayılan: stdin)")
+    parser.add_argument("-f", "--follow", action="store_true",
+                        help="Dosya sonunda bitirme, eklenen satırları bekle (tail -f)")
+    parser.add_argument("--report-every", type=int, default=0,
+                        help="Her N elde bir gecikme özetini stderr'e yaz")
+    parser.add_argument("-q", "--quiet", action="store_true",
+                        help="Tahmin satırlarını yazma, yalnızca gecikme özetini raporla")
+    args = parser.parse_args(argv)
+
+    if args.source == "-":
+        summary = run_stream(sys.stdin, sys.stdout, args.follow, args.report_every, args.quiet)
+    else:
+        with open(args.source, encoding="utf-8") as source:
+            summary = run_stream(source, sys.stdout, args.follow, args.report_every, args.quiet)
+
+    print(json.dumps(summary), file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
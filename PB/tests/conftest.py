@@ -0,0 +1,8 @@
+# -*- coding: utf-8 -*-
+
+"""Testler PB/ dizininden çalıştırılan uygulamayla aynı içe aktarma yollarını kullanır"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
\ No newline at end of file
@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+
+"""Toplu analiz girdilerinin okunması (P/B ve W/L shoe dosyaları)"""
+
+import pytest
+import numpy as np
+from batch import run_inputs
+
+
+def write_shoe(path, outcomes, letters):
+    path.write_text(" ".join(letters[value - 1] for value in outcomes) + "\n", encoding="utf-8")
+    return str(path)
+
+
+def test_wl_and_pb_files_give_same_counters(tmp_path):
+    outcomes = np.random.default_rng(7).integers(1, 3, 60)
+    pb = run_inputs([write_shoe(tmp_path / "pb.txt", outcomes, "PB")], jobs=1)
+    wl = run_inputs([write_shoe(tmp_path / "wl.txt", outcomes, "WL")], jobs=1)
+
+    assert pb["shoes"] == wl["shoes"] == 1
+    assert pb["hands"] == wl["hands"] == len(outcomes)
+    assert pb["models"] == wl["models"]
+
+
+def test_header_words_are_not_hands(tmp_path):
+    path = tmp_path / "header.txt"
+    path.write_text("Player Banker\nP B B P\n", encoding="utf-8")
+    assert run_inputs([str(path)], jobs=1)["hands"] == 4
+
+
+def test_inputs_without_hands_fail(tmp_path, capsys):
+    path = tmp_path / "empty.txt"
+    path.write_text("tarih: 2024-01-02\n", encoding="utf-8")
+    with pytest.raises(ValueError):
+        run_inputs([str(path)], jobs=1)
+    assert "empty.txt" in capsys.readouterr().err
\ No newline at end of file
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+
+"""Boyuta özgü bitboard bölge maskeleri ile NumPy bölge sayımları"""
+
+import pytest
+import numpy as np
+from core.bitboard import Bitboard, quadrant_regions, shape_masks
+from core.features import BoardFeatures
+from core.traversal import build_diagonal_lines
+
+
+@pytest.mark.parametrize("shape", [(5, 5), (6, 6), (4, 7), (2, 9), (1, 9), (1, 1)])
+def test_region_counts_match_numpy(shape):
+    rows, cols = shape
+    masks = shape_masks(rows, cols)
+    rng = np.random.default_rng(sum(shape))
+
+    for _ in range(20):
+        matrix = rng.integers(0, 3, shape)
+        bitboard = Bitboard.from_matrix(matrix)
+        p_mask = matrix == 1
+        b_mask = matrix == 2
+
+        def counts(region):
+            return int(p_mask[region].sum()), int(b_mask[region].sum())
+
+        assert [bitboard.count(bits) for bits in masks['rows']] == [counts(np.s_[row, :]) for row in range(rows)]
+        assert [bitboard.count(bits) for bits in masks['cols']] == [counts(np.s_[:, col]) for col in range(cols)]
+        assert [bitboard.count(bits) for bits in masks['quadrants']] == [
+            counts(np.s_[top:bottom, left:right]) for top, left, bottom, right in quadrant_regions(rows, cols)]
+        assert [bitboard.count(bits) for bits in masks['diagonals']] == [
+            (int(p_mask.ravel()[line].sum()), int(b_mask.ravel()[line].sum()))
+            for line in build_diagonal_lines(rows, cols)]
+        assert bitboard.count(masks['inner']) == counts(np.s_[1:rows - 1, 1:cols - 1])
+        assert bitboard.filled_count(masks['border']) + bitboard.filled_count(masks['inner']) == \
+            int((matrix > 0).sum())
+        assert bitboard.count(masks['edge'] | masks['corner']) == bitboard.count(masks['border'])
+
+        features = BoardFeatures(matrix)
+        assert [bitboard.p_count(bits) for bits in masks['neighbors']] == features.p_neighbors.ravel().tolist()
+        assert [bitboard.b_count(bits) for bits in masks['neighbors']] == features.b_neighbors.ravel().tolist()
\ No newline at end of file
@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+
+"""Derlem dosyasının yazılması ve yarıda kalan yazımlar"""
+
+import pytest
+import numpy as np
+from core.corpus import Corpus, CorpusWriter
+
+
+def test_written_corpus_round_trips(tmp_path):
+    path = str(tmp_path / "shoes.pbc")
+    shoes = [np.array([1, 2, 2, 1, 1], dtype=np.int8), np.array([2, 1, 2], dtype=np.int8)]
+    with CorpusWriter(path) as writer:
+        for shoe in shoes:
+            writer.add_shoe(shoe, source="test.txt")
+
+    with Corpus(path) as corpus:
+        assert len(corpus) == 2
+        for shoe_id, shoe in enumerate(shoes):
+            assert np.array_equal(corpus.shoe(shoe_id), shoe)
+
+
+def test_failed_write_leaves_no_corpus(tmp_path):
+    path = tmp_path / "partial.pbc"
+    with pytest.raises(RuntimeError):
+        with CorpusWriter(str(path)) as writer:
+            writer.add_shoe(np.array([1, 2, 1], dtype=np.int8))
+            raise RuntimeError("içe aktarma yarıda kaldı")
+
+    assert not path.exists()
\ No newline at end of file
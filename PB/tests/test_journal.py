@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+
+"""Girdi günlüğünden (.pbj) kurtarılan oturumun kaydedilen oturumla aynı olması"""
+
+import pytest
+import numpy as np
+import core.journal as journal
+from core.engine import AnalysisEngine
+from core.journal import (JournalWriter, OP_ADD, OP_CLEAR, OP_PLACE, OP_REANALYZE, OP_SNAPSHOT,
+                          OP_UNDO, read_journal, recover_state)
+from core.persistence import session_bytes
+from core.session import AnalysisSession
+
+
+def record(writer, session, op, value=0, row=0, col=0):
+    """İşlemi arayüzdeki gibi günlüğe yazar (gerekirse önce anlık görüntü) ve uygular"""
+    if writer.snapshot_due():
+        writer.reset(session_bytes(session.state()))
+    writer.append(op, value, row, col)
+    if op == OP_ADD:
+        session.add(value)
+    elif op == OP_PLACE:
+        session.add_at(row, col, value)
+    elif op == OP_UNDO:
+        session.undo()
+    elif op == OP_CLEAR:
+        session.reset()
+    elif op == OP_REANALYZE:
+        session.reanalyze()
+
+
+@pytest.mark.parametrize("mixed", [False, True])
+def test_recovered_state_matches_session(tmp_path, monkeypatch, mixed):
+    # Küçük aralık: anlık görüntülü kurtarma yolu da çalışsın
+    monkeypatch.setattr(journal, "SNAPSHOT_INTERVAL", 32)
+    rng = np.random.default_rng(21)
+    path = str(tmp_path / "session.pbj")
+    session = AnalysisSession()
+    writer = JournalWriter(path, session.engine.shape)
+    writer.reset()
+
+    for step in range(300):
+        choice = rng.random() if mixed else 1.0
+        if choice < 0.1 and session.history:
+            record(writer, session, OP_UNDO)
+        elif choice < 0.2 and 0 in session.matrix_data:
+            row, col = np.argwhere(session.matrix_data == 0)[-1]
+            record(writer, session, OP_PLACE, int(rng.integers(1, 3)), int(row), int(col))
+        elif choice < 0.22:
+            record(writer, session, OP_REANALYZE)
+        elif choice < 0.23 and step < 200:
+            record(writer, session, OP_CLEAR)
+        else:
+            record(writer, session, OP_ADD, int(rng.integers(1, 3)))
+    writer.close()
+
+    shape, ops = read_journal(path)
+    assert shape == session.engine.shape
+    # Karışık işlemlerde anlık görüntüden, yalnızca eklemelerde yığın halinde kurtarılır
+    assert ops[0][0] == (OP_SNAPSHOT if mixed else OP_CLEAR)
+    engine = AnalysisEngine()
+    assert session_bytes(recover_state(ops, engine)) == session_bytes(session.state())
+    assert engine.model_stats == session.model_stats
+
+    # Çökme anında yarım kalan son kayıt yok sayılır
+    with open(path, "ab") as journal_file:
+        journal_file.write(bytes([OP_ADD, 1]))
+    assert session_bytes(recover_state(read_journal(path)[1], AnalysisEngine())) == \
+        session_bytes(session.state())
\ No newline at end of file
@@ -0,0 +1,22 @@
+# -*- coding: utf-8 -*-
+
+"""Numba çekirdek yolunun (Numba yoksa saf Python karşılığının) NumPy yoluyla aynı tahminleri vermesi"""
+
+import pytest
+from core.kernels import verify_kernels, kernels_enabled, use_kernels
+
+
+@pytest.mark.parametrize("shape", [(5, 5), (6, 6), (4, 7), (2, 9), (1, 9)])
+def test_kernel_and_numpy_paths_agree(shape):
+    mismatches = verify_kernels(samples=300, seed=sum(shape), shape=shape)
+    assert len(mismatches) == 5
+    assert mismatches == {name: 0 for name in mismatches}
+
+
+def test_verify_restores_kernel_setting():
+    previous = use_kernels(False)
+    try:
+        verify_kernels(samples=50)
+        assert not kernels_enabled()
+    finally:
+        use_kernels(previous)
\ No newline at end of file
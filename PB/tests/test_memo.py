@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+
+"""Tahmin önbelleği anahtarı (tahta, son hamle, geçmiş uzunluğu)"""
+
+import numpy as np
+import models.base_model as base_model
+from models.scatter import ScatterAnalysis
+
+
+def uncached(model, matrix, history):
+    """Önbelleği atlayarak modelin kendi analyze() sonucunu döndürür"""
+    return type(model).analyze.__wrapped__(model, matrix, history, None)
+
+
+def test_history_length_is_part_of_the_key():
+    rng = np.random.default_rng(3)
+    checked = 0
+    for _ in range(500):
+        matrix = rng.integers(0, 3, (5, 5))
+        history = [(row, col, matrix[row, col]) for row, col in np.argwhere(matrix > 0)]
+        if len(history) < 3:
+            continue
+
+        # Aynı tahta ve son hamle; Serpme geçmiş uzunluğuna göre farklı dala girer
+        model = ScatterAnalysis()
+        for moves in (history[-1:], history):
+            assert model.analyze(matrix, moves) == uncached(model, matrix, moves)
+        checked += 1
+    assert checked > 0
+
+
+def test_memo_hit_does_not_build_features(monkeypatch):
+    matrix = np.random.default_rng(0).integers(0, 3, (5, 5))
+    history = [(row, col, matrix[row, col]) for row, col in np.argwhere(matrix > 0)]
+    model = ScatterAnalysis()
+    first = model.analyze(matrix, history)
+
+    built = []
+    original = base_model.BoardFeatures
+    monkeypatch.setattr(base_model, "BoardFeatures", lambda *args: built.append(args) or original(*args))
+    assert model.analyze(matrix, history) == first
+    assert built == [] and model.memo_hits == 1
\ No newline at end of file
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+
+"""Oturum dosyası (.pbs) ve düz metin içe/dışa aktarma gidiş-dönüşü"""
+
+import pytest
+import numpy as np
+from core.engine import AnalysisEngine
+from core.persistence import (export_text, import_text, load_session, save_session, session_bytes,
+                              state_from_outcomes)
+from core.session import AnalysisSession
+
+
+def play(session, rng, steps):
+    """Oturuma rastgele ekleme, hücreye yerleştirme ve geri alma uygular"""
+    for _ in range(steps):
+        step = rng.random()
+        if step < 0.15:
+            session.undo()
+        elif step < 0.25 and 0 in session.matrix_data:
+            row, col = np.argwhere(session.matrix_data == 0)[-1]
+            session.add_at(int(row), int(col), int(rng.integers(1, 3)))
+        else:
+            session.add(int(rng.integers(1, 3)))
+
+
+def test_saved_session_continues_like_the_original(tmp_path):
+    rng = np.random.default_rng(20)
+    session = AnalysisSession()
+    play(session, rng, 120)
+
+    path = str(tmp_path / "session.pbs")
+    save_session(path, session.state())
+    restored = AnalysisSession()
+    restored.load_state(load_session(path))
+    assert session_bytes(restored.state()) == session_bytes(session.state())
+
+    # Yüklenen oturum, kaydedilen oturumla aynı şekilde devam etmeli
+    for outcome in rng.integers(1, 3, 30).tolist():
+        assert restored.add(outcome) == session.add(outcome)
+    assert session_bytes(restored.state()) == session_bytes(session.state())
+
+
+def test_corrupt_session_file_is_rejected(tmp_path):
+    session = AnalysisSession()
+    play(session, np.random.default_rng(1), 20)
+    path = tmp_path / "session.pbs"
+    save_session(str(path), session.state())
+
+    data = bytearray(path.read_bytes())
+    data[len(data) // 2] ^= 0xFF
+    path.write_bytes(bytes(data))
+    with pytest.raises(ValueError):
+        load_session(str(path))
+
+
+def test_text_import_rebuilds_the_session(tmp_path):
+    outcomes = np.random.default_rng(4).integers(1, 3, 90)
+    session = AnalysisSession()
+    for outcome in outcomes.tolist():
+        session.add(outcome)
+
+    path = str(tmp_path / "session.txt")
+    export_text(path, session.outcomes)
+    assert import_text(path).tolist() == outcomes.tolist()
+
+    state = state_from_outcomes(import_text(path), AnalysisEngine())
+    assert session_bytes(state) == session_bytes(session.state())
\ No newline at end of file
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+
+"""Artımlı Big Road ve türetilmiş yolların baştan hesaplamayla aynı olması"""
+
+import numpy as np
+from core.roads import BLUE, DERIVED_ROADS, RED, RoadTracker
+
+
+def reference_roads(outcomes):
+    """Yolları bitmiş Big Road sütunlarından ızgara kuralıyla baştan hesaplar"""
+    hands = [int(outcome) for outcome in outcomes if outcome in (1, 2)]
+    heights = []
+    positions = []
+    for index, value in enumerate(hands):
+        if index and hands[index - 1] == value:
+            heights[-1] += 1
+        else:
+            heights.append(1)
+        positions.append((len(heights) - 1, heights[-1] - 1))
+
+    roads = {"big_road": hands}
+    for name, offset in DERIVED_ROADS:
+        colors = []
+        for column, row in positions:
+            if row == 0:
+                # Yeni sütun: önceki sütun ile offset kadar soldakinin uzunluğu aynı mı
+                if column - 1 - offset >= 0:
+                    colors.append(RED if heights[column - 1] == heights[column - 1 - offset] else BLUE)
+            elif column - offset >= 0:
+                # Sütun içi: soldaki sütunda bu satır ve bir üstü aynı doluluktaysa kırmızı
+                left = heights[column - offset]
+                colors.append(RED if (left > row) == (left > row - 1) else BLUE)
+        roads[name] = colors
+    return roads
+
+
+def test_incremental_roads_match_reference():
+    # 3 = beraberlik (yollara girmez)
+    outcomes = np.random.default_rng(5).choice([1, 2, 3], 400, p=[0.45, 0.45, 0.1])
+    tracker = RoadTracker()
+    for outcome in outcomes:
+        expected = tracker.next_colors(int(outcome)) if outcome != 3 else None
+        before = {name: len(road) for name, road in tracker.derived.items()}
+        tracker.add(int(outcome))
+
+        # Ask road göstergesi, el eklenince gelen renklerle aynı olmalı
+        if expected is not None:
+            for name, road in tracker.derived.items():
+                added = road.values[before[name]:].tolist()
+                assert added == ([expected[name]] if expected[name] else [])
+
+    reference = reference_roads(outcomes)
+    assert {name: values.tolist() for name, values in tracker.roads().items()} == reference
+    assert tracker.ties == int((outcomes == 3).sum())
+
+    hands = reference["big_road"]
+    grids = tracker.grids()
+    assert grids["bead_plate"].T.ravel()[:len(hands)].tolist() == hands
+    assert int((grids["big_road"] > 0).sum()) == len(hands)
+    rebuilt = RoadTracker.from_outcomes(outcomes).roads()
+    assert {name: values.tolist() for name, values in rebuilt.items()} == reference
\ No newline at end of file
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+
+"""Serpme modelinin artımlı durumu (ScatterState) ile tahtadan yeniden hesaplama"""
+
+import pytest
+import numpy as np
+from core.session import AnalysisSession
+from models.scatter import ScatterAnalysis, ScatterState, clustering_level, scatter_tables
+
+
+def assert_matches_board(state, matrix):
+    """Durumun kümelenme ve merkezleri tahtadan hesaplananlarla aynı olmalı"""
+    tables = scatter_tables(*matrix.shape)
+    model = ScatterAnalysis()
+    for value in (1, 2):
+        mask = matrix == value
+        assert state.clustering(value) == pytest.approx(clustering_level(mask.ravel(), tables))
+        assert state.center(value) == pytest.approx(model._center(mask, mask.sum(), tables))
+
+
+@pytest.mark.parametrize("shape", [(5, 5), (4, 7), (1, 1)])
+def test_add_remove_and_shift_match_full_recompute(shape):
+    rng = np.random.default_rng(sum(shape))
+    matrix = np.zeros(shape, dtype=int)
+    state = ScatterState(shape)
+    moves = []
+
+    for _ in range(400):
+        empty = np.argwhere(matrix == 0)
+        step = rng.random()
+        if moves and step < 0.3:
+            row, col, value = moves.pop(rng.integers(len(moves)))
+            matrix[row, col] = 0
+            state.remove(row, col, value)
+        elif step < 0.4:
+            matrix[:-1] = matrix[1:]
+            matrix[-1] = 0
+            moves = [(row - 1, col, value) for row, col, value in moves if row > 0]
+            state.shift_up()
+        elif len(empty):
+            row, col = empty[rng.integers(len(empty))]
+            value = int(rng.integers(1, 3))
+            matrix[row, col] = value
+            moves.append((row, col, value))
+            state.add(row, col, value)
+        assert_matches_board(state, matrix)
+
+    assert_matches_board(ScatterState.from_matrix(matrix), matrix)
+
+
+def test_session_state_follows_add_place_and_undo():
+    rng = np.random.default_rng(11)
+    session = AnalysisSession()
+    model = session.engine.models["Serpme"]
+
+    for _ in range(300):
+        step = rng.random()
+        if step < 0.2:
+            session.undo()
+        elif step < 0.3 and 0 in session.matrix_data:
+            row, col = np.argwhere(session.matrix_data == 0)[0]
+            session.add_at(row, col, int(rng.integers(1, 3)))
+        else:
+            session.add(int(rng.integers(1, 3)))
+
+        assert_matches_board(session.scatter_state, session.matrix_data)
+        if len(session.history) >= 5:
+            with_state = model.analyze(session.matrix_data, session.history, state=session.scatter_state)
+            assert with_state == model.analyze(session.matrix_data, session.history)
\ No newline at end of file
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+
+"""Farklı tahta boyutlarında tek tahta ve yığın analizinin aynı tahmini vermesi"""
+
+import pytest
+import numpy as np
+from core.backtest import window_boards
+from core.engine import AnalysisEngine, LEAF_MODEL_NAMES, COMBINED_MODEL, HYBRID_MODEL
+from core.features import BatchFeatures
+
+SHAPES = [(5, 5), (6, 6), (4, 7), (2, 9), (1, 9), (9, 1), (2, 2), (1, 1)]
+
+
+def board_history(matrix):
+    """Tahtanın geçmişi (yığın analizindeki gibi satır sırasıyla)"""
+    return [(row, col, matrix[row, col]) for row, col in np.argwhere(matrix > 0)]
+
+
+@pytest.mark.parametrize("shape", SHAPES)
+def test_single_and_batch_analysis_agree(shape):
+    outcomes = np.random.default_rng(sum(shape)).integers(1, 3, 150, dtype=np.int8)
+    engine = AnalysisEngine(shape)
+    boards, last_moves, _ = window_boards(outcomes, shape=shape)
+    features = BatchFeatures(boards, last_moves)
+
+    for name in LEAF_MODEL_NAMES:
+        model = engine.models[name]
+        batch = model.analyze_batch(boards, last_moves, features)
+        for index in range(0, len(boards), 3):
+            matrix = boards[index].astype(int)
+            assert model.analyze(matrix, board_history(matrix)) == batch[index], (name, index)
+
+
+@pytest.mark.parametrize("shape", SHAPES)
+def test_engine_predicts_on_any_shape(shape):
+    outcomes = np.random.default_rng(0).integers(1, 3, 40, dtype=np.int8)
+    engine = AnalysisEngine(shape)
+    engine.models[HYBRID_MODEL].verbose = False
+    boards, _, _ = window_boards(outcomes, shape=shape)
+    matrix = boards[-1].astype(int)
+
+    predictions = engine.analyze(matrix, board_history(matrix))['predictions']
+    assert set(predictions) == set(LEAF_MODEL_NAMES + [COMBINED_MODEL, HYBRID_MODEL])
+    assert all(prediction in (0, 1, 2) for prediction in predictions.values())
\ No newline at end of file
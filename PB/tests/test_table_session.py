@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+
+"""TableSession ile AnalysisSession'ın el el aynı sonuçları vermesi"""
+
+import pytest
+import numpy as np
+from core.engine import AnalysisEngine
+from core.session import AnalysisSession, TableSession
+
+
+@pytest.mark.parametrize("shape", [(5, 5), (4, 7)])
+def test_table_session_matches_analysis_session(shape):
+    outcomes = np.random.default_rng(sum(shape)).integers(1, 3, 120)
+    session = AnalysisSession(AnalysisEngine(shape))
+    table = TableSession(AnalysisEngine(shape))
+
+    for outcome in outcomes.tolist():
+        expected = session.add(outcome)
+        result = table.add(outcome)
+        if expected is None:
+            assert result is None
+        else:
+            assert result['predictions'] == expected['predictions']
+            assert result['hibrit_confidence'] == pytest.approx(expected['hibrit_confidence'])
+
+        assert np.array_equal(table.board, session.matrix_data)
+        assert table.history == [(row, col, value) for row, col, value in session.history]
+
+    assert table.model_stats == session.model_stats
+
+    table.reset()
+    assert not table.board.any() and table.history == [] and table.stats.sum() == 0
\ No newline at end of file
@@ -6,31 +6,24 @@ Baccarat P/B Pattern Analiz Uygulaması - Modern UI
 Ana pencere uygulaması
 """
 
+import os
 import numpy as np
 from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
                             QPushButton, QLabel, QComboBox, QGridLayout, 
                             QStackedWidget, QMessageBox, QGroupBox, QSizePolicy,
-                            QFrame, QTableWidget, QTableWidgetItem, QHeaderView)
+                            QFrame, QTableWidget, QTableWidgetItem, QHeaderView,
+                            QFileDialog)
 from PyQt5.QtCore import Qt, QSize, QPropertyAnimation, QEasingCurve
 from PyQt5.QtGui import QFont, QIcon, QPalette, QColor, QLinearGradient, QPainter, QBrush, QPen, QFontMetrics
 
 from ui.matrix_ui import MatrixUI
 from core.pattern_analyzer import analyze_pattern
-from models.base_model import BaseAnalysisModel
-from models.diagonal import DiagonalAnalysis
-from models.rectangle import RectangleAnalysis
-from models.lshape import LShapeAnalysis
-from models.tshape import TShapeAnalysis
-from models.spiral import SpiralAnalysis
-from models.neighborhood import NeighborhoodAnalysis
-from models.zigzag import ZigzagAnalysis
-from models.scatter import ScatterAnalysis
-from models.quadrant import QuadrantAnalysis
-from models.symmetry import SymmetryAnalysis
-from models.border import BorderAnalysis
-from models.heatmap import HeatmapAnalysis
-from models.combined import CombinedAnalysis
-from models.hibrit import HibritAnalysis
+from core.engine import AnalysisEngine
+from models.scatter import ScatterState
+from core.persistence import (save_session, load_session, is_session_file, session_bytes,
+                              export_text, import_text, state_from_outcomes)
+from core.journal import (JournalWriter, read_journal, recover_state,
+                          OP_ADD, OP_PLACE, OP_UNDO, OP_CLEAR, OP_REANALYZE)
 
 
 class ModernButton(QPushButton):
@@ -362,7 +355,7 @@ class ModernPanel(QFrame):
 class WLPatternAnalyzer(QMainWindow):
     """W ve L Pattern analiz için ana uygulama penceresi"""
     
-    def __init__(self):
+    def __init__(self, journal_path=None):
         super().__init__()
         
         # Ana pencere ayarları
@@ -374,40 +367,40 @@ class WLPatternAnalyzer(QMainWindow):
         self.matrix_data = np.zeros((5, 5), dtype=int)  # 0: Boş, 1: W, 2: L
         self.history = []  # Tüm sonuç geçmişi
         
+        # Serpme modelinin tahtayla birlikte güncellenen artımlı durumu
+        self.scatter_state = ScatterState(self.matrix_data.shape)
+        
+        # Analiz motoru (modeller ve istatistikler arayüzden bağımsız olarak burada tutulur)
+        self.engine = AnalysisEngine()
+        
         # Kullanılabilir analiz modelleri
-        self.analysis_models = {
-            "Çapraz (Diagonal)": DiagonalAnalysis(),
-            "Dikdörtgen": RectangleAnalysis(),
-            "L-Şekli": LShapeAnalysis(),
-            "T-Şekli": TShapeAnalysis(),
-            "Spiral": SpiralAnalysis(),
-            "Komşuluk": NeighborhoodAnalysis(),
-            "Zig-Zag": ZigzagAnalysis(),
-            "Serpme": ScatterAnalysis(),
-            "Kuadran": QuadrantAnalysis(),
-            "Simetri": SymmetryAnalysis(),
-            "Sınır": BorderAnalysis(),
-            "Isı Haritası": HeatmapAnalysis(),
-            "Karma Analiz": CombinedAnalysis(),
-            "Hibrit Analiz": HibritAnalysis()
-        }
+        self.analysis_models = self.engine.models
         
         # Şu anki aktif model
         self.current_model = self.analysis_models["Hibrit Analiz"]
         
         # Model istatistikleri
-        self.model_stats = {model_name: {"success_rate": 50, "correct": 0, "total": 0} 
-                          for model_name in self.analysis_models.keys()}
+        self.model_stats = self.engine.model_stats
         
         # Gerçek sonuçlar (kullanıcı doğrulaması için)
         self.actual_results = []
         
+        # Girilen tüm sonuçlar (kaydetme/dışa aktarma için, kaydırmadan etkilenmez)
+        self.outcomes = []
+        
+        # Girdi günlüğü (çökme sonrası kurtarma için); journal_path verilmezse kapalı
+        self.journal = None
+        
         # Karanlık mod uygula
         self._set_dark_theme()
         
         # Arayüz kurulumu
         self._setup_ui()
         
+        # Önceki oturumu günlükten kurtar ve günlüğe yazmaya başla
+        if journal_path:
+            self._open_journal(journal_path)
+        
     def _set_dark_theme(self):
         """Karanlık mod teması uygular"""
         palette = QPalette()
@@ -592,6 +585,18 @@ class WLPatternAnalyzer(QMainWindow):
         self.clear_button.setEnabled(False)
         action_buttons_layout.addWidget(self.clear_button)
         
+        # Kaydet butonu - sadece ikon
+        self.save_button = ModernButton("", self, "💾", "#3a4c5d", "#2a3340")
+        self.save_button.setToolTip("Kaydet")
+        self.save_button.clicked.connect(self._on_save_clicked)
+        action_buttons_layout.addWidget(self.save_button)
+        
+        # Yükle butonu - sadece ikon
+        self.load_button = ModernButton("", self, "📂", "#3a4c5d", "#2a3340")
+        self.load_button.setToolTip("Yükle")
+        self.load_button.clicked.connect(self._on_load_clicked)
+        action_buttons_layout.addWidget(self.load_button)
+        
         # Geri Al/Temizle butonlarını ana buton düzenine ekle
         buttons_layout.addLayout(action_buttons_layout)  # Ağırlık 1 olarak ayarlandı
         
@@ -723,10 +728,13 @@ class WLPatternAnalyzer(QMainWindow):
         if self.matrix_data[row, col] == 0:
             # Değeri ekle ve hücreyi güncelle
             value = 1 if self.sender() == self.win_button else 2
+            self._journal_append(OP_PLACE, value, row, col)
             self._add_at_position(row, col, value)
 
     def _add_selection(self, value):
         """W (1) veya L (2) değerini ekler"""
+        self._journal_append(OP_ADD, value)
+        
         # Eğer matris doluysa, ilk satırı sil ve diğer verileri yukarı kaydır
         if 0 not in self.matrix_data:
             # İlk satırı silerek matrisi kaydır (sessizce, uyarı olmadan)
@@ -747,6 +755,7 @@ class WLPatternAnalyzer(QMainWindow):
 
         # En alt satırı boşalt
         self.matrix_data[4] = np.zeros(5, dtype=int)
+        self.scatter_state.shift_up()
 
         # Görsel matrisi güncelle
         for row in range(5):
@@ -771,10 +780,12 @@ class WLPatternAnalyzer(QMainWindow):
         
         # Değeri ekle ve hücreyi güncelle
         self.matrix_data[row, col] = value
+        self.scatter_state.add(row, col, value)
         self.matrix_ui.update_cell(row, col, value)
         
         # Geçmişe ekle
         self.history.append((row, col, value))
+        self.outcomes.append(value)
         
         # Matris durumunu güncelle
         self._update_matrix_status()
@@ -801,8 +812,12 @@ class WLPatternAnalyzer(QMainWindow):
     def _on_undo_clicked(self):
         """Son eklenen değeri geri al"""
         if self.history:
-            row, col, _ = self.history.pop()
+            self._journal_append(OP_UNDO)
+            row, col, value = self.history.pop()
+            if self.outcomes:
+                self.outcomes.pop()
             self.matrix_data[row, col] = 0
+            self.scatter_state.remove(row, col, value)
             self.matrix_ui.update_cell(row, col, 0)
             
             # Matris durumunu güncelle
@@ -833,17 +848,19 @@ class WLPatternAnalyzer(QMainWindow):
     
     def _on_clear_clicked(self):
         """Tüm matrisi temizle"""
+        self._journal_append(OP_CLEAR)
         self.matrix_data = np.zeros((5, 5), dtype=int)
+        self.scatter_state = ScatterState(self.matrix_data.shape)
         self.matrix_ui.clear_all()
         self.history = []
         self.actual_results = []  # Gerçek sonuçları da temizle
+        self.outcomes = []
         
         # Matris durumunu güncelle
         self._update_matrix_status()
         
         # Model istatistiklerini sıfırla
-        for model_name in self.model_stats:
-            self.model_stats[model_name] = {"success_rate": 50, "correct": 0, "total": 0}
+        self.engine.reset_stats()
         self.stats_table.update_stats(self.model_stats)
         
         # Butonları devre dışı bırak
@@ -853,6 +870,89 @@ class WLPatternAnalyzer(QMainWindow):
         # Tahmin UI'ını sıfırla
         self._reset_prediction_ui()
     
+    def _on_save_clicked(self):
+        """Oturumu kaydeder (.txt uzantısında düz metin olarak dışa aktarır)"""
+        path, _ = QFileDialog.getSaveFileName(
+            self, "Kaydet", "", "Oturum dosyası (*.pbs);;Metin dosyası (*.txt)")
+        if not path:
+            return
+        
+        try:
+            if path.lower().endswith(".txt"):
+                export_text(path, self.outcomes)
+            else:
+                save_session(path, self._session_state())
+        except OSError as error:
+            QMessageBox.warning(self, "Kaydet", f"Dosya kaydedilemedi: {error}")
+    
+    def _on_load_clicked(self):
+        """Oturum dosyasını ya da düz metin sonuç dosyasını yükler"""
+        path, _ = QFileDialog.getOpenFileName(
+            self, "Yükle", "", "Oturum ve metin dosyaları (*.pbs *.txt);;Tüm dosyalar (*)")
+        if not path:
+            return
+        
+        try:
+            if is_session_file(path):
+                state = load_session(path)
+            else:
+                # Düz metinde yalnızca sonuçlar vardır; istatistikler yığın halinde yeniden hesaplanır
+                state = state_from_outcomes(import_text(path), self.engine)
+        except (OSError, ValueError) as error:
+            QMessageBox.warning(self, "Yükle", f"Dosya yüklenemedi: {error}")
+            return
+        
+        if state['board'].shape != self.matrix_data.shape:
+            QMessageBox.warning(self, "Yükle", "Dosyadaki tahta boyutu desteklenmiyor")
+            return
+        
+        self._apply_session_state(state)
+        
+        # Günlük yüklenen durumla yeniden başlar
+        if self.journal is not None:
+            self.journal.reset(session_bytes(self._session_state()))
+    
+    def _session_state(self):
+        """Arayüzün kaydedilebilir durumu (bkz. core.persistence.session_bytes)"""
+        return {
+            'outcomes': self.outcomes,
+            'actual_results': self.actual_results,
+            'board': self.matrix_data,
+            'history': self.history,
+            'model_stats': self.model_stats
+        }
+    
+    def _apply_session_state(self, state):
+        """Yüklenen durumu arayüze uygular (modeller eller üzerinden yeniden çalıştırılmaz)"""
+        model_stats = {name: dict(stat) for name, stat in state['model_stats'].items()}
+        
+        self.matrix_data = np.asarray(state['board'], dtype=int)
+        self.scatter_state = ScatterState.from_matrix(self.matrix_data)
+        self.history = list(state['history'])
+        self.actual_results = np.asarray(state['actual_results']).tolist()
+        self.outcomes = np.asarray(state['outcomes']).tolist()
+        
+        # self.model_stats motorun sözlüğüdür; yerinde güncellenir
+        self.engine.reset_stats()
+        for model_name, stat in model_stats.items():
+            if model_name in self.model_stats:
+                self.model_stats[model_name] = stat
+        
+        for row in range(self.matrix_data.shape[0]):
+            for col in range(self.matrix_data.shape[1]):
+                self.matrix_ui.update_cell(row, col, self.matrix_data[row, col])
+        self._update_matrix_status()
+        self.stats_table.update_stats(self.model_stats)
+        
+        self.undo_button.setEnabled(bool(self.history))
+        self.clear_button.setEnabled(bool(self.history))
+        
+        # Son tahmini göster (istatistikler zaten kayıtlı olduğundan tekrar sayılmaz)
+        if self.history:
+            self._perform_analysis(record=False)
+        else:
+            self._reset_prediction_ui()
+    
     def _on_model_changed(self, index):
         """Model seçimi değiştiğinde"""
         model_name = self.model_combo.currentText()
@@ -860,117 +960,78 @@ class WLPatternAnalyzer(QMainWindow):
         
         # Otomatik analiz yap (eğer veri varsa)
         if self.history:
+            self._journal_append(OP_REANALYZE)
             self._perform_analysis()
+    
+    def _open_journal(self, path):
+        """
+        Günlükteki oturumu kurtarır ve yeni işlemleri günlüğe yazmaya başlar
+        
+        Günlük motor üzerinden yığın halinde oynatılır (bkz. core.journal.recover_state);
+        kurtarılan durum günlüğün başına anlık görüntü olarak yazılır.
+        """
+        state = None
+        if os.path.exists(path):
+            try:
+                shape, ops = read_journal(path)
+                if ops and shape == self.matrix_data.shape:
+                    state = recover_state(ops, self.engine)
+            except (OSError, ValueError) as error:
+                QMessageBox.warning(self, "Günlük", f"Önceki oturum kurtarılamadı: {error}")
+        
+        try:
+            self.journal = JournalWriter(path, self.matrix_data.shape)
+        except OSError as error:
+            QMessageBox.warning(self, "Günlük", f"Günlük dosyası açılamadı: {error}")
+            return
+        
+        if state is not None:
+            self._apply_session_state(state)
+            self.journal.reset(session_bytes(self._session_state()))
+        else:
+            self.journal.reset()
+    
+    def _journal_append(self, op, value=0, row=0, col=0):
+        """İşlemi girdi günlüğüne ekler (günlük açıksa; yazma arka planda yapılır)"""
+        if self.journal is not None:
+            # İşlemden önceki durum anlık görüntü olarak yazılır; kurtarmada tek tek
+            # oynatılan kayıt sayısı SNAPSHOT_INTERVAL ile sınırlı kalır
+            if self.journal.snapshot_due():
+                self.journal.reset(session_bytes(self._session_state()))
+            self.journal.append(op, value, row, col)
+    
+    def closeEvent(self, event):
+        """Pencere kapanırken günlükteki bekleyen kayıtları diske yazar"""
+        if self.journal is not None:
+            self.journal.close()
+            self.journal = None
+        super().closeEvent(event)
 
-    def _perform_analysis(self):
-        """Seçilen model ile analiz yap"""
+    def _perform_analysis(self, record=True):
+        """Seçilen model ile analiz yap (record=False ise istatistikler güncellenmez)"""
         # Eğer yeterli veri yoksa çalıştırma
         if len(self.history) < 5:
             self._reset_prediction_ui()
             return
 
-        # Tüm modeller için tahmin yap
-        model_predictions = {}
-
-        # Hibrit analiz hariç diğer tüm modellerin tahminlerini al
-        for model_name, model in self.analysis_models.items():
-            if model_name != "Hibrit Analiz":
-                prediction = model.analyze(self.matrix_data, self.history)
-                model_predictions[model_name] = prediction
-
         # Eğer bir önceki tahmin için gerçek sonuç girilmişse, başarıyı ölç
-        if len(self.actual_results) > 0 and len(self.history) > len(self.actual_results):
+        actual = None
+        if record and len(self.actual_results) > 0 and len(self.history) > len(self.actual_results):
             actual = self.actual_results[-1]
 
-            # Önce diğer modellerin başarı oranını güncelle
-            for model_name, prediction in model_predictions.items():
-                # Sadece sonuç varsa ve model tahmin yapabiliyorsa hesapla
-                if prediction != 0 and actual != 0:
-                    self.model_stats[model_name]["total"] += 1
-                    if prediction == actual:
-                        self.model_stats[model_name]["correct"] += 1
-
-                    # Başarı oranını hesapla - en az 3 tahmin yapılmışsa
-                    correct = self.model_stats[model_name]["correct"]
-                    total = self.model_stats[model_name]["total"]
-
-                    if total >= 3:  # Minimum 3 tahmin yapılması gereken bir eşik
-                        self.model_stats[model_name]["success_rate"] = int((correct / total) * 100)
-                    else:
-                        # Çok az veri varsa, henüz oran hesaplanmadı olarak işaretle
-                        self.model_stats[model_name]["success_rate"] = 50  # Varsayılan değer
-
-        # Şimdi güncellenmiş istatistiklerle Hibrit model için tahmin yap
-        hibrit_confidence = 0.5
-        hibrit_model = self.analysis_models["Hibrit Analiz"]
-        hibrit_result = hibrit_model.analyze(self.matrix_data, self.history, self.model_stats)
-
-        # Hibrit model artık tahminin yanında güven seviyesini de döndürsün
-        if isinstance(hibrit_result, dict):
-            prediction = hibrit_result.get('prediction', 0)
-            hibrit_confidence = hibrit_result.get('confidence', 0.6)  # Varsayılan güven 60%
-        else:
-            # Eski tip dönüş için uyumluluk
-            prediction = hibrit_result
-
-            # Hibrit için güven seviyesini hesapla (en iyi 3 modelin ağırlıklı ortalaması)
-            top_models = []
-            for m_name, m_stat in self.model_stats.items():
-                if m_name != "Hibrit Analiz" and m_name != "Karma Analiz" and m_stat["total"] >= 3:
-                    top_models.append({"name": m_name, "success_rate": m_stat["success_rate"]})
-
-            top_models = sorted(top_models, key=lambda x: x["success_rate"], reverse=True)[:3]
-
-            # En iyi 3 modelin ortalama başarı oranı
-            if top_models:
-                avg_success = sum(m["success_rate"] for m in top_models) / len(top_models)
-                hibrit_confidence = avg_success / 100.0  # 0-1 arası değere dönüştür
-            else:
-                hibrit_confidence = 0.6  # Varsayılan güven
-
-        # Hibrit tahminini ekle
-        model_predictions["Hibrit Analiz"] = prediction
+        # Tüm modellerin tahminleri ve istatistik güncellemesi motor tarafından yapılır
+        analysis = self.engine.analyze(self.matrix_data, self.history, actual, self.scatter_state)
+        model_predictions = analysis['predictions']
 
         # Seçili modelin tahmini
         model_name = self.model_combo.currentText()
         result = model_predictions[model_name]
 
-        # Şimdi de Hibrit modelin başarısını güncelle (eğer önceki tahmin için gerçek sonuç girilmişse)
-        if len(self.actual_results) > 0 and len(self.history) > len(self.actual_results):
-            actual = self.actual_results[-1]
-            # Hibrit model tahmini için başarı oranını güncelle
-            if prediction != 0 and actual != 0:
-                self.model_stats["Hibrit Analiz"]["total"] += 1
-                if prediction == actual:
-                    self.model_stats["Hibrit Analiz"]["correct"] += 1
-
-                # Başarı oranını hesapla - en az 3 tahmin yapılmışsa
-                correct = self.model_stats["Hibrit Analiz"]["correct"]
-                total = self.model_stats["Hibrit Analiz"]["total"]
-
-                if total >= 3:  # Minimum 3 tahmin yapılması gereken bir eşik
-                    self.model_stats["Hibrit Analiz"]["success_rate"] = int((correct / total) * 100)
-
         # İstatistik tablosunu güncelle - model tahminlerini de gönder
         self.stats_table.update_stats(self.model_stats, model_predictions)
 
         # Güven seviyesini hesapla
-        if result != 0:
-            if model_name == "Hibrit Analiz":
-                # Hibrit için özel güven seviyesi hesaplaması
-                confidence = hibrit_confidence
-            else:
-                # Diğer modeller için standart hesaplama
-                total_predictions = self.model_stats[model_name]["total"]
-                success_rate = self.model_stats[model_name]["success_rate"]
-
-                # Yeterli veri yoksa veya başarı oranı çok yüksekse dikkatli ol
-                if total_predictions < 5:
-                    confidence = 0.5  # Çok az veri varsa orta güven seviyesi
-                else:
-                    confidence = success_rate / 100.0  # 0-1 arası değer
-        else:
-            confidence = 0.5  # Belirsiz durumlarda orta değer
+        confidence = self.engine.confidence(model_name, result, analysis['hibrit_confidence'])
 
         # Güven çubuğunu güncelle
         bar_width = int(self.confidence_bar.width() * confidence)